@@ -1,7 +1,10 @@
+import logging
 from flask import Flask
 from backend.core.config import Config
 from backend.core.extensions import db, migrate
-from backend.utils.factory import get_search_service
+from backend.utils.factory import get_search_service, get_search_response_cache
+
+logger = logging.getLogger(__name__)
 
 
 def create_app(config_class=Config, search_service_instance: "SearchService" = None):
@@ -15,7 +18,7 @@ def create_app(config_class=Config, search_service_instance: "SearchService" = N
     search_service_instance = search_service_instance or get_search_service()
 
     from backend.views.search_view import create_search_blueprint
-    search_bp = create_search_blueprint(search_service_instance)
+    search_bp = create_search_blueprint(search_service_instance, get_search_response_cache())
     app.register_blueprint(search_bp, url_prefix="/api")
     from backend.views.search_ui_view import create_search_ui_blueprint
     search_ui_bp = create_search_ui_blueprint()
@@ -24,4 +27,23 @@ def create_app(config_class=Config, search_service_instance: "SearchService" = N
     db.init_app(app)
     migrate.init_app(app, db)
 
-    return app
\ No newline at end of file
+    if app.config.get("PRELOAD_INDEX"):
+        preload_search_service(app, search_service_instance)
+
+    return app
+
+
+def preload_search_service(app: Flask, search_service_instance: "SearchService"):
+    """
+    Load the search index at startup instead of on the first request
+    With gunicorn's preload_app this runs once in the master, and workers share the memory-mapped index
+    :param app: Flask app
+    :param search_service_instance: SearchService instance
+    """
+    with app.app_context():
+        try:
+            search_service_instance.preload()
+        except Exception as e:
+            logger.warning(f"Failed to preload search index, loading it on first search instead: {e}")
+        finally:
+            db.engine.dispose() # do not share pooled database connections with forked workers
\ No newline at end of file
@@ -9,5 +9,6 @@ class Config:
     OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
     SQLALCHEMY_DATABASE_URI = os.getenv("DATABASE_URL")
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+    PRELOAD_INDEX = os.getenv("PRELOAD_INDEX", "true").lower() == "true"
     STATIC_FOLDER = "../../frontend/html/static/"
     TEMPLATES_FOLDER = "../../frontend/html/"
\ No newline at end of file
@@ -1,19 +1,31 @@
+import argparse
 import logging
-import os
 from backend.app import app
-from backend.core.populate_config import SCHOOLS_TO_SCRAPE, INDEX_PATH
+from backend.core.populate_config import SCHOOLS_TO_SCRAPE, SCRAPER_CONFIG, HTTP_CLIENT_CONFIG, HTTP_CACHE_CONFIG, NIH_BULK_CONFIG
 from backend.services.scraper.som_scraper import SOMScraper
 from backend.utils.http_client import HttpClient
-from backend.utils.factory import get_embedding_service, get_database_driver
+from backend.utils.response_cache import ResponseCache
+from backend.utils.factory import get_embedding_service, get_database_driver, get_embedding_cache
 from backend.services.scraper.seas_scraper import SEASScraper
 from backend.services.scraper.scraper_service import ScraperService
 from backend.services.nih.nih_reporter_proxy import NIHReporterProxy
 from backend.services.nih.nih_reporter_service import NIHReporterService
 from backend.services.aggregator.data_aggregator import DataAggregator
+from backend.services.search.faculty_document import make_faculty_document
 
 logger = logging.getLogger(__name__)
 
-http_client = HttpClient()
+response_cache = ResponseCache() if HTTP_CACHE_CONFIG["ENABLED"] else None
+http_client = HttpClient(
+    max_concurrency_per_host=SCRAPER_CONFIG["MAX_CONCURRENCY_PER_HOST"],
+    politeness_delay=SCRAPER_CONFIG["POLITENESS_DELAY"],
+    pool_connections=HTTP_CLIENT_CONFIG["POOL_CONNECTIONS"],
+    pool_maxsize=HTTP_CLIENT_CONFIG["POOL_MAXSIZE"],
+    host_pool_maxsizes=HTTP_CLIENT_CONFIG["HOST_POOL_MAXSIZES"],
+    backoff_factor=HTTP_CLIENT_CONFIG["BACKOFF_FACTOR"],
+    max_backoff=HTTP_CLIENT_CONFIG["MAX_BACKOFF"],
+    response_cache=response_cache,
+)
 
 scraper_service = ScraperService([
     SOMScraper(http_client),
@@ -21,28 +33,158 @@ scraper_service = ScraperService([
 ])
 
 nih_service = NIHReporterService(NIHReporterProxy(http_client))
-embedding_service = get_embedding_service(app)
+embedding_cache = get_embedding_cache()
+embedding_service = get_embedding_service(app, embedding_cache=embedding_cache)
 database_driver = get_database_driver(app)
 
 data_aggregator = DataAggregator(scraper_service, nih_service, embedding_service)
 
-if __name__ == '__main__':
-    logger.info("Starting populate_db.")
+def populate_full():
+    """
+    Build a new generation of the database and FAISS index from freshly scraped data next to the live one,
+    then publish it so running servers swap to it
+    """
+    embedding_storage = embedding_service.embedding_storage
+    generation = get_next_generation()
     all_faculty = []
 
-    logger.info("Clearing database.")
-    database_driver.clear()
+    logger.info(f"Building generation {generation} from scratch.")
+    embedding_storage.reset_index()
+    embedding_storage.start_generation(generation)
 
     try:
         for school in SCHOOLS_TO_SCRAPE:
             all_faculty.extend(data_aggregator.aggregate_school_faculty_data(school))
 
+        embedding_storage.build_index()
+        embedding_storage.checkpoint()
+
         for faculty in all_faculty:
-            database_driver.add_faculty(faculty)
+            faculty.generation = generation
+            faculty.document = make_faculty_document(faculty)
+        database_driver.add_faculty_list(all_faculty)
 
     except Exception as e:
-        logger.error(f"Failed to aggregate data: {e}")
-        database_driver.clear()
-        logger.info("Deleting FAISS index.")
-        if os.path.exists(INDEX_PATH):
-            os.remove(INDEX_PATH)
+        logger.error(f"Failed to build generation {generation}: {e}")
+        discard_generation(generation)
+        raise
+
+    publish_generation(generation)
+
+
+def populate_incremental():
+    """
+    Diff freshly scraped data against the live generation by faculty identity and content hash,
+    re-embedding only new or changed faculty, and publish the result as a new generation
+    """
+    embedding_storage = embedding_service.embedding_storage
+    live_generation = get_live_generation()
+    scraped_faculty = {}
+    for school in SCHOOLS_TO_SCRAPE:
+        for faculty in data_aggregator.build_school_faculty(school):
+            faculty.embedding_id = embedding_service.get_embedding_id(faculty)
+            scraped_faculty[faculty.embedding_id] = faculty
+
+    existing_content_hashes = database_driver.get_faculty_content_hashes(generation=live_generation)
+    changed_faculty = [
+        faculty for embedding_id, faculty in scraped_faculty.items()
+        if existing_content_hashes.get(embedding_id) != faculty.content_hash
+    ]
+    removed_embedding_ids = [
+        embedding_id for embedding_id in existing_content_hashes
+        if embedding_id not in scraped_faculty
+    ]
+    logger.info(
+        f"Incremental populate: {len(scraped_faculty)} scraped, {len(changed_faculty)} new or changed, "
+        f"{len(removed_embedding_ids)} removed."
+    )
+
+    generation = get_next_generation()
+    logger.info(f"Building generation {generation} from generation {live_generation}.")
+    embedding_storage.start_generation(generation)
+
+    try:
+        embedding_service.generate_and_store_embeddings(changed_faculty)
+        embedding_storage.remove_embeddings(removed_embedding_ids)
+        embedding_storage.build_index()
+        embedding_storage.checkpoint()
+
+        for faculty in scraped_faculty.values():
+            faculty.generation = generation
+            faculty.document = make_faculty_document(faculty)
+        database_driver.add_faculty_list(list(scraped_faculty.values()))
+
+    except Exception as e:
+        logger.error(f"Failed to build generation {generation}: {e}")
+        discard_generation(generation)
+        raise
+
+    publish_generation(generation)
+
+
+def get_live_generation() -> int:
+    """
+    Get the generation servers are searching
+    :return: published generation, 0 if none was published
+    """
+    manifest = embedding_service.embedding_storage.read_manifest()
+    return manifest["generation"] if manifest else 0
+
+
+def get_next_generation() -> int:
+    """
+    Get an unused generation ID, newer than both the published index and any database records
+    :return: generation ID
+    """
+    return max(get_live_generation(), database_driver.get_max_generation()) + 1
+
+
+def publish_generation(generation: int):
+    """
+    Publish a fully built generation and delete all but it and the previous one,
+    which servers keep searching until they swap
+    :param generation: generation ID
+    """
+    embedding_service.embedding_storage.publish()
+    database_driver.delete_generations_before(generation - 1)
+    embedding_service.embedding_storage.prune_generations(generation - 1)
+    logger.info(f"Published generation {generation}.")
+
+
+def discard_generation(generation: int):
+    """
+    Delete the database records and index files of a generation that failed to build, leaving the live one untouched
+    :param generation: generation ID
+    """
+    logger.info(f"Discarding generation {generation}.")
+    database_driver.delete_generation(generation)
+    embedding_service.embedding_storage.delete_generation_files(generation)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Populate the faculty database and FAISS index.")
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="only re-embed and rewrite faculty that changed since the last run",
+    )
+    args = parser.parse_args()
+
+    logger.info("Starting populate_db.")
+    try:
+        if NIH_BULK_CONFIG["ENABLED"]:
+            logger.info("Loading NIH RePORTER projects by organization.")
+            nih_service.load_organization_projects()
+
+        if args.incremental:
+            populate_incremental()
+        else:
+            populate_full()
+    finally:
+        logger.info(f"Embedding cache stats: {embedding_cache.stats()}")
+        embedding_cache.close()
+        logger.info(f"HTTP connection stats: {http_client.get_connection_stats()}")
+        http_client.close()
+        if response_cache:
+            logger.info(f"HTTP response cache stats: {response_cache.stats()}")
+            response_cache.close()
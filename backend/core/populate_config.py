@@ -5,8 +5,42 @@ BASE_DIR = os.path.abspath(os.path.dirname(__file__))
 
 INDEX_PATH = os.path.join(BASE_DIR, "..", "..", "instance", "index.faiss")
 
+EMBEDDING_CACHE_PATH = os.path.join(BASE_DIR, "..", "..", "instance", "embedding_cache.db")
+
+HTTP_CACHE_PATH = os.path.join(BASE_DIR, "..", "..", "instance", "http_cache.db")
+
+QUERY_CACHE_PATH = os.path.join(BASE_DIR, "..", "..", "instance", "query_cache.db")
+
 SCHOOLS_TO_SCRAPE = ["SOM", "SEAS"]
 
+SCRAPER_CONFIG = {
+    "MAX_DEPARTMENT_WORKERS": 4,
+    "MAX_PROFILE_WORKERS": 8,
+    "MAX_CONCURRENCY_PER_HOST": 8,
+    "POLITENESS_DELAY": 0.1, # minimum seconds between request starts to the same host
+}
+
+HTTP_CLIENT_CONFIG = {
+    "POOL_CONNECTIONS": 10,
+    "POOL_MAXSIZE": 8,
+    "HOST_POOL_MAXSIZES": {
+        "api.reporter.nih.gov": 4,
+    },
+    "BACKOFF_FACTOR": 0.5,
+    "MAX_BACKOFF": 30.0,
+}
+
+HTTP_CACHE_CONFIG = {
+    "ENABLED": True,
+    "MAX_BYTES": 512 * 1024 * 1024,
+    "DEFAULT_TTL": 12 * 60 * 60,
+    "HOST_TTLS": {
+        "engineering.virginia.edu": 12 * 60 * 60,
+        "med.virginia.edu": 12 * 60 * 60,
+        "api.reporter.nih.gov": 6 * 60 * 60,
+    },
+}
+
 SCHOOL_DEPARTMENT_DATA = {
     "SEAS": {
         "base_url": "https://engineering.virginia.edu",
@@ -86,8 +120,72 @@ NIH_REPORTER_PAYLOAD = {
     },
 }
 
+NIH_BULK_CONFIG = {
+    "ENABLED": True,
+    "PAGE_SIZE": 500, # maximum limit accepted by the RePORTER API
+    "MAX_OFFSET": 14999, # maximum offset accepted by the RePORTER API
+}
+
 OPENAI_CONFIG = {
     "EMBEDDING_MODEL": "text-embedding-ada-002",
     "MAX_TOKENS": 8192,
     "EMBEDDING_DIMENSIONS": 1536,
+    "MAX_BATCH_SIZE": 2048,
+    "MAX_BATCH_TOKENS": 300000,
+}
+
+EMBEDDING_CACHE_CONFIG = {
+    "MAX_ENTRIES": 100000,
+}
+
+QUERY_CACHE_CONFIG = {
+    "MAX_ENTRIES": 1024,
+    "TTL": 24 * 60 * 60, # seconds a query embedding is kept in memory
+    "DISK_ENABLED": False, # share query embeddings across workers through QUERY_CACHE_PATH
+    "DISK_MAX_ENTRIES": 10000,
+}
+
+SEARCH_RESPONSE_CACHE_CONFIG = {
+    "ENABLED": True,
+    "MAX_ENTRIES": 2048,
+    "TTL": 24 * 60 * 60, # seconds a response is kept in memory, entries are also dropped when the index generation changes
+    "MAX_AGE": 60, # seconds browsers and proxies may reuse a response before revalidating its ETag
+}
+
+SEARCH_BATCH_CONFIG = {
+    "MAX_QUERIES": 256, # queries accepted per /api/search/batch request
+}
+
+SEARCH_PROJECTION_CONFIG = {
+    "MAX_PROJECTS": 100, # upper bound of the max_projects a request may ask for
+}
+
+RESPONSE_COMPRESSION_CONFIG = {
+    "ENABLED": True,
+    "MIN_SIZE": 1024, # bytes below which responses are sent uncompressed
+    "MIMETYPES": ["application/json"],
+    "GZIP_LEVEL": 6,
+    "BROTLI_QUALITY": 4, # used if the optional brotli package is installed
+}
+
+ASYNC_SEARCH_CONFIG = {
+    "DEADLINE": 10.0, # default seconds an async search may take before it fails with 504
+    "MAX_DEADLINE": 30.0, # upper bound of the deadline a request may ask for
+    "HEDGE_DELAY": 1.5, # seconds without an embedding response before a duplicate request is sent
+    "EXECUTOR_WORKERS": 8, # threads running the FAISS search and database lookup of async searches
+}
+
+FAISS_CONFIG = {
+    "CHECKPOINT_INTERVAL": 0, # vectors added between automatic saves, 0 saves only on checkpoint()
+    "MMAP": True, # memory-map index files instead of reading them into each process
+    "INDEX_TYPE": "Flat", # "Flat" (exact), "IVFFlat", "HNSW", or compressed "SQ8", "PQ", "Binary"
+    "IVF_NLIST": 1024, # inverted lists, capped by the number of training vectors
+    "IVF_NPROBE": 16, # inverted lists visited per query
+    "HNSW_M": 32, # graph neighbours per vector
+    "HNSW_EF_CONSTRUCTION": 200,
+    "HNSW_EF_SEARCH": 64, # candidate list size per query
+    "PQ_M": 96, # sub-quantizers, must divide the embedding dimensions
+    "PQ_NBITS": 8, # bits per sub-quantizer code
+    "RERANK_OVERSAMPLING": 4, # candidates per result fetched from "SQ8", "PQ", and "Binary" indexes before exact re-ranking
+    "RELOAD_CHECK_INTERVAL": 5, # seconds between checks of running servers for a newly published index generation
 }
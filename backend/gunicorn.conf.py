@@ -0,0 +1,13 @@
+import os
+
+bind = os.getenv("GUNICORN_BIND", "0.0.0.0:8000")
+workers = int(os.getenv("GUNICORN_WORKERS", "4"))
+
+# Searches mostly wait on the embeddings API, so each worker serves several of them concurrently from threads
+# sharing one index. "gevent" also works if gevent is installed.
+worker_class = os.getenv("GUNICORN_WORKER_CLASS", "gthread")
+threads = int(os.getenv("GUNICORN_THREADS", "8"))
+
+# Import the app, and with it the memory-mapped FAISS index and metadata index, once in the master.
+# Forked workers share those pages copy-on-write instead of each loading a private copy on first search.
+preload_app = True
@@ -11,7 +11,10 @@ class Faculty(db.Model):
     email = db.Column(db.String, nullable=True)
     profile_url = db.Column(db.String, nullable=True)
     has_funding = db.Column(db.Boolean, nullable=True)
-    embedding_id = db.Column(db.Integer, nullable=False)
+    embedding_id = db.Column(db.BigInteger, nullable=False) # 63-bit stable_id of the faculty
+    content_hash = db.Column(db.String, nullable=True)
+    generation = db.Column(db.Integer, nullable=False, default=0, server_default="0", index=True)
+    document = db.Column(db.Text, nullable=True) # search result JSON of the faculty and its projects
 
     projects = db.relationship("Project", back_populates="faculty", cascade="all, delete")
 
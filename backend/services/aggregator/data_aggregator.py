@@ -5,6 +5,7 @@ from backend.services.embedding.embedding_service import EmbeddingService
 from backend.services.nih.nih_reporter_service import NIHReporterService
 from backend.services.scraper.scraper_service import ScraperService
 from backend.models.models import *
+from backend.utils.hash_utils import content_hash
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +25,19 @@ class DataAggregator:
         :param school: school acronym
         :return: dictionary of department faculty data stored as Faculty model objects
         """
+        faculty_list = self.build_school_faculty(school)
+        embedding_ids = self.embedding_service.generate_and_store_embeddings(faculty_list)
+        for faculty, embedding_id in zip(faculty_list, embedding_ids):
+            faculty.embedding_id = embedding_id
+
+        return faculty_list
+
+    def build_school_faculty(self, school: str) -> typing.List[Faculty]:
+        """
+        Aggregate faculty data for school from scrapers and NIH RePORTER API, without generating embeddings
+        :param school: school acronym
+        :return: Faculty model objects with content hashes set and placeholder embedding IDs
+        """
         school_faculty_df = self.scraper_service.get_school_faculty_data(school)
         school_faculty = dict()
 
@@ -35,11 +49,44 @@ class DataAggregator:
                     school_faculty[faculty_identifier] = self._update_faculty_department(school_faculty[faculty_identifier], faculty_profile.Department)
 
                 else:
-                    faculty = self._build_faculty_model(faculty_profile)
-                    faculty.embedding_id = self.embedding_service.generate_and_store_embedding(faculty)
-                    school_faculty[faculty_identifier] = faculty
+                    school_faculty[faculty_identifier] = self._build_faculty_model(faculty_profile)
 
-        return list(school_faculty.values())
+        faculty_list = list(school_faculty.values())
+        for faculty in faculty_list:
+            faculty.content_hash = self.compute_content_hash(faculty)
+
+        return faculty_list
+
+    @staticmethod
+    def compute_content_hash(faculty: Faculty) -> str:
+        """
+        Hash the profile and project fields of a faculty member, used to detect changes between populate runs
+        :param faculty: Faculty model object
+        :return: content hash
+        """
+        parts = [
+            faculty.name,
+            faculty.school,
+            faculty.department,
+            faculty.about,
+            faculty.email,
+            faculty.profile_url,
+            str(faculty.has_funding),
+        ]
+        for project in sorted(faculty.projects, key=lambda project: str(project.project_number)):
+            parts.extend(
+                str(field) if field is not None else ""
+                for field in (
+                    project.project_number,
+                    project.abstract,
+                    project.relevant_terms,
+                    project.start_date,
+                    project.end_date,
+                    project.agency_ic_admin,
+                    project.activity_code,
+                )
+            )
+        return content_hash(*parts)
 
     def _build_faculty_model(self, faculty_profile: typing.Tuple) -> Faculty:
         """
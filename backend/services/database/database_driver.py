@@ -1,8 +1,10 @@
 import logging
 import typing
-from sqlalchemy import delete
+from sqlalchemy import delete, func
 from contextlib import contextmanager
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import joinedload, load_only
+from flask import current_app, has_app_context
+from werkzeug.local import LocalProxy
 
 from backend.core.extensions import db
 
@@ -16,12 +18,21 @@ class DatabaseDriver:
     def _app_context(self):
         """
         Context manager to handle app context transparently.
+        Reuses the app context of the current request, and with it the request's database session,
+        and only pushes a new one, with its own session, outside of a request or in a background thread.
         """
-        if self.app:
-            with self.app.app_context():
-                yield
-        else:
+        app = self._get_app()
+        if app is None or (has_app_context() and current_app._get_current_object() is app):
             yield
+        else:
+            with app.app_context():
+                yield
+
+    def _get_app(self) -> typing.Optional["Flask"]:
+        """Helper function to bind a current_app proxy to the app it points to, on first use inside a context."""
+        if isinstance(self.app, LocalProxy) and has_app_context():
+            self.app = self.app._get_current_object()
+        return self.app
 
     def add_faculty(self, faculty: "Faculty"):
         """
@@ -50,7 +61,7 @@ class DatabaseDriver:
         :return: Faculty object or None if not found.
         """
         try:
-            with self.app.app_context():
+            with self._app_context():
                 return self._get_faculty_by_embedding_id(embedding_id)
         except Exception as e:
             logger.error(f"Failed to retrieve faculty record by embedding_id {embedding_id}: {e}")
@@ -67,6 +78,90 @@ class DatabaseDriver:
             logger.warning(f"No faculty record found with embedding_id {embedding_id}.")
         return faculty
 
+    def get_faculty_by_embedding_ids(self,
+                                     embedding_ids: typing.List[int],
+                                     generation: int = None,
+                                     columns: typing.List[str] = None,
+                                     project_columns: typing.List[str] = None) -> typing.List["Faculty"]:
+        """
+        Retrieve Faculty objects and their Projects for several embedding IDs with a single query.
+        :param embedding_ids: embedding IDs in ranked order.
+        :param generation: only records of this generation, any generation if None.
+        :param columns: only load these Faculty columns, all columns if None.
+        :param project_columns: only load these Project columns, all columns if None; projects are not loaded if empty.
+        :return: Faculty objects in the order of embedding_ids, skipping IDs without a record.
+        """
+        try:
+            with self._app_context():
+                return self._get_faculty_by_embedding_ids(embedding_ids, generation, columns, project_columns)
+        except Exception as e:
+            logger.error(f"Failed to retrieve faculty records by embedding IDs: {e}")
+            raise
+
+    @staticmethod
+    def _get_faculty_by_embedding_ids(embedding_ids: typing.List[int],
+                                      generation: int = None,
+                                      columns: typing.List[str] = None,
+                                      project_columns: typing.List[str] = None) -> typing.List["Faculty"]:
+        """Helper function to query faculty by embedding IDs, preserving their order."""
+        from backend.models.models import Faculty, Project
+        if not embedding_ids:
+            return []
+        query = Faculty.query.filter(Faculty.embedding_id.in_(embedding_ids))
+        if columns is not None:
+            query = query.options(load_only(*[getattr(Faculty, column) for column in columns], Faculty.embedding_id))
+        if project_columns is None:
+            query = query.options(joinedload(Faculty.projects))
+        elif project_columns:
+            query = query.options(
+                joinedload(Faculty.projects).load_only(*[getattr(Project, column) for column in project_columns])
+            )
+        if generation is not None:
+            query = query.filter(Faculty.generation == generation)
+        records = query.all()
+        faculty_by_embedding_id = {faculty.embedding_id: faculty for faculty in records}
+        missing_count = len(set(embedding_ids) - faculty_by_embedding_id.keys())
+        if missing_count:
+            logger.warning(f"No faculty record found for {missing_count} of {len(embedding_ids)} embedding IDs.")
+        return [
+            faculty_by_embedding_id[embedding_id] for embedding_id in embedding_ids
+            if embedding_id in faculty_by_embedding_id
+        ]
+
+    def get_faculty_documents(self,
+                              embedding_ids: typing.List[int],
+                              generation: int = None) -> typing.List[typing.Tuple[int, str | None]]:
+        """
+        Retrieve the precomputed search result documents of several embedding IDs with a single query,
+        without loading Faculty or Project objects.
+        :param embedding_ids: embedding IDs in ranked order.
+        :param generation: only records of this generation, any generation if None.
+        :return: embedding ID and document pairs in the order of embedding_ids, skipping IDs without a record;
+                 the document is None for records populated before documents were stored.
+        """
+        try:
+            with self._app_context():
+                return self._get_faculty_documents(embedding_ids, generation)
+        except Exception as e:
+            logger.error(f"Failed to retrieve faculty documents by embedding IDs: {e}")
+            raise
+
+    @staticmethod
+    def _get_faculty_documents(embedding_ids: typing.List[int],
+                               generation: int = None) -> typing.List[typing.Tuple[int, str | None]]:
+        """Helper function to query faculty documents by embedding IDs, preserving their order."""
+        from backend.models.models import Faculty
+        if not embedding_ids:
+            return []
+        query = db.session.query(Faculty.embedding_id, Faculty.document).filter(Faculty.embedding_id.in_(embedding_ids))
+        if generation is not None:
+            query = query.filter(Faculty.generation == generation)
+        document_by_embedding_id = {record.embedding_id: record.document for record in query.all()}
+        return [
+            (embedding_id, document_by_embedding_id[embedding_id]) for embedding_id in embedding_ids
+            if embedding_id in document_by_embedding_id
+        ]
+
     def get_embedding_ids_by_search_parameters(self, **parameters) -> typing.List[int]:
         """
         Get Faculty embedding IDs that satisfy search parameters.
@@ -77,7 +172,7 @@ class DatabaseDriver:
         :return: List of Faculty embedding IDs
         """
         try:
-            with self.app.app_context():
+            with self._app_context():
                 return self._get_embedding_ids_by_search_parameters(**parameters)
         except Exception as e:
             logger.error(f"Failed to retrieve faculty record by filters: {e}")
@@ -106,12 +201,129 @@ class DatabaseDriver:
 
         return [record.embedding_id for record in query.distinct().all()]
 
+    def get_search_metadata(self, generation: int = None) -> typing.List[typing.Any]:
+        """
+        Get the searchable metadata of every Faculty record and its Projects with a single query.
+        :param generation: only records of this generation, any generation if None.
+        :return: rows with embedding_id, school, department, has_funding, activity_code, and agency_ic_admin,
+                 one per project, or one with empty project fields for faculty without projects
+        """
+        try:
+            with self._app_context():
+                return self._get_search_metadata(generation)
+        except Exception as e:
+            logger.error(f"Failed to retrieve search metadata: {e}")
+            raise
+
+    @staticmethod
+    def _get_search_metadata(generation: int = None) -> typing.List[typing.Any]:
+        """Helper function to query faculty and project search metadata."""
+        from backend.models.models import Faculty, Project
+        query = db.session.query(
+            Faculty.embedding_id,
+            Faculty.school,
+            Faculty.department,
+            Faculty.has_funding,
+            Project.activity_code,
+            Project.agency_ic_admin,
+        ).outerjoin(Project)
+        if generation is not None:
+            query = query.filter(Faculty.generation == generation)
+        return query.all()
+
+    def get_faculty_content_hashes(self, generation: int = None) -> typing.Dict[int, str]:
+        """
+        Get the content hash of every Faculty record.
+        :param generation: only records of this generation, any generation if None.
+        :return: dictionary mapping embedding ID to content hash
+        """
+        try:
+            with self._app_context():
+                return self._get_faculty_content_hashes(generation)
+        except Exception as e:
+            logger.error(f"Failed to retrieve faculty content hashes: {e}")
+            raise
+
+    @staticmethod
+    def _get_faculty_content_hashes(generation: int = None) -> typing.Dict[int, str]:
+        """Helper function to query faculty content hashes."""
+        from backend.models.models import Faculty
+        query = db.session.query(Faculty.embedding_id, Faculty.content_hash)
+        if generation is not None:
+            query = query.filter(Faculty.generation == generation)
+        return {record.embedding_id: record.content_hash for record in query.all()}
+
+    def add_faculty_list(self, faculty_list: typing.List["Faculty"]):
+        """
+        Persist Faculty objects and their Projects in a single transaction.
+        :param faculty_list: Faculty objects.
+        """
+        try:
+            with self._app_context():
+                db.session.add_all(faculty_list)
+                db.session.commit()
+                logger.info(f"Created {len(faculty_list)} faculty records.")
+        except Exception as e:
+            logger.error(f"Failed to create {len(faculty_list)} faculty records: {e}")
+            raise
+
+    def get_max_generation(self) -> int:
+        """
+        Get the newest generation of Faculty records.
+        :return: generation ID, 0 if there are no records
+        """
+        try:
+            with self._app_context():
+                from backend.models.models import Faculty
+                return db.session.query(func.max(Faculty.generation)).scalar() or 0
+        except Exception as e:
+            logger.error(f"Failed to retrieve faculty generation: {e}")
+            raise
+
+    def delete_generation(self, generation: int):
+        """
+        Delete the Faculty records and Projects of a generation.
+        :param generation: generation ID.
+        """
+        try:
+            with self._app_context():
+                from backend.models.models import Faculty
+                self._delete_faculty_where(Faculty.generation == generation)
+                db.session.commit()
+                logger.info(f"Deleted faculty records of generation {generation}.")
+        except Exception as e:
+            logger.error(f"Failed to delete faculty records of generation {generation}: {e}")
+            raise
+
+    def delete_generations_before(self, generation: int):
+        """
+        Delete the Faculty records and Projects of generations older than generation.
+        :param generation: oldest generation to keep.
+        """
+        try:
+            with self._app_context():
+                from backend.models.models import Faculty
+                self._delete_faculty_where(Faculty.generation < generation)
+                db.session.commit()
+                logger.info(f"Deleted faculty records of generations before {generation}.")
+        except Exception as e:
+            logger.error(f"Failed to delete faculty records of generations before {generation}: {e}")
+            raise
+
+    @staticmethod
+    def _delete_faculty_where(condition):
+        """Helper function to delete faculty matching a condition and their projects, without committing."""
+        from backend.models.models import Faculty, Project
+        faculty_ids = db.session.query(Faculty.faculty_id).filter(condition)
+        db.session.execute(delete(Project).where(Project.faculty_id.in_(faculty_ids.scalar_subquery())))
+        db.session.execute(delete(Faculty).where(condition))
+
     def clear(self):
         """
         Clear database tables.
         """
         try:
-            with self.app.app_context():
+            with self._app_context():
                 self._clear_db()
         except Exception as e:
             logger.error(f"Failed to clear faculty records: {e}")
@@ -120,7 +332,8 @@ class DatabaseDriver:
     @staticmethod
     def _clear_db():
         """Helper function to clear faculty records."""
-        from backend.models.models import Faculty
+        from backend.models.models import Faculty, Project
+        db.session.execute(delete(Project))
         db.session.execute(delete(Faculty))
         db.session.commit()
         logger.info("All faculty records deleted.")
@@ -0,0 +1,145 @@
+import logging
+import os
+import sqlite3
+import threading
+import time
+import typing
+import numpy as np
+from backend.core.populate_config import EMBEDDING_CACHE_CONFIG, EMBEDDING_CACHE_PATH
+from backend.utils.hash_utils import content_hash
+
+logger = logging.getLogger(__name__)
+
+class EmbeddingCache:
+    """
+    Disk-backed embedding cache keyed on a hash of the model name and the embedded text.
+    Least recently used entries are evicted once the cache grows past max_entries.
+    """
+    QUERY_BATCH_SIZE = 500
+
+    def __init__(self, path: str = EMBEDDING_CACHE_PATH, max_entries: int = EMBEDDING_CACHE_CONFIG["MAX_ENTRIES"]):
+        self.path = path
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings ("
+            "key TEXT PRIMARY KEY, "
+            "embedding BLOB NOT NULL, "
+            "last_accessed REAL NOT NULL)"
+        )
+        self._connection.execute("CREATE INDEX IF NOT EXISTS embeddings_last_accessed ON embeddings (last_accessed)")
+        self._connection.commit()
+        logger.info(f"Initialized EmbeddingCache at {path} with max_entries={max_entries}")
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """Helper function to reopen the connection in a forked worker, which must not share its parent's."""
+        if self._pid != os.getpid():
+            self._pid = os.getpid()
+            self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        return self._connection
+
+    @staticmethod
+    def make_key(model: str, text: str) -> str:
+        """
+        Build the cache key for an embedding
+        :param model: embedding model name
+        :param text: embedded text
+        :return: cache key
+        """
+        return content_hash(model, text)
+
+    def get_many(self, model: str, texts: typing.List[str]) -> typing.List[typing.Optional[typing.List[float]]]:
+        """
+        Look up cached embeddings
+        :param model: embedding model name
+        :param texts: embedded texts
+        :return: embedding or None for every text, in the same order as texts
+        """
+        keys = [self.make_key(model, text) for text in texts]
+        found = {}
+        with self._lock:
+            connection = self._get_connection()
+            for start in range(0, len(keys), self.QUERY_BATCH_SIZE):
+                batch = keys[start:start + self.QUERY_BATCH_SIZE]
+                placeholders = ",".join("?" * len(batch))
+                rows = connection.execute(
+                    f"SELECT key, embedding FROM embeddings WHERE key IN ({placeholders})", batch
+                ).fetchall()
+                found.update(rows)
+
+            if found:
+                now = time.time()
+                connection.executemany(
+                    "UPDATE embeddings SET last_accessed = ? WHERE key = ?",
+                    [(now, key) for key in found]
+                )
+                connection.commit()
+
+            results = [
+                np.frombuffer(found[key], dtype=np.float32).tolist() if key in found else None
+                for key in keys
+            ]
+            hits = sum(result is not None for result in results)
+            self.hits += hits
+            self.misses += len(results) - hits
+        return results
+
+    def put_many(self, model: str, texts: typing.List[str], embeddings: typing.List[typing.List[float]]):
+        """
+        Store embeddings and evict the least recently used entries beyond max_entries
+        :param model: embedding model name
+        :param texts: embedded texts
+        :param embeddings: embedding of each text
+        """
+        now = time.time()
+        rows = [
+            (self.make_key(model, text), np.asarray(embedding, dtype=np.float32).tobytes(), now)
+            for text, embedding in zip(texts, embeddings)
+        ]
+        with self._lock:
+            connection = self._get_connection()
+            connection.executemany(
+                "INSERT OR REPLACE INTO embeddings (key, embedding, last_accessed) VALUES (?, ?, ?)", rows
+            )
+            self._evict()
+            connection.commit()
+
+    def _evict(self):
+        """Helper function to drop least recently used entries beyond max_entries."""
+        connection = self._get_connection()
+        (entries,) = connection.execute("SELECT COUNT(*) FROM embeddings").fetchone()
+        overflow = entries - self.max_entries
+        if overflow > 0:
+            logger.info(f"Evicting {overflow} entries from embedding cache.")
+            connection.execute(
+                "DELETE FROM embeddings WHERE key IN "
+                "(SELECT key FROM embeddings ORDER BY last_accessed ASC LIMIT ?)",
+                (overflow,)
+            )
+
+    def stats(self) -> typing.Dict[str, typing.Any]:
+        """
+        Report cache counters
+        :return: hits, misses, hit rate, and number of stored entries
+        """
+        with self._lock:
+            connection = self._get_connection()
+            (entries,) = connection.execute("SELECT COUNT(*) FROM embeddings").fetchone()
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "entries": entries,
+            }
+
+    def close(self):
+        """
+        Close the underlying database connection
+        """
+        with self._lock:
+            self._connection.close()
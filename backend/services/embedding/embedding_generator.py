@@ -1,14 +1,19 @@
 import logging
 import typing
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
 from backend.core.populate_config import OPENAI_CONFIG
+from backend.services.embedding.embedding_cache import EmbeddingCache
+from backend.utils.async_runner import AsyncRunner
 from backend.utils.token_utils import count_tokens, chunk_text
 
 logger = logging.getLogger(__name__)
 
 class EmbeddingGenerator:
-    def __init__(self, openai_client: OpenAI):
+    def __init__(self, openai_client: OpenAI, embedding_cache: EmbeddingCache = None, async_client: AsyncOpenAI = None):
         self.client = openai_client
+        self.embedding_cache = embedding_cache
+        self.async_client = async_client
+        self.async_runner = AsyncRunner("embedding-requests") # event loop the async client's connections belong to
         logger.info("Initialized EmbeddingGenerator with OpenAI client")
 
     def generate_embedding(self, text: str) -> typing.List[float]:
@@ -25,6 +30,78 @@ class EmbeddingGenerator:
             else self._generate_chunked_embedding(text)
         )
 
+    async def generate_embedding_async(self, text: str) -> typing.List[float]:
+        """
+        Generates an embedding like generate_embedding without blocking the calling event loop.
+        The request runs on the generator's event loop thread, so every request shares one async client,
+        and cancelling the await cancels the request.
+        :param text: input text
+        :return: embedding
+        """
+        if self.async_client is None:
+            raise RuntimeError("EmbeddingGenerator was created without an async client")
+        return await self.async_runner.run(self._call_embedding_api_async(text))
+
+    def generate_embeddings(self, texts: typing.List[str]) -> typing.List[typing.List[float]]:
+        """
+        Generates embeddings for many texts, packing them into as few API calls as the batch limits allow.
+        Texts exceeding the token limit are chunked and mean pooled like in generate_embedding.
+        Texts found in the embedding cache, if one is configured, are not sent to the API.
+        :param texts: input texts
+        :return: embeddings, in the same order as texts
+        """
+        if self.embedding_cache is None:
+            return self._generate_uncached_embeddings(texts)
+
+        model = OPENAI_CONFIG["EMBEDDING_MODEL"]
+        embeddings = self.embedding_cache.get_many(model, texts)
+        missing_positions = [position for position, embedding in enumerate(embeddings) if embedding is None]
+        logger.info(f"Embedding cache hits: {len(texts) - len(missing_positions)}, misses: {len(missing_positions)}.")
+
+        if missing_positions:
+            missing_texts = [texts[position] for position in missing_positions]
+            generated_embeddings = self._generate_uncached_embeddings(missing_texts)
+            self.embedding_cache.put_many(model, missing_texts, generated_embeddings)
+            for position, embedding in zip(missing_positions, generated_embeddings):
+                embeddings[position] = embedding
+
+        return embeddings
+
+    def _generate_uncached_embeddings(self, texts: typing.List[str]) -> typing.List[typing.List[float]]:
+        """
+        Generates embeddings for many texts through the embeddings API
+        :param texts: input texts
+        :return: embeddings, in the same order as texts
+        """
+        owners = []
+        pieces = []
+        piece_token_counts = []
+        for position, text in enumerate(texts):
+            token_count = count_tokens(text)
+            if token_count <= OPENAI_CONFIG["MAX_TOKENS"]:
+                owners.append(position)
+                pieces.append(text)
+                piece_token_counts.append(token_count)
+                continue
+
+            chunks = chunk_text(text)
+            logger.info(f"Text {position} chunked into {len(chunks)} parts.")
+            for chunk in chunks:
+                owners.append(position)
+                pieces.append(chunk)
+                piece_token_counts.append(count_tokens(chunk))
+
+        piece_embeddings = self._embed_in_batches(pieces, piece_token_counts)
+
+        grouped_embeddings = [[] for _ in texts]
+        for position, embedding in zip(owners, piece_embeddings):
+            grouped_embeddings[position].append(embedding)
+
+        return [
+            embeddings[0] if len(embeddings) == 1 else self._aggregate_embeddings(embeddings)
+            for embeddings in grouped_embeddings
+        ]
+
     def _generate_chunked_embedding(self, text: str) -> typing.List[float]:
         """
         Generates and aggregates embeddings for chunked text.
@@ -33,9 +110,48 @@ class EmbeddingGenerator:
         """
         chunks = chunk_text(text)
         logger.info(f"Text chunked into {len(chunks)} parts.")
-        embeddings = [self._call_embedding_api(chunk) for chunk in chunks]
+        embeddings = self._embed_in_batches(chunks, [count_tokens(chunk) for chunk in chunks])
         return self._aggregate_embeddings(embeddings)
 
+    def _embed_in_batches(self,
+                          texts: typing.List[str],
+                          token_counts: typing.List[int]) -> typing.List[typing.List[float]]:
+        """
+        Embed texts with one API call per batch
+        :param texts: input texts, each within the per-input token limit
+        :param token_counts: token count of each text
+        :return: embeddings, in the same order as texts
+        """
+        embeddings = []
+        for batch in self._make_batches(texts, token_counts):
+            embeddings.extend(self._call_embedding_batch_api(batch))
+        return embeddings
+
+    @staticmethod
+    def _make_batches(texts: typing.List[str], token_counts: typing.List[int]) -> typing.List[typing.List[str]]:
+        """
+        Group consecutive texts into batches that respect the per-request input and token limits
+        :param texts: input texts
+        :param token_counts: token count of each text
+        :return: list of batches
+        """
+        batches = []
+        current_batch = []
+        current_tokens = 0
+        for text, token_count in zip(texts, token_counts):
+            if current_batch and (
+                len(current_batch) >= OPENAI_CONFIG["MAX_BATCH_SIZE"]
+                or current_tokens + token_count > OPENAI_CONFIG["MAX_BATCH_TOKENS"]
+            ):
+                batches.append(current_batch)
+                current_batch = []
+                current_tokens = 0
+            current_batch.append(text)
+            current_tokens += token_count
+        if current_batch:
+            batches.append(current_batch)
+        return batches
+
     @staticmethod
     def _aggregate_embeddings(embeddings: typing.List[typing.List[float]]) -> typing.List[float]:
         """
@@ -59,4 +175,29 @@ class EmbeddingGenerator:
             return response.data[0].embedding
         except Exception as e:
             logging.error(f"Error generating single embedding: {e}")
-            raise
\ No newline at end of file
+            raise
+
+    async def _call_embedding_api_async(self, text: str) -> typing.List[float]:
+        pieces = [text] if count_tokens(text) <= OPENAI_CONFIG["MAX_TOKENS"] else chunk_text(text)
+        try:
+            response = await self.async_client.embeddings.create(
+                input=pieces,
+                model=OPENAI_CONFIG["EMBEDDING_MODEL"],
+            )
+        except Exception as e:
+            logging.error(f"Error generating async embedding: {e}")
+            raise
+        embeddings = [data.embedding for data in sorted(response.data, key=lambda data: data.index)]
+        return embeddings[0] if len(embeddings) == 1 else self._aggregate_embeddings(embeddings)
+
+    def _call_embedding_batch_api(self, texts: typing.List[str]) -> typing.List[typing.List[float]]:
+        try:
+            logger.info(f"Requesting embeddings for a batch of {len(texts)} inputs.")
+            response = self.client.embeddings.create(
+                input=texts,
+                model=OPENAI_CONFIG["EMBEDDING_MODEL"],
+            )
+            return [data.embedding for data in sorted(response.data, key=lambda data: data.index)]
+        except Exception as e:
+            logging.error(f"Error generating batch embeddings: {e}")
+            raise
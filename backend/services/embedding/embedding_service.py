@@ -1,15 +1,24 @@
+import asyncio
+import sqlite3
 import typing
 import logging
+import numpy as np
+from backend.core.populate_config import OPENAI_CONFIG
 from backend.services.embedding.preprocessor import Preprocessor
+from backend.services.embedding.embedding_cache import EmbeddingCache
 from backend.services.embedding.embedding_generator import EmbeddingGenerator
 from backend.services.embedding.embedding_storage import EmbeddingStorage
+from backend.utils.hash_utils import stable_id
+from backend.utils.lru_cache import LRUCache
 
 logger = logging.getLogger(__name__)
 
 class EmbeddingService:
     def __init__(self,
                  embedding_generator: EmbeddingGenerator = None,
-                 embedding_storage: EmbeddingStorage = None):
+                 embedding_storage: EmbeddingStorage = None,
+                 query_cache: LRUCache = None,
+                 query_disk_cache: EmbeddingCache = None):
 
         if not embedding_generator:
             raise TypeError('embedding_generator must be defined')
@@ -18,22 +27,51 @@ class EmbeddingService:
 
         self.embedding_generator = embedding_generator
         self.embedding_storage = embedding_storage
+        self.query_cache = query_cache
+        self.query_disk_cache = query_disk_cache
 
     def generate_and_store_embedding(self, faculty: "Faculty") -> int:
         """
         Preprocess, generate, and store the embedding for a faculty member
         :param faculty: Faculty model object containing faculty data
-        :return: Index of the generated embedding in FAISS
+        :return: ID of the generated embedding in FAISS
         """
         logging.info(f"Starting embedding generation for faculty: {faculty.name}")
         try:
             text = Preprocessor.preprocess_faculty_profile(faculty)
-            embedding = self.embedding_generator.generate_embedding(text)
-            return self.embedding_storage.add_embedding(faculty.name, embedding)
+            embedding = self.embedding_generator.generate_embeddings([text])[0]
+            return self.embedding_storage.upsert_embedding(self.get_embedding_id(faculty), embedding)
         except Exception as e:
             logging.error(f"Failed to generate and store embedding for faculty {faculty.name}: {e}")
             raise
 
+    def generate_and_store_embeddings(self, faculty_list: typing.List["Faculty"]) -> typing.List[int]:
+        """
+        Preprocess, generate in batches, and store the embeddings for many faculty members
+        :param faculty_list: Faculty model objects containing faculty data
+        :return: IDs of the generated embeddings in FAISS, in the same order as faculty_list
+        """
+        logging.info(f"Starting batch embedding generation for {len(faculty_list)} faculty.")
+        try:
+            texts = [Preprocessor.preprocess_faculty_profile(faculty) for faculty in faculty_list]
+            embeddings = self.embedding_generator.generate_embeddings(texts)
+            if not embeddings:
+                return []
+            embedding_ids = [self.get_embedding_id(faculty) for faculty in faculty_list]
+            return self.embedding_storage.upsert_embeddings(embedding_ids, np.array(embeddings, dtype=np.float32))
+        except Exception as e:
+            logging.error(f"Failed to generate and store embeddings for {len(faculty_list)} faculty: {e}")
+            raise
+
+    @staticmethod
+    def get_embedding_id(faculty: "Faculty") -> int:
+        """
+        Derive the stable embedding ID of a faculty member from its identity
+        :param faculty: Faculty model object
+        :return: embedding ID, unchanged across populate runs
+        """
+        return stable_id(faculty.name, faculty.school, faculty.email)
+
     def search_similar_embeddings(self,
                                   query: str = None,
                                   top_k: int = None,
@@ -41,7 +79,8 @@ class EmbeddingService:
                                   department: str = None,
                                   activity_code: str = None,
                                   agency_ic_admin: str = None,
-                                  has_funding: bool = None) -> typing.List[int]:
+                                  has_funding: bool = None,
+                                  snapshot: "IndexSnapshot" = None) -> typing.List[int]:
         """
         Search for the most similar faculty based on a natural language query.
         :param query: user input query
@@ -51,6 +90,7 @@ class EmbeddingService:
         :param activity_code: activity code
         :param agency_ic_admin: agency ic admin name
         :param has_funding: faculty has funding
+        :param snapshot: index generation to search, the current one if not given
         :return: List of faculty EIDs
         """
         if not query:
@@ -60,7 +100,7 @@ class EmbeddingService:
         logging.info(f"Performing similarity search for query: '{query}'")
 
         standardized_query = Preprocessor.preprocess_query(query)
-        query_embedding = self.embedding_generator.generate_embedding(standardized_query)
+        query_embedding = self.get_query_embedding(standardized_query)
 
         results = self.embedding_storage.search_similar_embeddings(
             query_embedding=query_embedding,
@@ -69,8 +109,199 @@ class EmbeddingService:
             department=department,
             activity_code=activity_code,
             agency_ic_admin=agency_ic_admin,
-            has_funding=has_funding
+            has_funding=has_funding,
+            snapshot=snapshot
         )
 
         logging.info(f"Search completed. {len(results)} results found.")
-        return results
\ No newline at end of file
+        return results
+
+    def search_similar_embeddings_batch(self,
+                                        queries: typing.List[str] = None,
+                                        top_k: int = None,
+                                        school: str = None,
+                                        department: str = None,
+                                        activity_code: str = None,
+                                        agency_ic_admin: str = None,
+                                        has_funding: bool = None,
+                                        snapshot: "IndexSnapshot" = None) -> typing.List[typing.List[int]]:
+        """
+        Search for the most similar faculty of many natural language queries,
+        embedding them with as few API calls as possible and searching them with a single index search
+        :param queries: user input queries
+        :param top_k: Number of results to return per query
+        :param school: school name
+        :param department: department name
+        :param activity_code: activity code
+        :param agency_ic_admin: agency ic admin name
+        :param has_funding: faculty has funding
+        :param snapshot: index generation to search, the current one if not given
+        :return: List of faculty EIDs per query, in the same order as queries
+        """
+        if not queries or not all(queries):
+            logger.error("Invalid query input for batch similarity search")
+            raise ValueError("Queries must be non-empty strings")
+
+        logging.info(f"Performing batch similarity search for {len(queries)} queries.")
+
+        standardized_queries = [Preprocessor.preprocess_query(query) for query in queries]
+        query_embeddings = self.get_query_embeddings(standardized_queries)
+
+        results = self.embedding_storage.search_similar_embeddings_batch(
+            query_embeddings=np.array(query_embeddings, dtype=np.float32),
+            top_k=top_k,
+            school=school,
+            department=department,
+            activity_code=activity_code,
+            agency_ic_admin=agency_ic_admin,
+            has_funding=has_funding,
+            snapshot=snapshot
+        )
+
+        logging.info(f"Batch search completed for {len(results)} queries.")
+        return results
+
+    def get_query_embeddings(self, standardized_queries: typing.List[str]) -> typing.List[typing.List[float]]:
+        """
+        Embed many preprocessed queries like get_query_embedding, sending every query missing from the
+        query caches to the embeddings API together
+        :param standardized_queries: outputs of Preprocessor.preprocess_query
+        :return: query embeddings, in the same order as standardized_queries
+        """
+        model = OPENAI_CONFIG["EMBEDDING_MODEL"]
+        unique_queries = list(dict.fromkeys(standardized_queries))
+        query_embeddings = {}
+        if self.query_cache is not None:
+            for standardized_query in unique_queries:
+                query_embedding = self.query_cache.get((model, standardized_query))
+                if query_embedding is not None:
+                    query_embeddings[standardized_query] = query_embedding
+
+        missing_queries = [query for query in unique_queries if query not in query_embeddings]
+        if missing_queries and self.query_disk_cache is not None:
+            try:
+                disk_embeddings = self.query_disk_cache.get_many(model, missing_queries)
+            except sqlite3.Error as e:
+                logger.warning(f"Failed to read query embedding cache: {e}")
+                disk_embeddings = [None] * len(missing_queries)
+            for standardized_query, query_embedding in zip(missing_queries, disk_embeddings):
+                if query_embedding is not None:
+                    query_embeddings[standardized_query] = query_embedding
+                    self._put_cached_query_embedding(model, standardized_query, query_embedding)
+            missing_queries = [query for query in missing_queries if query not in query_embeddings]
+
+        if missing_queries:
+            generated_embeddings = self.embedding_generator.generate_embeddings(missing_queries)
+            if self.query_disk_cache is not None:
+                try:
+                    self.query_disk_cache.put_many(model, missing_queries, generated_embeddings)
+                except sqlite3.Error as e:
+                    logger.warning(f"Failed to write query embedding cache: {e}")
+            for standardized_query, query_embedding in zip(missing_queries, generated_embeddings):
+                query_embeddings[standardized_query] = query_embedding
+                self._put_cached_query_embedding(model, standardized_query, query_embedding)
+
+        return [query_embeddings[standardized_query] for standardized_query in standardized_queries]
+
+    def _put_cached_query_embedding(self, model: str, standardized_query: str, query_embedding: typing.List[float]):
+        """Helper function to store a query embedding in the in-memory query cache, if configured."""
+        if self.query_cache is not None:
+            self.query_cache.put((model, standardized_query), query_embedding)
+
+    def get_query_embedding(self, standardized_query: str) -> typing.List[float]:
+        """
+        Embed a preprocessed query, serving repeated queries from the in-memory query cache
+        and, if configured, the on-disk cache shared across workers
+        :param standardized_query: output of Preprocessor.preprocess_query
+        :return: query embedding
+        """
+        model = OPENAI_CONFIG["EMBEDDING_MODEL"]
+        cache_key = (model, standardized_query)
+        if self.query_cache is not None:
+            query_embedding = self.query_cache.get(cache_key)
+            if query_embedding is not None:
+                return query_embedding
+
+        query_embedding = self._get_disk_cached_query_embedding(model, standardized_query)
+        if query_embedding is None:
+            query_embedding = self.embedding_generator.generate_embedding(standardized_query)
+            self._put_disk_cached_query_embedding(model, standardized_query, query_embedding)
+
+        if self.query_cache is not None:
+            self.query_cache.put(cache_key, query_embedding)
+        return query_embedding
+
+    async def get_query_embedding_async(self,
+                                        standardized_query: str,
+                                        hedge_delay: float = None) -> typing.List[float]:
+        """
+        Embed a preprocessed query like get_query_embedding without blocking the calling event loop
+        :param standardized_query: output of Preprocessor.preprocess_query
+        :param hedge_delay: seconds after which a slow embedding request is duplicated, never if None
+        :return: query embedding
+        """
+        model = OPENAI_CONFIG["EMBEDDING_MODEL"]
+        if self.query_cache is not None:
+            query_embedding = self.query_cache.get((model, standardized_query))
+            if query_embedding is not None:
+                return query_embedding
+
+        query_embedding = self._get_disk_cached_query_embedding(model, standardized_query)
+        if query_embedding is None:
+            query_embedding = await self._generate_hedged_embedding(standardized_query, hedge_delay)
+            self._put_disk_cached_query_embedding(model, standardized_query, query_embedding)
+
+        self._put_cached_query_embedding(model, standardized_query, query_embedding)
+        return query_embedding
+
+    async def _generate_hedged_embedding(self, text: str, hedge_delay: float = None) -> typing.List[float]:
+        """
+        Helper function to request an embedding and, if no response arrived after hedge_delay seconds,
+        a second one, returning whichever succeeds first and cancelling the other
+        """
+        attempts = {asyncio.ensure_future(self.embedding_generator.generate_embedding_async(text))}
+        try:
+            done, _ = await asyncio.wait(attempts, timeout=hedge_delay)
+            if not done:
+                logger.info(f"No embedding response after {hedge_delay}s; sending a hedged request.")
+                attempts.add(asyncio.ensure_future(self.embedding_generator.generate_embedding_async(text)))
+            error = None
+            while attempts:
+                done, attempts = await asyncio.wait(attempts, return_when=asyncio.FIRST_COMPLETED)
+                for attempt in done:
+                    if attempt.exception() is None:
+                        return attempt.result()
+                    error = attempt.exception()
+            raise error
+        finally:
+            for attempt in attempts:
+                attempt.cancel()
+
+    def _get_disk_cached_query_embedding(self, model: str, standardized_query: str) -> typing.List[float] | None:
+        """Helper function to look up a query embedding on disk, treating disk errors as misses."""
+        if self.query_disk_cache is None:
+            return None
+        try:
+            return self.query_disk_cache.get_many(model, [standardized_query])[0]
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to read query embedding cache: {e}")
+            return None
+
+    def _put_disk_cached_query_embedding(self, model: str, standardized_query: str, query_embedding: typing.List[float]):
+        """Helper function to store a query embedding on disk, ignoring disk errors."""
+        if self.query_disk_cache is None:
+            return
+        try:
+            self.query_disk_cache.put_many(model, [standardized_query], [query_embedding])
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to write query embedding cache: {e}")
+
+    def get_query_cache_stats(self) -> typing.Dict[str, typing.Any]:
+        """
+        Report the counters of the query embedding caches
+        :return: stats of the in-memory and on-disk query caches, None for caches that are not configured
+        """
+        return {
+            "memory": self.query_cache.stats() if self.query_cache is not None else None,
+            "disk": self.query_disk_cache.stats() if self.query_disk_cache is not None else None,
+        }
@@ -1,56 +1,579 @@
 import faiss
+import json
 import logging
+import os
+import re
+import tempfile
+import threading
+import time
 import typing
 import numpy as np
-from backend.core.populate_config import OPENAI_CONFIG, INDEX_PATH
+from backend.core.populate_config import OPENAI_CONFIG, INDEX_PATH, FAISS_CONFIG
+from backend.services.embedding import index_factory
+from backend.services.embedding.metadata_index import MetadataIndex
 
 logger = logging.getLogger(__name__)
 
+class IndexSnapshot(typing.NamedTuple):
+    """Consistent view of one published generation, searched as a unit while a newer one is swapped in"""
+    index: faiss.Index
+    exact_index: faiss.Index | None
+    metadata_index: MetadataIndex
+    generation: int
+
+
 class EmbeddingStorage:
-    def __init__(self, database_driver: "DatabaseDriver"):
+    def __init__(self,
+                 database_driver: "DatabaseDriver",
+                 checkpoint_interval: int = FAISS_CONFIG["CHECKPOINT_INTERVAL"],
+                 index_type: str = FAISS_CONFIG["INDEX_TYPE"],
+                 mmap: bool = FAISS_CONFIG["MMAP"]):
+        if index_type not in index_factory.INDEX_TYPES:
+            raise ValueError(f"Unsupported FAISS index type '{index_type}', expected one of {index_factory.INDEX_TYPES}")
         self.database_driver = database_driver
+        self.checkpoint_interval = checkpoint_interval
+        self.mmap = mmap # memory-map index files so forked workers share their pages
+        self.index_type = index_type # built by build_index(), new vectors are staged in a flat index until then
+        self.nprobe = FAISS_CONFIG["IVF_NPROBE"]
+        self.ef_search = FAISS_CONFIG["HNSW_EF_SEARCH"]
+        self.rerank_oversampling = FAISS_CONFIG["RERANK_OVERSAMPLING"]
         self.index = None # lazy loading
+        self._index_mapped = False
+        self.exact_index = None # exact float vectors re-ranking the candidates of compressed index types
+        self._exact_index_mapped = False
+        self.index_version = 0 # incremented whenever the index contents change
+        self.metadata_index = None # lazy loading, rebuilt when index_version changes
+        self.generation = 0 # generation of the loaded or building index, 0 for an unversioned INDEX_PATH
+        self.reload_check_interval = FAISS_CONFIG["RELOAD_CHECK_INTERVAL"]
+        self._index_path = None # file the loaded index was read from, re-read to copy a memory-mapped index
+        self._exact_index_path = None
+        self._unsaved_changes = 0
+        self._swap_lock = threading.RLock() # guards the index, exact index, metadata index and generation as a set
+        self._reload_lock = threading.Lock()
+        self._reloading = False
+        self._last_reload_check = 0.0
 
     def _load_index(self):
+        if self.index is not None:
+            return
+        with self._swap_lock:
+            if self.index is not None: # loaded by another thread while this one waited
+                return
+            manifest = self.read_manifest()
+            generation = manifest["generation"] if manifest else 0
+            try:
+                index, index_mapped, exact_index, exact_index_mapped = self._read_generation(generation)
+                logger.info(f"FAISS index generation {generation} loaded successfully: "
+                            f"{index_factory.describe_index(index)}")
+            except FileNotFoundError as e:
+                logger.warning(f"No FAISS index found; creating a new one: {e}")
+                index, index_mapped, exact_index, exact_index_mapped = self._create_index(), False, None, False
+            index_factory.apply_search_parameters(index, nprobe=self.nprobe, ef_search=self.ef_search)
+            self.generation = generation
+            self._index_mapped = index_mapped
+            self.exact_index, self._exact_index_mapped = exact_index, exact_index_mapped
+            self._index_path = self.get_index_path(generation)
+            self._exact_index_path = self.get_exact_index_path(generation)
+            self.index_version += 1
+            # assigned last, so threads that skip the lock because an index is set also see its generation
+            self.index = index
+
+    def _read_generation(self, generation: int) -> typing.Tuple[faiss.Index, bool, faiss.Index | None, bool]:
+        """
+        Read the index files of a generation, memory-mapped if enabled
+        :param generation: index generation
+        :return: index, whether it is memory-mapped, exact vectors of a compressed index or None,
+                 and whether they are memory-mapped
+        """
+        index_path = self.get_index_path(generation)
+        if not os.path.exists(index_path):
+            raise FileNotFoundError(f"No FAISS index at {index_path}")
+        index, index_mapped = self._read_index(index_path)
+        id_mapped_index = self._ensure_id_map(index)
+        index_mapped = index_mapped and id_mapped_index is index
+        if not index_factory.is_compressed(index_factory.get_index_type(id_mapped_index)):
+            return id_mapped_index, index_mapped, None, False
+        exact_index_path = self.get_exact_index_path(generation)
+        if not os.path.exists(exact_index_path):
+            raise RuntimeError(f"Compressed FAISS index has no exact vectors at {exact_index_path}")
+        exact_index, exact_index_mapped = self._read_index(exact_index_path)
+        return id_mapped_index, index_mapped, exact_index, exact_index_mapped
+
+    def preload(self):
+        """
+        Load the FAISS index and the metadata index ahead of the first search,
+        e.g. in the gunicorn master so that forked workers share them
+        """
+        self._load_index()
+        self.get_metadata_index()
+
+    def get_snapshot(self) -> IndexSnapshot:
+        """
+        Get the index, exact vectors, and metadata index of one generation together,
+        so a search is not split across a generation swap
+        :return: index snapshot
+        """
+        self._load_index()
+        with self._swap_lock:
+            return IndexSnapshot(self.index, self.exact_index, self.get_metadata_index(), self.generation)
+
+    def refresh_if_stale(self):
+        """
+        Check, at most every reload_check_interval seconds, whether a newer generation was published
+        and load it in a background thread. Searches keep using the current generation until the new one
+        is fully loaded and swapped in, so a refresh never blocks a request
+        """
         if self.index is None:
+            return
+        now = time.monotonic()
+        with self._reload_lock:
+            if self._reloading or now - self._last_reload_check < self.reload_check_interval:
+                return
+            self._last_reload_check = now
+            manifest = self.read_manifest()
+            if manifest is None or manifest["generation"] <= self.generation:
+                return
+            self._reloading = True
+        # the database driver pushes its own app context, and session, in the thread
+        threading.Thread(
+            target=self._reload,
+            args=(manifest["generation"],),
+            name=f"faiss-reload-g{manifest['generation']}",
+            daemon=True,
+        ).start()
+
+    def _reload(self, generation: int):
+        """Helper function to load a published generation with its metadata index and swap it in."""
+        try:
+            logger.info(f"Loading FAISS index generation {generation}.")
+            index, index_mapped, exact_index, exact_index_mapped = self._read_generation(generation)
+            index_factory.apply_search_parameters(index, nprobe=self.nprobe, ef_search=self.ef_search)
+            self._warm_up(index, exact_index)
+            metadata_index = MetadataIndex.build(self.database_driver.get_search_metadata(generation=generation))
+            with self._swap_lock:
+                self.index, self._index_mapped = index, index_mapped
+                self.exact_index, self._exact_index_mapped = exact_index, exact_index_mapped
+                self._index_path = self.get_index_path(generation)
+                self._exact_index_path = self.get_exact_index_path(generation)
+                self.generation = generation
+                self.index_version += 1
+                metadata_index.version = self.index_version
+                self.metadata_index = metadata_index
+            logger.info(f"Swapped in FAISS index generation {generation}: {index_factory.describe_index(index)}")
+        except Exception as e:
+            logger.error(f"Failed to load FAISS index generation {generation}, keeping generation "
+                         f"{self.generation}: {e}")
+        finally:
+            with self._reload_lock:
+                self._reloading = False
+
+    @staticmethod
+    def _warm_up(index: faiss.Index, exact_index: faiss.Index | None):
+        """Helper function to fault in memory-mapped pages before the first search of a new generation."""
+        for warm_index in (index, exact_index):
+            if warm_index is not None and warm_index.ntotal:
+                warm_index.search(np.zeros((1, warm_index.d), dtype=np.float32), 1)
+
+    def _read_index(self, path: str) -> typing.Tuple[faiss.Index, bool]:
+        """
+        Read an index file, memory-mapped if enabled and supported
+        Memory-mapped indexes are read-only: FAISS aborts the process when they are mutated
+        :param path: index file path
+        :return: index and whether it is memory-mapped
+        """
+        mmap_flag = getattr(faiss, "IO_FLAG_MMAP_IFC", None) # missing from older FAISS releases such as 1.9
+        if self.mmap and mmap_flag is None:
+            logger.warning(f"FAISS_CONFIG['MMAP'] is set, but FAISS {faiss.__version__} has no IO_FLAG_MMAP_IFC and "
+                           f"cannot memory-map index files: reading {path} into memory.")
+        elif self.mmap:
             try:
-                self.index = faiss.read_index(INDEX_PATH)
-                logger.info("FAISS index loaded successfully.")
-            except Exception:
-                logger.warning("No FAISS index found; creating a new one.")
-                self.index = faiss.IndexFlatL2(OPENAI_CONFIG["EMBEDDING_DIMENSIONS"])
+                return faiss.read_index(path, mmap_flag), True
+            except RuntimeError as e:
+                logger.warning(f"FAISS cannot memory-map {path}, reading it into memory: {e}")
+        return faiss.read_index(path), False
+
+    def _ensure_index_writable(self):
+        """Helper function to replace a memory-mapped index, which is read-only, with an in-memory copy."""
+        if self._index_mapped:
+            logger.info("Copying memory-mapped FAISS index into memory before modifying it.")
+            self.index = self._ensure_id_map(faiss.read_index(self._index_path))
+            index_factory.apply_search_parameters(self.index, nprobe=self.nprobe, ef_search=self.ef_search)
+            self._index_mapped = False
+
+    def _ensure_exact_index_writable(self):
+        """Helper function to replace memory-mapped exact vectors, which are read-only, with an in-memory copy."""
+        if self._exact_index_mapped:
+            self.exact_index = faiss.read_index(self._exact_index_path)
+            self._exact_index_mapped = False
+
+    @staticmethod
+    def _create_index() -> faiss.IndexIDMap2:
+        """Helper function to create an empty ID-mapped flat index, which accepts vectors without training."""
+        return index_factory.create_index(index_factory.FLAT, OPENAI_CONFIG["EMBEDDING_DIMENSIONS"])
+
+    def build_index(self, force: bool = False):
+        """
+        Rebuild the FAISS index as the configured index type, training it on the stored vectors if needed
+        Skipped when the index already has the configured type, unless forced
+        :param force: rebuild even if the index already has the configured type
+        """
+        self._load_index()
+        if not force and index_factory.get_index_type(self.index) == self.index_type:
+            return
+
+        embedding_ids = self.get_embedding_ids()
+        vectors = self._reconstruct(embedding_ids)
+        logger.info(f"Building {self.index_type} FAISS index over {len(embedding_ids)} embeddings.")
+        index = index_factory.create_index(self.index_type, self.index.d, n_vectors=len(embedding_ids))
+        if not index.is_trained:
+            if len(embedding_ids) == 0:
+                logger.warning(f"Cannot train {self.index_type} FAISS index without embeddings; keeping the flat index.")
+                return
+            index.train(vectors)
+        if len(embedding_ids):
+            index.add_with_ids(vectors, embedding_ids)
+        index_factory.apply_search_parameters(index, nprobe=self.nprobe, ef_search=self.ef_search)
+
+        exact_index = None
+        if index_factory.is_compressed(self.index_type):
+            exact_index = self._create_index()
+            if len(embedding_ids):
+                exact_index.add_with_ids(vectors, embedding_ids)
+        self.index = index
+        self._index_mapped = False
+        self.exact_index = exact_index
+        self._exact_index_mapped = False
+        self.index_version += 1
+        self._unsaved_changes += 1
+
+    def set_search_parameters(self, nprobe: int = None, ef_search: int = None, rerank_oversampling: int = None):
+        """
+        Tune search accuracy against speed for approximate index types
+        :param nprobe: number of inverted lists visited per query by IVF indexes
+        :param ef_search: candidate list size per query of HNSW indexes
+        :param rerank_oversampling: candidates per result fetched from compressed indexes before exact re-ranking
+        """
+        if nprobe:
+            self.nprobe = nprobe
+        if ef_search:
+            self.ef_search = ef_search
+        if rerank_oversampling:
+            self.rerank_oversampling = rerank_oversampling
+        if self.index is not None:
+            index_factory.apply_search_parameters(self.index, nprobe=self.nprobe, ef_search=self.ef_search)
+
+    def _reconstruct(self, embedding_ids: np.ndarray) -> np.ndarray:
+        """Helper function to copy stored vectors out of the index, exact ones for compressed indexes."""
+        if len(embedding_ids) == 0:
+            return np.empty((0, self.index.d), dtype=np.float32)
+        source_index = self.exact_index if self.exact_index is not None else self.index
+        return np.ascontiguousarray(source_index.reconstruct_batch(embedding_ids), dtype=np.float32)
+
+    @staticmethod
+    def _ensure_id_map(index: faiss.Index) -> faiss.IndexIDMap2:
+        """
+        Wrap a legacy positional index in an IndexIDMap2, keeping each vector's position as its ID
+        :param index: index read from disk
+        :return: ID-mapped index
+        """
+        if isinstance(index, faiss.IndexIDMap2):
+            return index
+        logger.warning("Migrating positional FAISS index to an ID-mapped index.")
+        id_mapped_index = faiss.IndexIDMap2(faiss.IndexFlatL2(index.d))
+        if index.ntotal:
+            id_mapped_index.add_with_ids(index.reconstruct_n(0, index.ntotal), np.arange(index.ntotal, dtype=np.int64))
+        return id_mapped_index
+
+    def reset_index(self):
+        """
+        Replace the FAISS index with an empty one, used when rebuilding from scratch
+        """
+        logging.info("Resetting FAISS index.")
+        self.index = self._create_index()
+        self._index_mapped = False
+        self.exact_index = None
+        self._exact_index_mapped = False
+        self.index_version += 1
+        self._unsaved_changes += 1
 
     def save_index(self):
         """
-        Save the FAISS index to a file
+        Save the FAISS index of the current generation to its files, replacing previous files atomically
+        Searches only move to the saved generation once it is published
         """
         self._load_index()
-        logging.info(f"Saving FAISS index to {INDEX_PATH}.")
+        index_path = self.get_index_path(self.generation)
+        logging.info(f"Saving FAISS index to {index_path}.")
         try:
-            faiss.write_index(self.index, INDEX_PATH)
+            self._write_index_file(self.index, index_path)
+            self._save_exact_index()
+            self._index_path = index_path
+            self._exact_index_path = self.get_exact_index_path(self.generation)
+            self._unsaved_changes = 0
             logging.info("FAISS index saved successfully.")
         except Exception as e:
-            logging.error(f"Error saving FAISS index: {INDEX_PATH}")
+            logging.error(f"Error saving FAISS index: {index_path}")
             raise
 
-    def add_embedding(self, faculty_name: str, embedding: typing.List[float]) -> int:
+    @staticmethod
+    def _write_index_file(index: faiss.Index, path: str):
+        """Helper function to write an index through a temporary file, so readers never see a partial file."""
+        file_descriptor, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".faiss.tmp")
+        os.close(file_descriptor)
+        try:
+            faiss.write_index(index, temp_path)
+            os.replace(temp_path, path)
+        except Exception:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+    def _save_exact_index(self):
+        """Helper function to atomically save the exact vectors of a compressed index, or delete stale ones."""
+        exact_index_path = self.get_exact_index_path(self.generation)
+        if self.exact_index is None:
+            if os.path.exists(exact_index_path):
+                os.remove(exact_index_path)
+            return
+        self._write_index_file(self.exact_index, exact_index_path)
+
+    def start_generation(self, generation: int):
+        """
+        Save further changes as a new generation, next to the published one, until publish() is called
+        :param generation: generation ID, also stored on the faculty records of the generation
+        """
+        self._load_index()
+        if generation <= self.generation:
+            raise ValueError(f"Generation {generation} is not newer than generation {self.generation}")
+        logger.info(f"Building FAISS index generation {generation}.")
+        self.generation = generation
+        self._unsaved_changes += 1
+
+    def publish(self):
+        """
+        Save the current generation and atomically point the manifest at it,
+        which running servers pick up in refresh_if_stale()
+        """
+        self.checkpoint()
+        self._write_manifest()
+        logger.info(f"Published FAISS index generation {self.generation}.")
+
+    def read_manifest(self) -> typing.Dict[str, typing.Any] | None:
+        """
+        Read the manifest of the published generation
+        :return: manifest or None if nothing was published
+        """
+        try:
+            with open(self.get_manifest_path()) as manifest_file:
+                manifest = json.load(manifest_file)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable FAISS manifest: {e}")
+            return None
+        manifest.setdefault("generation", 0)
+        return manifest
+
+    def delete_generation_files(self, generation: int):
+        """
+        Delete the index files of a generation, e.g. one that failed to build
+        :param generation: generation ID
+        """
+        for path in (self.get_index_path(generation), self.get_exact_index_path(generation)):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def prune_generations(self, oldest_generation: int):
+        """
+        Delete the index files of generations older than oldest_generation
+        Processes that still search an older generation keep reading its memory-mapped pages after deletion
+        :param oldest_generation: oldest generation to keep
+        """
+        base_name = os.path.basename(os.path.splitext(INDEX_PATH)[0])
+        pattern = re.compile(rf"^{re.escape(base_name)}-g(\d+)(\.exact)?\.faiss$")
+        index_dir = os.path.dirname(INDEX_PATH)
+        for file_name in os.listdir(index_dir):
+            match = pattern.match(file_name)
+            if match and int(match.group(1)) < oldest_generation:
+                logger.info(f"Deleting FAISS index file of generation {match.group(1)}: {file_name}")
+                os.remove(os.path.join(index_dir, file_name))
+
+    @staticmethod
+    def get_index_path(generation: int = 0) -> str:
+        """
+        Get the index file path of a generation, INDEX_PATH for the unversioned generation 0
+        :param generation: generation ID
+        :return: index path
+        """
+        if not generation:
+            return INDEX_PATH
+        return f"{os.path.splitext(INDEX_PATH)[0]}-g{generation}.faiss"
+
+    @staticmethod
+    def get_exact_index_path(generation: int = 0) -> str:
+        """
+        Get the path of the exact vectors re-ranking a compressed index, next to the index file
+        :param generation: generation ID
+        :return: exact vectors path
+        """
+        return f"{os.path.splitext(EmbeddingStorage.get_index_path(generation))[0]}.exact.faiss"
+
+    @staticmethod
+    def get_manifest_path() -> str:
+        """
+        Get the path of the JSON manifest describing the published index, next to the index file
+        :return: manifest path
+        """
+        return f"{os.path.splitext(INDEX_PATH)[0]}.json"
+
+    def _write_manifest(self):
+        """Helper function to atomically record the generation, files and build parameters of the saved index."""
+        manifest_path = self.get_manifest_path()
+        file_descriptor, temp_path = tempfile.mkstemp(dir=os.path.dirname(manifest_path), suffix=".json.tmp")
+        with os.fdopen(file_descriptor, "w") as manifest_file:
+            manifest = {
+                "generation": self.generation,
+                "index_file": os.path.basename(self.get_index_path(self.generation)),
+                **index_factory.describe_index(self.index),
+            }
+            if self.exact_index is not None:
+                manifest["exact_vectors"] = os.path.basename(self.get_exact_index_path(self.generation))
+            json.dump(manifest, manifest_file, indent=2)
+        os.replace(temp_path, manifest_path)
+
+    def checkpoint(self):
+        """
+        Save the FAISS index if it changed since the last save
+        """
+        if self._unsaved_changes:
+            self.save_index()
+
+    def add_embedding(self, embedding_id: int, embedding: typing.List[float]) -> int:
         """
         Add an embedding to the FAISS index
-        :param faculty_name: name of the faculty
+        :param embedding_id: stable ID of the embedding
         :param embedding: faculty embedding
-        :return: index of the added embedding
+        :return: ID of the added embedding
+        """
+        logging.info(f"Adding embedding with id: {embedding_id}.")
+        return self.add_embeddings([embedding_id], np.array([embedding], dtype=np.float32))[0]
+
+    def add_embeddings(self, embedding_ids: typing.List[int], embeddings: np.ndarray) -> typing.List[int]:
+        """
+        Add a matrix of embeddings to the FAISS index in one call.
+        The index is saved every checkpoint_interval changes, otherwise only on checkpoint().
+        :param embedding_ids: stable ID of each embedding
+        :param embeddings: (n, dimensions) float32 matrix, one embedding per row
+        :return: IDs of the added embeddings, in row order
         """
         self._load_index()
-        logging.info(f"Adding embedding for faculty: {faculty_name}.")
+        ids = np.asarray(embedding_ids, dtype=np.int64)
+        vectors = np.ascontiguousarray(embeddings, dtype=np.float32)
+        if vectors.ndim != 2 or vectors.shape[1] != self.index.d:
+            raise ValueError(f"Expected an (n, {self.index.d}) matrix, got shape {vectors.shape}")
+        if len(ids) != len(vectors):
+            raise ValueError(f"Got {len(ids)} IDs for {len(vectors)} embeddings")
+
+        logging.info(f"Adding {len(vectors)} embeddings to FAISS index.")
         try:
-            vector = np.array([embedding], dtype=np.float32)
-            self.index.add(vector)
-            self.save_index()
-            return self.index.ntotal - 1
+            self._ensure_index_writable()
+            self.index.add_with_ids(vectors, ids)
+            if self.exact_index is not None:
+                self._ensure_exact_index_writable()
+                self.exact_index.add_with_ids(vectors, ids)
+            self._record_changes(len(vectors))
+            return ids.tolist()
+        except Exception as e:
+            logging.error(f"Error adding embeddings: {e}")
+            raise
+
+    def upsert_embedding(self, embedding_id: int, embedding: typing.List[float]) -> int:
+        """
+        Add an embedding to the FAISS index, replacing any embedding stored under the same ID
+        :param embedding_id: stable ID of the embedding
+        :param embedding: faculty embedding
+        :return: ID of the upserted embedding
+        """
+        return self.upsert_embeddings([embedding_id], np.array([embedding], dtype=np.float32))[0]
+
+    def upsert_embeddings(self, embedding_ids: typing.List[int], embeddings: np.ndarray) -> typing.List[int]:
+        """
+        Add a matrix of embeddings to the FAISS index, replacing any embeddings stored under the same IDs
+        :param embedding_ids: stable ID of each embedding
+        :param embeddings: (n, dimensions) float32 matrix, one embedding per row
+        :return: IDs of the upserted embeddings, in row order
+        """
+        self._remove_ids(embedding_ids)
+        return self.add_embeddings(embedding_ids, embeddings)
+
+    def remove_embedding(self, embedding_id: int) -> bool:
+        """
+        Remove an embedding from the FAISS index
+        :param embedding_id: stable ID of the embedding
+        :return: True if an embedding was removed else False
+        """
+        return self.remove_embeddings([embedding_id]) > 0
+
+    def remove_embeddings(self, embedding_ids: typing.List[int]) -> int:
+        """
+        Remove embeddings from the FAISS index
+        :param embedding_ids: stable IDs of the embeddings
+        :return: number of embeddings removed
+        """
+        removed_count = self._remove_ids(embedding_ids)
+        self._record_changes(removed_count)
+        return removed_count
+
+    def _remove_ids(self, embedding_ids: typing.List[int]) -> int:
+        """Helper function to remove IDs from the index without counting towards a checkpoint."""
+        self._load_index()
+        if len(embedding_ids) == 0:
+            return 0
+        try:
+            self._ensure_index_writable()
+            if index_factory.supports_remove(index_factory.get_index_type(self.index)):
+                removed_count = self.index.remove_ids(np.asarray(embedding_ids, dtype=np.int64))
+            else:
+                removed_count = self._rebuild_without_ids(embedding_ids)
+            if self.exact_index is not None:
+                self._ensure_exact_index_writable()
+                self.exact_index.remove_ids(np.asarray(embedding_ids, dtype=np.int64))
+            logging.info(f"Removed {removed_count} embeddings from FAISS index.")
+            return removed_count
         except Exception as e:
-            logging.error(f"Error adding embedding: {e}")
+            logging.error(f"Error removing embeddings: {e}")
             raise
 
+    def _rebuild_without_ids(self, embedding_ids: typing.List[int]) -> int:
+        """Helper function to remove IDs from index types without in-place removal, keeping their training."""
+        stored_ids = self.get_embedding_ids()
+        keep_mask = ~np.isin(stored_ids, np.asarray(embedding_ids, dtype=np.int64))
+        removed_count = int(len(stored_ids) - keep_mask.sum())
+        if removed_count == 0:
+            return 0
+        kept_ids = stored_ids[keep_mask]
+        kept_vectors = self._reconstruct(kept_ids)
+        self.index.reset()
+        if len(kept_ids):
+            self.index.add_with_ids(kept_vectors, kept_ids)
+        return removed_count
+
+    def get_embedding_ids(self) -> np.ndarray:
+        """
+        Get the IDs of all embeddings stored in the FAISS index
+        :return: array of embedding IDs
+        """
+        self._load_index()
+        return faiss.vector_to_array(self.index.id_map)
+
+    def _record_changes(self, change_count: int):
+        """Helper function to track unsaved changes and save every checkpoint_interval changes."""
+        self._unsaved_changes += change_count
+        if change_count:
+            self.index_version += 1
+        if self.checkpoint_interval and self._unsaved_changes >= self.checkpoint_interval:
+            self.save_index()
+
     def search_similar_embeddings(self,
                                   query_embedding: typing.List[float] = None,
                                   top_k: int = None,
@@ -58,7 +581,8 @@ class EmbeddingStorage:
                                   department: str = None,
                                   activity_code: str = None,
                                   agency_ic_admin: str = None,
-                                  has_funding: bool = None) -> typing.List[int]:
+                                  has_funding: bool = None,
+                                  snapshot: IndexSnapshot = None) -> typing.List[int]:
         """
         Search the FAISS index for most similar embeddings
         :param query_embedding: embedding generated from user input
@@ -68,25 +592,60 @@ class EmbeddingStorage:
         :param activity_code: activity code
         :param agency_ic_admin: agency ic admin
         :param has_funding: has funding
+        :param snapshot: generation to search, the current one if not given
         :return: list of indexes
         """
-        self._load_index()
-        logger.info(f"Performing FAISS search with top_k={top_k}.")
+        return self.search_similar_embeddings_batch(
+            query_embeddings=np.array([query_embedding], dtype=np.float32),
+            top_k=top_k,
+            school=school,
+            department=department,
+            activity_code=activity_code,
+            agency_ic_admin=agency_ic_admin,
+            has_funding=has_funding,
+            snapshot=snapshot
+        )[0]
+
+    def search_similar_embeddings_batch(self,
+                                        query_embeddings: np.ndarray = None,
+                                        top_k: int = None,
+                                        school: str = None,
+                                        department: str = None,
+                                        activity_code: str = None,
+                                        agency_ic_admin: str = None,
+                                        has_funding: bool = None,
+                                        snapshot: IndexSnapshot = None) -> typing.List[typing.List[int]]:
+        """
+        Search the FAISS index for the most similar embeddings of many queries with a single index search
+        :param query_embeddings: (n, dimensions) matrix, one query embedding per row
+        :param top_k: number of similar embeddings to return per query
+        :param school: school name
+        :param department: department name
+        :param activity_code: activity code
+        :param agency_ic_admin: agency ic admin
+        :param has_funding: has funding
+        :param snapshot: generation to search, the current one if not given
+        :return: list of indexes per query, in row order
+        """
+        snapshot = snapshot or self.get_snapshot()
+        logger.info(f"Performing FAISS search of generation {snapshot.generation} for "
+                    f"{len(query_embeddings)} queries with top_k={top_k}.")
 
         try:
-            query_vector = np.expand_dims(np.array(query_embedding, dtype=np.float32), axis=0)
+            query_vectors = np.ascontiguousarray(query_embeddings, dtype=np.float32)
 
             if self.are_search_parameters_empty(school, department, activity_code, agency_ic_admin, has_funding):
-                return self._search_full_index(query_vector, top_k)
+                return self._search_full_index(query_vectors, top_k, snapshot)
 
-            return self.search_with_parameters(
-                    query_vector=query_vector,
+            return self._search_filtered(
+                    query_vectors=query_vectors,
                     top_k=top_k,
                     school=school,
                     department=department,
                     activity_code=activity_code,
                     agency_ic_admin=agency_ic_admin,
-                    has_funding=has_funding
+                    has_funding=has_funding,
+                    snapshot=snapshot
             )
 
         except Exception as e:
@@ -94,10 +653,14 @@ class EmbeddingStorage:
             raise
 
     def _search_full_index(self,
-                           query_vector: np.ndarray = None,
-                           top_k: int = None) -> typing.List[int]:
-        _, indices = self.index.search(query_vector, top_k)
-        return indices.flatten().tolist()
+                           query_vectors: np.ndarray = None,
+                           top_k: int = None,
+                           snapshot: IndexSnapshot = None) -> typing.List[typing.List[int]]:
+        if snapshot.exact_index is None:
+            _, indices = snapshot.index.search(query_vectors, top_k)
+            return [self._strip_missing_ids(row) for row in indices]
+        _, candidates = snapshot.index.search(query_vectors, top_k * self.rerank_oversampling)
+        return self._rerank_rows(query_vectors, candidates, top_k, snapshot.exact_index)
 
     def search_with_parameters(self,
                                query_vector: np.ndarray,
@@ -106,46 +669,118 @@ class EmbeddingStorage:
                                department: str = None,
                                activity_code: str = None,
                                agency_ic_admin: str = None,
-                               has_funding: bool = None) -> typing.List[int]:
+                               has_funding: bool = None,
+                               snapshot: IndexSnapshot = None) -> typing.List[int]:
         """
         Perform a filtered FAISS search based on metadata constraints
+        The filter is pushed down into the index as an ID selector, so only matching vectors are scored
+        and no vectors are copied out of the index
         """
+        return self._search_filtered(
+            query_vectors=query_vector,
+            top_k=top_k,
+            school=school,
+            department=department,
+            activity_code=activity_code,
+            agency_ic_admin=agency_ic_admin,
+            has_funding=has_funding,
+            snapshot=snapshot
+        )[0]
+
+    def _search_filtered(self,
+                         query_vectors: np.ndarray,
+                         top_k: int,
+                         school: str = None,
+                         department: str = None,
+                         activity_code: str = None,
+                         agency_ic_admin: str = None,
+                         has_funding: bool = None,
+                         snapshot: IndexSnapshot = None) -> typing.List[typing.List[int]]:
+        """Helper function to search every query row with one metadata filter pushed down as an ID selector."""
+        snapshot = snapshot or self.get_snapshot()
         filtered_eids = self._get_filtered_eids(
+            snapshot.metadata_index,
             school=school,
             department=department,
             activity_code=activity_code,
             agency_ic_admin=agency_ic_admin,
             has_funding=has_funding
         )
-        valid_eids = [eid for eid in filtered_eids if eid < self.index.ntotal]
-
-        if not valid_eids:
+        if len(filtered_eids) == 0:
             logging.warning("No matching embeddings found after filtering.")
-            return []
+            return [[] for _ in query_vectors]
 
-        subset_vectors = np.array(self.index.reconstruct_batch(valid_eids), dtype=np.float32)
+        selector = faiss.IDSelectorBatch(filtered_eids)
+        top_k = min(top_k, len(filtered_eids))
+        if not index_factory.supports_selector(index_factory.get_index_type(snapshot.index)):
+            # PQ and binary codes cannot skip vectors, so only the exact vectors of the filtered embeddings are scanned
+            _, indices = snapshot.exact_index.search(query_vectors, top_k, params=faiss.SearchParameters(sel=selector))
+            return [self._strip_missing_ids(row) for row in indices]
 
-        distances = np.linalg.norm(subset_vectors - query_vector, axis=1) ** 2
-        top_k_indices = np.argsort(distances)[:min(top_k, len(subset_vectors))]
+        search_parameters = index_factory.make_search_parameters(
+            snapshot.index, selector, nprobe=self.nprobe, ef_search=self.ef_search
+        )
+        if snapshot.exact_index is None:
+            _, indices = snapshot.index.search(query_vectors, top_k, params=search_parameters)
+            return [self._strip_missing_ids(row) for row in indices]
+        _, candidates = snapshot.index.search(query_vectors, top_k * self.rerank_oversampling, params=search_parameters)
+        return self._rerank_rows(query_vectors, candidates, top_k, snapshot.exact_index)
 
-        return [valid_eids[idx] for idx in top_k_indices]
+    def _rerank_rows(self,
+                     query_vectors: np.ndarray,
+                     candidates: np.ndarray,
+                     top_k: int,
+                     exact_index: faiss.Index) -> typing.List[typing.List[int]]:
+        """Helper function to re-rank the candidates of every query row."""
+        return [
+            self._rerank(query_vectors[row:row + 1], self._strip_missing_ids(candidates[row]), top_k, exact_index)
+            for row in range(len(query_vectors))
+        ]
 
-    def _get_filtered_eids(self,
-                           school: str = None,
-                           department: str = None,
-                           activity_code: str = None,
-                           agency_ic_admin: str = None,
-                           has_funding: bool = None) -> typing.List[int]:
+    @staticmethod
+    def _rerank(query_vector: np.ndarray,
+                candidate_ids: typing.List[int],
+                top_k: int,
+                exact_index: faiss.Index) -> typing.List[int]:
         """
-        Get embedding ids for faculty with matching metadata
-        :param school: school name
-        :param department: department name
-        :param activity_code: activity code
-        :param agency_ic_admin: agency ic admin
+        Re-rank the candidates of a compressed index by their exact L2 distance to the query
+        :param query_vector: (1, dimensions) query matrix
+        :param candidate_ids: embedding IDs found by the compressed index
+        :param top_k: number of results to keep
+        :param exact_index: exact vectors of the searched generation
+        :return: top_k embedding IDs, closest first
+        """
+        if not candidate_ids:
+            return []
+        candidate_ids = np.asarray(candidate_ids, dtype=np.int64)
+        vectors = exact_index.reconstruct_batch(candidate_ids)
+        distances = np.square(vectors - query_vector).sum(axis=1)
+        return candidate_ids[np.argsort(distances, kind="stable")[:top_k]].tolist()
+
+    @staticmethod
+    def _strip_missing_ids(indices: np.ndarray) -> typing.List[int]:
+        """Helper function to flatten search results, dropping the -1 padding FAISS returns for unfilled ranks."""
+        return [int(eid) for eid in indices.flatten() if eid != -1]
+
+    @staticmethod
+    def _get_filtered_eids(metadata_index: MetadataIndex,
+                           school: str | typing.List[str] = None,
+                           department: str | typing.List[str] = None,
+                           activity_code: str | typing.List[str] = None,
+                           agency_ic_admin: str | typing.List[str] = None,
+                           has_funding: bool = None) -> np.ndarray:
+        """
+        Get embedding ids for faculty with matching metadata from the in-memory metadata index
+        Several values of one filter are combined with OR, different filters with AND
+        :param metadata_index: metadata index of the searched generation
+        :param school: school name(s)
+        :param department: department name(s)
+        :param activity_code: activity code(s)
+        :param agency_ic_admin: agency ic admin(s)
         :param has_funding: faculty has funding
+        :return: sorted embedding ids
         """
-        """Retrieve filtered embedding IDs from the database"""
-        return self.database_driver.get_embedding_ids_by_search_parameters(
+        return metadata_index.resolve(
             school=school,
             department=department,
             activity_code=activity_code,
@@ -153,6 +788,22 @@ class EmbeddingStorage:
             has_funding=has_funding
         )
 
+    def get_metadata_index(self) -> MetadataIndex:
+        """
+        Get the metadata index of the loaded FAISS index, building it from the database
+        on first use and whenever the FAISS index changed since it was built
+        :return: metadata index
+        """
+        self._load_index()
+        with self._swap_lock:
+            metadata_index = self.metadata_index
+            if metadata_index is None or metadata_index.version != self.index_version:
+                metadata_index = MetadataIndex.build(
+                    self.database_driver.get_search_metadata(generation=self.generation), version=self.index_version
+                )
+                self.metadata_index = metadata_index
+            return metadata_index
+
     @staticmethod
     def are_search_parameters_empty(*parameters) -> bool:
         """Check if all search parameters are empty"""
@@ -0,0 +1,154 @@
+import logging
+import math
+import typing
+import faiss
+from backend.core.populate_config import FAISS_CONFIG
+
+logger = logging.getLogger(__name__)
+
+FLAT = "Flat"
+IVF_FLAT = "IVFFlat"
+HNSW = "HNSW"
+SQ8 = "SQ8"
+PQ = "PQ"
+BINARY = "Binary"
+INDEX_TYPES = (FLAT, IVF_FLAT, HNSW, SQ8, PQ, BINARY)
+
+# lossy encodings used for candidate generation, re-ranked against exact float vectors
+COMPRESSED_INDEX_TYPES = (SQ8, PQ, BINARY)
+
+# IVF training needs roughly this many vectors per inverted list to place centroids well
+IVF_MIN_POINTS_PER_LIST = 39
+
+def create_index(index_type: str, dimensions: int, n_vectors: int = 0) -> faiss.IndexIDMap2:
+    """
+    Create an empty ID-mapped index of the configured type
+    :param index_type: one of INDEX_TYPES
+    :param dimensions: vector dimensions
+    :param n_vectors: number of vectors the index will be trained on and hold, used to size IVF lists
+    :return: ID-mapped index, untrained for IVF types
+    """
+    if index_type == FLAT:
+        base_index = faiss.IndexFlatL2(dimensions)
+    elif index_type == IVF_FLAT:
+        nlist = max(1, min(FAISS_CONFIG["IVF_NLIST"], n_vectors // IVF_MIN_POINTS_PER_LIST))
+        base_index = faiss.IndexIVFFlat(faiss.IndexFlatL2(dimensions), dimensions, nlist)
+        base_index.set_direct_map_type(faiss.DirectMap.Array) # supports reconstruct through the ID map
+    elif index_type == HNSW:
+        base_index = faiss.IndexHNSWFlat(dimensions, FAISS_CONFIG["HNSW_M"])
+        base_index.hnsw.efConstruction = FAISS_CONFIG["HNSW_EF_CONSTRUCTION"]
+    elif index_type == SQ8:
+        base_index = faiss.IndexScalarQuantizer(dimensions, faiss.ScalarQuantizer.QT_8bit, faiss.METRIC_L2)
+    elif index_type == PQ:
+        # codebooks of 2^nbits centroids need at least as many training vectors
+        nbits = max(1, min(FAISS_CONFIG["PQ_NBITS"], int(math.log2(max(n_vectors, 2)))))
+        base_index = faiss.IndexPQ(dimensions, FAISS_CONFIG["PQ_M"], nbits)
+    elif index_type == BINARY:
+        # one sign bit per dimension, compared by Hamming distance
+        base_index = faiss.IndexLSH(dimensions, dimensions, False, False)
+    else:
+        raise ValueError(f"Unsupported FAISS index type '{index_type}', expected one of {INDEX_TYPES}")
+    return faiss.IndexIDMap2(base_index)
+
+def get_index_type(index: faiss.IndexIDMap2) -> str:
+    """
+    Identify the type of an ID-mapped index
+    :param index: ID-mapped index
+    :return: one of INDEX_TYPES
+    """
+    base_index = faiss.downcast_index(index.index)
+    if isinstance(base_index, faiss.IndexHNSW):
+        return HNSW
+    if isinstance(base_index, faiss.IndexIVFFlat):
+        return IVF_FLAT
+    if isinstance(base_index, faiss.IndexScalarQuantizer):
+        return SQ8
+    if isinstance(base_index, faiss.IndexPQ):
+        return PQ
+    if isinstance(base_index, faiss.IndexLSH):
+        return BINARY
+    if isinstance(base_index, faiss.IndexFlat):
+        return FLAT
+    raise ValueError(f"Unsupported FAISS index class {type(base_index).__name__}")
+
+def supports_remove(index_type: str) -> bool:
+    """
+    Check whether vectors can be removed from an ID-mapped index of this type in place
+    IVF lists keep the internal IDs of the remaining vectors, which the ID map does not track, and HNSW
+    graphs cannot drop nodes, so both are rebuilt from the remaining vectors instead
+    :param index_type: one of INDEX_TYPES
+    :return: False if the index has to be rebuilt to remove vectors
+    """
+    return index_type not in (IVF_FLAT, HNSW)
+
+def is_compressed(index_type: str) -> bool:
+    """
+    Check whether an index type stores lossy codes instead of the original vectors
+    :param index_type: one of INDEX_TYPES
+    :return: True if search results have to be re-ranked against exact vectors
+    """
+    return index_type in COMPRESSED_INDEX_TYPES
+
+def supports_selector(index_type: str) -> bool:
+    """
+    Check whether an index type can restrict its search to an ID selector
+    :param index_type: one of INDEX_TYPES
+    :return: False if filtered searches have to scan the exact vectors instead
+    """
+    return index_type not in (PQ, BINARY)
+
+def describe_index(index: faiss.IndexIDMap2) -> typing.Dict[str, typing.Any]:
+    """
+    Describe an ID-mapped index for the index manifest
+    :param index: ID-mapped index
+    :return: index type, dimensions, number of vectors, and build parameters
+    """
+    index_type = get_index_type(index)
+    base_index = faiss.downcast_index(index.index)
+    description = {"index_type": index_type, "dimensions": index.d, "ntotal": index.ntotal}
+    if index_type == IVF_FLAT:
+        description["nlist"] = base_index.nlist
+    elif index_type == HNSW:
+        description["hnsw_m"] = base_index.hnsw.nb_neighbors(1)
+        description["hnsw_ef_construction"] = base_index.hnsw.efConstruction
+    elif index_type == PQ:
+        description["pq_m"] = base_index.pq.M
+        description["pq_nbits"] = base_index.pq.nbits
+    if is_compressed(index_type):
+        description["code_size"] = base_index.code_size
+    return description
+
+def apply_search_parameters(index: faiss.IndexIDMap2, nprobe: int = None, ef_search: int = None):
+    """
+    Set the search-time accuracy / speed knobs on the underlying index
+    :param index: ID-mapped index
+    :param nprobe: number of inverted lists visited by IVF indexes
+    :param ef_search: size of the candidate list of HNSW indexes
+    """
+    index_type = get_index_type(index)
+    base_index = faiss.downcast_index(index.index)
+    if index_type == IVF_FLAT and nprobe:
+        base_index.nprobe = min(nprobe, base_index.nlist)
+    elif index_type == HNSW and ef_search:
+        base_index.hnsw.efSearch = ef_search
+
+def make_search_parameters(index: faiss.IndexIDMap2,
+                           selector: faiss.IDSelector,
+                           nprobe: int = None,
+                           ef_search: int = None) -> faiss.SearchParameters:
+    """
+    Build search parameters carrying an ID selector, of the type the underlying index expects
+    :param index: ID-mapped index
+    :param selector: ID selector restricting the search
+    :param nprobe: number of inverted lists visited by IVF indexes
+    :param ef_search: size of the candidate list of HNSW indexes
+    :return: search parameters
+    """
+    index_type = get_index_type(index)
+    if index_type == IVF_FLAT:
+        base_index = faiss.downcast_index(index.index)
+        return faiss.SearchParametersIVF(sel=selector, nprobe=min(nprobe or base_index.nprobe, base_index.nlist))
+    if index_type == HNSW:
+        base_index = faiss.downcast_index(index.index)
+        return faiss.SearchParametersHNSW(sel=selector, efSearch=ef_search or base_index.hnsw.efSearch)
+    return faiss.SearchParameters(sel=selector)
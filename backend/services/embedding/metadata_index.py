@@ -0,0 +1,144 @@
+import logging
+import typing
+import numpy as np
+from backend.core.populate_config import SCHOOL_DEPARTMENT_DATA
+
+logger = logging.getLogger(__name__)
+
+FilterValue = typing.Union[str, typing.Iterable[str], None]
+
+class MetadataIndex:
+    """
+    In-memory filter index mapping each school, department, activity code, and agency IC admin
+    to the sorted embedding IDs of matching faculty, plus the sorted embedding IDs of funded faculty.
+    Values of the same field are combined with OR, different fields with AND.
+    """
+    FIELDS = ("school", "department", "activity_code", "agency_ic_admin")
+    EMPTY = np.empty(0, dtype=np.int64)
+    # known department names, longest first so "Computer Engineering" is not matched inside a longer name
+    KNOWN_DEPARTMENTS = sorted(
+        {department for school in SCHOOL_DEPARTMENT_DATA.values() for department in school["departments"]},
+        key=len,
+        reverse=True,
+    )
+
+    def __init__(self,
+                 postings: typing.Dict[str, typing.Dict[str, np.ndarray]],
+                 funded_ids: np.ndarray,
+                 version: int = 0):
+        """
+        :param postings: field name to value to sorted embedding IDs
+        :param funded_ids: sorted embedding IDs of faculty with active funding
+        :param version: version of the FAISS index the metadata was built for
+        """
+        self.postings = postings
+        self.funded_ids = funded_ids
+        self.version = version
+
+    @classmethod
+    def build(cls, records: typing.Iterable[typing.Any], version: int = 0) -> "MetadataIndex":
+        """
+        Build the index from faculty x project metadata rows
+        :param records: rows with embedding_id, school, department, has_funding, activity_code, and agency_ic_admin
+        :param version: version of the FAISS index the metadata was built for
+        :return: metadata index
+        """
+        postings = {field: {} for field in cls.FIELDS}
+        funded_ids = set()
+        for record in records:
+            embedding_id = record.embedding_id
+            departments = cls._split_departments(record.department)
+            for field, values in (
+                ("school", [record.school]),
+                ("department", departments),
+                ("activity_code", [record.activity_code]),
+                ("agency_ic_admin", [record.agency_ic_admin]),
+            ):
+                for value in values:
+                    if value:
+                        postings[field].setdefault(value.strip(), set()).add(embedding_id)
+            if record.has_funding:
+                funded_ids.add(embedding_id)
+
+        metadata_index = cls(
+            postings={
+                field: {value: cls._to_sorted_array(ids) for value, ids in field_postings.items()}
+                for field, field_postings in postings.items()
+            },
+            funded_ids=cls._to_sorted_array(funded_ids),
+            version=version,
+        )
+        logger.info(f"Built metadata index for FAISS index version {version}: "
+                    f"{ {field: len(values) for field, values in metadata_index.postings.items()} } distinct values.")
+        return metadata_index
+
+    def resolve(self,
+                school: FilterValue = None,
+                department: FilterValue = None,
+                activity_code: FilterValue = None,
+                agency_ic_admin: FilterValue = None,
+                has_funding: bool = None) -> np.ndarray:
+        """
+        Resolve search filters to the embedding IDs satisfying all of them
+        :param school: school name or list of school names
+        :param department: department name or list of department names
+        :param activity_code: activity code or list of activity codes
+        :param agency_ic_admin: agency IC admin or list of agency IC admins
+        :param has_funding: only keep faculty with active funding if True
+        :return: sorted embedding IDs
+        """
+        result = None
+        for field, field_filter in (
+            ("school", school),
+            ("department", department),
+            ("activity_code", activity_code),
+            ("agency_ic_admin", agency_ic_admin),
+        ):
+            values = self._as_values(field_filter)
+            if not values:
+                continue
+            field_ids = self._union(self.postings[field].get(value, self.EMPTY) for value in values)
+            result = field_ids if result is None else np.intersect1d(result, field_ids, assume_unique=True)
+
+        if has_funding:
+            result = self.funded_ids if result is None else np.intersect1d(result, self.funded_ids, assume_unique=True)
+
+        return self.EMPTY if result is None else result
+
+    @classmethod
+    def _split_departments(cls, department: str | None) -> typing.List[str]:
+        """
+        Split the comma-joined departments of a faculty, keeping known names that contain commas intact,
+        e.g. "Microbiology, Immunology, Cancer Biology"
+        :param department: comma-joined department names
+        :return: department names
+        """
+        remainder = department or ""
+        departments = []
+        for known_department in cls.KNOWN_DEPARTMENTS:
+            if known_department in remainder:
+                departments.append(known_department)
+                remainder = remainder.replace(known_department, "")
+        return departments + [value for value in remainder.split(",") if value.strip()]
+
+    @staticmethod
+    def _as_values(value: FilterValue) -> typing.List[str]:
+        """Helper function to normalize a single filter value or a list of them."""
+        if not value:
+            return []
+        if isinstance(value, str):
+            return [value.strip()]
+        return [item.strip() for item in value if item]
+
+    @classmethod
+    def _union(cls, arrays: typing.Iterable[np.ndarray]) -> np.ndarray:
+        """Helper function to OR together sorted ID arrays."""
+        arrays = list(arrays)
+        if len(arrays) == 1:
+            return arrays[0]
+        return np.unique(np.concatenate(arrays)) if arrays else cls.EMPTY
+
+    @staticmethod
+    def _to_sorted_array(ids: typing.Iterable[int]) -> np.ndarray:
+        """Helper function to store a set of IDs compactly."""
+        return np.array(sorted(ids), dtype=np.int64)
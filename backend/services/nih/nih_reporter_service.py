@@ -2,9 +2,11 @@ import typing
 import pandas as pd
 import logging
 import copy
+import re
+import unicodedata
 from datetime import datetime
 from backend.services.nih.nih_reporter_proxy import NIHReporterProxy
-from backend.core.populate_config import NIH_REPORTER_PAYLOAD, DEFAULT_FISCAL_YEARS
+from backend.core.populate_config import NIH_REPORTER_PAYLOAD, DEFAULT_FISCAL_YEARS, NIH_BULK_CONFIG
 
 logger = logging.getLogger(__name__)
 
@@ -12,22 +14,92 @@ class NIHReporterService:
 
     def __init__(self, proxy: NIHReporterProxy):
         self.proxy = proxy
+        self.pi_project_index = None
+        self.indexed_fiscal_years = None
 
     def compile_project_metadata(self, pi_first_name: str = None, pi_last_name: str = None, fiscal_years: typing.List[int] = DEFAULT_FISCAL_YEARS) -> pd.DataFrame:
         """
         Extract relevant metadata from PI projects for provided fiscal years
+        Served from the organization project index when it was loaded for the same fiscal years
         :param pi_first_name: PI's first name
         :param pi_last_name: PI's last name
         :param fiscal_years: fiscal years during which projects were/are active
         :return: dataframe of given PI's project metadata
         """
-        response = self.invoke_proxy(pi_first_name=pi_first_name, pi_last_name=pi_last_name, fiscal_years=fiscal_years)
+        if self.pi_project_index is not None and self.indexed_fiscal_years == list(fiscal_years):
+            if pi_first_name is None or pi_last_name is None:
+                raise ValueError("pi_first_name and pi_last_name cannot be None")
+            projects = self.pi_project_index.get(self.normalize_pi_name(pi_first_name, pi_last_name), [])
+        else:
+            response = self.invoke_proxy(pi_first_name=pi_first_name, pi_last_name=pi_last_name, fiscal_years=fiscal_years)
+            projects = response["results"]
 
-        projects = response["results"]
         if len(projects) == 0:
             logger.warning(f"No projects founds for PI '{pi_first_name} {pi_last_name}' and fiscal years '{fiscal_years}'")
             return pd.DataFrame()
 
+        return self._compile_metadata(projects)
+
+    def load_organization_projects(self, fiscal_years: typing.List[int] = DEFAULT_FISCAL_YEARS):
+        """
+        Retrieve all projects of the organizations in NIH_REPORTER_PAYLOAD for the provided fiscal years
+        with paginated requests, and index them by normalized PI name for local lookups
+        :param fiscal_years: fiscal years during which projects were/are active
+        """
+        pi_project_index = {}
+        project_count = 0
+        seen_appl_ids = set()
+        for fiscal_year in fiscal_years:
+            for project in self._fetch_organization_projects(fiscal_year):
+                # active projects are returned under every fiscal year they span
+                appl_id = project.get("appl_id")
+                if appl_id is not None:
+                    if appl_id in seen_appl_ids:
+                        continue
+                    seen_appl_ids.add(appl_id)
+                project_count += 1
+                pi_keys = {
+                    self.normalize_pi_name(pi.get("first_name") or "", pi.get("last_name") or "")
+                    for pi in project.get("principal_investigators") or []
+                }
+                for pi_key in pi_keys:
+                    pi_project_index.setdefault(pi_key, []).append(project)
+
+        self.pi_project_index = pi_project_index
+        self.indexed_fiscal_years = list(fiscal_years)
+        logger.info(f"Indexed {project_count} organization projects under {len(pi_project_index)} PIs.")
+
+    def _fetch_organization_projects(self, fiscal_year: int) -> typing.List[typing.Dict]:
+        """
+        Page through the organization projects of a single fiscal year
+        :param fiscal_year: fiscal year during which projects were/are active
+        :return: list of project JSON
+        """
+        page_size = NIH_BULK_CONFIG["PAGE_SIZE"]
+        offset = 0
+        projects = []
+        while True:
+            payload = self.build_organization_payload([fiscal_year], offset, page_size)
+            response = self.proxy.call_reporter_api(payload)
+            page = response["results"]
+            projects.extend(page)
+
+            total = response.get("meta", {}).get("total", 0)
+            offset += page_size
+            if not page or offset >= total:
+                break
+            if offset > NIH_BULK_CONFIG["MAX_OFFSET"]:
+                logger.warning(f"Fiscal year {fiscal_year} has {total} projects, only the first {len(projects)} were retrieved.")
+                break
+        logger.info(f"Retrieved {len(projects)} organization projects for fiscal year {fiscal_year}.")
+        return projects
+
+    def _compile_metadata(self, projects: typing.List[typing.Dict]) -> pd.DataFrame:
+        """
+        Extract relevant metadata from projects
+        :param projects: list of project JSON
+        :return: dataframe of project metadata
+        """
         compiled_metadata = [
             {
                 "project_number": self.get_project_number(project),
@@ -131,6 +203,37 @@ class NIHReporterService:
         payload["criteria"]["fiscal_years"] = fiscal_years
         return payload
 
+    @staticmethod
+    def build_organization_payload(fiscal_years: typing.List[int], offset: int, limit: int) -> typing.Dict:
+        """
+        Build the payload for a page of organization-wide NIH RePORTER API results
+        :param fiscal_years: list of fiscal years to filter results
+        :param offset: index of the first result
+        :param limit: number of results
+        :return: payload as dictionary
+        """
+        payload = copy.deepcopy(NIH_REPORTER_PAYLOAD)
+        del payload["criteria"]["pi_names"]
+        payload["criteria"]["use_relevance"] = False
+        payload["criteria"]["fiscal_years"] = fiscal_years
+        payload["offset"] = offset
+        payload["limit"] = limit
+        return payload
+
+    @staticmethod
+    def normalize_pi_name(first_name: str, last_name: str) -> typing.Tuple[str, str]:
+        """
+        Normalize a PI name for matching, ignoring case, accents, and punctuation
+        :param first_name: PI's first name
+        :param last_name: PI's last name
+        :return: normalized first and last name
+        """
+        def normalize(name: str) -> str:
+            name = unicodedata.normalize("NFKD", name).encode("ascii", "ignore").decode("ascii")
+            return re.sub(r"[^a-z]", "", name.lower())
+
+        return normalize(first_name), normalize(last_name)
+
     @staticmethod
     def safe_get_field(data: dict, key: str) -> typing.Any:
         """
@@ -1,8 +1,16 @@
 import typing
+import logging
 from abc import ABC, abstractmethod
+from lxml import html
+
+from backend.utils.http_client import HttpClient
+from backend.utils.institution_utils import InstitutionUtils
+
+logger = logging.getLogger(__name__)
 
 class BaseScraper(ABC):
     SCHOOL_ID: str
+    http_client: HttpClient
 
     @abstractmethod
     def get_profile_endpoints_from_people(self, people_url: str, max_pages: int=100) -> typing.List[str]:
@@ -14,38 +22,112 @@ class BaseScraper(ABC):
         """
         pass
 
-    @abstractmethod
+    def scrape_profile(self, profile_url: str) -> typing.Dict[str, typing.Any]:
+        """
+        Fetches and parses a profile page once and extracts every field from the same tree.
+        :param profile_url: the URL to the profile page
+        :return: dictionary with the name, emails, about, and research_interests of the profile
+        """
+        tree = self.fetch_profile_tree(profile_url)
+        try:
+            return {
+                "name": self.extract_name(profile_url, tree),
+                "emails": self.extract_emails(profile_url, tree),
+                "about": self.extract_about(profile_url, tree),
+                "research_interests": self.extract_research_interests(profile_url, tree),
+            }
+        except Exception as e:
+            logger.error(f"Unexpected error processing page {profile_url}: {e}")
+            raise
+
+    def fetch_profile_tree(self, profile_url: str) -> html.HtmlElement:
+        """
+        Fetches and parses a profile page.
+        :param profile_url: the URL to the profile page
+        :return: parsed HTML tree
+        """
+        if not InstitutionUtils.is_valid_url(profile_url):
+            logger.error(f"Invalid URL: {profile_url}")
+            raise ValueError(f"Invalid URL: {profile_url}")
+
+        try:
+            response = self.http_client.get(profile_url)
+            return html.fromstring(response.content)
+        except html.etree.XMLSyntaxError as e:
+            logger.error(f"Failed to parse HTML for {profile_url}: {e}")
+            raise
+        except Exception as e:
+            logger.error(f"Unexpected error processing page {profile_url}: {e}")
+            raise
+
     def get_emails_from_profile(self, profile_url: str) -> typing.List[str]:
         """
         Extracts emails from profile URLs.
         :param profile_url: the URL to the profile page
         :return emails: list of emails contained in the profile page
         """
-        pass
+        return self.extract_emails(profile_url, self.fetch_profile_tree(profile_url))
 
-    @abstractmethod
-    def get_about_from_profile(self, profile_url: str) -> typing.List[str]:
+    def get_about_from_profile(self, profile_url: str) -> str:
         """
         Extracts about from profile URLs.
         :param profile_url: the URL to the profile page
         :return: About Section text for profile
         """
-        pass
+        return self.extract_about(profile_url, self.fetch_profile_tree(profile_url))
 
-    @abstractmethod
     def get_name_from_profile(self, profile_url: str) -> str:
         """
         Extracts name from profile URLs.
         :param profile_url: profile URL
         :return: faculty name string
         """
-        pass
+        return self.extract_name(profile_url, self.fetch_profile_tree(profile_url))
 
-    @abstractmethod
     def get_research_interests_from_profile(self, profile_url: str) -> typing.List[str]:
         """
         Extracts research interests from profile URLs.
         :param profile_url:
         :return: list of research interests
         """
-        pass
\ No newline at end of file
+        return self.extract_research_interests(profile_url, self.fetch_profile_tree(profile_url))
+
+    @abstractmethod
+    def extract_emails(self, profile_url: str, tree: html.HtmlElement) -> typing.List[str]:
+        """
+        Extracts emails from a parsed profile page.
+        :param profile_url: the URL to the profile page
+        :param tree: parsed profile page
+        :return emails: list of emails contained in the profile page
+        """
+        pass
+
+    @abstractmethod
+    def extract_about(self, profile_url: str, tree: html.HtmlElement) -> str:
+        """
+        Extracts about from a parsed profile page.
+        :param profile_url: the URL to the profile page
+        :param tree: parsed profile page
+        :return: About Section text for profile
+        """
+        pass
+
+    @abstractmethod
+    def extract_name(self, profile_url: str, tree: html.HtmlElement) -> str:
+        """
+        Extracts name from a parsed profile page.
+        :param profile_url: profile URL
+        :param tree: parsed profile page
+        :return: faculty name string
+        """
+        pass
+
+    @abstractmethod
+    def extract_research_interests(self, profile_url: str, tree: html.HtmlElement) -> typing.List[str]:
+        """
+        Extracts research interests from a parsed profile page.
+        :param profile_url: profile URL
+        :param tree: parsed profile page
+        :return: list of research interests
+        """
+        pass
@@ -1,15 +1,22 @@
 import typing
 import logging
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
 
+from backend.core.populate_config import SCRAPER_CONFIG
 from backend.services.scraper.base_scraper import BaseScraper
 from backend.utils.institution_utils import InstitutionUtils
 
 logger = logging.getLogger(__name__)
 
 class ScraperService:
-    def __init__(self, scrapers: typing.List[BaseScraper]):
+    def __init__(self,
+                 scrapers: typing.List[BaseScraper],
+                 max_department_workers: int = SCRAPER_CONFIG["MAX_DEPARTMENT_WORKERS"],
+                 max_profile_workers: int = SCRAPER_CONFIG["MAX_PROFILE_WORKERS"]):
         self.scrapers = scrapers
+        self.max_department_workers = max_department_workers
+        self.max_profile_workers = max_profile_workers
 
     def get_school_faculty_data(self, school: str) -> typing.Dict[str, pd.DataFrame]:
         """
@@ -21,11 +28,9 @@ class ScraperService:
         logger.info(f"Fetching school faculty data for school: {school}")
 
         try:
-            school_data = {}
-            for dept in departments:
-                data = self.get_department_faculty_data(dept)
-                school_data[dept] = data
-            return school_data
+            with ThreadPoolExecutor(max_workers=self.max_department_workers) as executor:
+                department_data = executor.map(self.get_department_faculty_data, departments)
+                return dict(zip(departments, department_data))
         except Exception as e:
             logger.critical(f"Failed to fetch school faculty data for school: {school}: {e}")
             raise RuntimeError(f"Data generation failed for school: {school}") from e
@@ -46,24 +51,36 @@ class ScraperService:
         logger.info(f"Scraping faculty profile endpoints from {department} webpage")
         profile_endpoints = scraper.get_profile_endpoints_from_people(people_url)
 
-        faculty_data = []
-        for endpoint in profile_endpoints:
-            profile_url = InstitutionUtils.make_profile_url(school_base_url, endpoint)
-            name = scraper.get_name_from_profile(profile_url)
-            emails = ",".join(scraper.get_emails_from_profile(profile_url))
-            about = scraper.get_about_from_profile(profile_url)
-
-            faculty_data.append({
-                "Faculty_Name": name,
-                "School": school,
-                "Department": department,
-                "Email_Address": emails,
-                "About_Section": about,
-                "Profile_URL": profile_url,
-            })
+        profile_urls = [InstitutionUtils.make_profile_url(school_base_url, endpoint) for endpoint in profile_endpoints]
+        with ThreadPoolExecutor(max_workers=self.max_profile_workers) as executor:
+            faculty_data = list(executor.map(
+                lambda profile_url: self._scrape_faculty_profile(scraper, school, department, profile_url),
+                profile_urls
+            ))
 
         return pd.DataFrame(faculty_data)
 
+    @staticmethod
+    def _scrape_faculty_profile(scraper: BaseScraper, school: str, department: str, profile_url: str) -> typing.Dict:
+        """
+        Scrape a single faculty profile into a dataframe row
+        :param scraper: scraper for the department's school
+        :param school: school acronym
+        :param department: school department
+        :param profile_url: faculty profile URL
+        :return: dictionary containing the faculty name, email address, about section, and profile URL
+        """
+        profile = scraper.scrape_profile(profile_url)
+
+        return {
+            "Faculty_Name": profile["name"],
+            "School": school,
+            "Department": department,
+            "Email_Address": ",".join(profile["emails"]),
+            "About_Section": profile["about"],
+            "Profile_URL": profile_url,
+        }
+
     def _select_scraper(self, department: str) -> BaseScraper:
         """
         Select scraper based on department
@@ -0,0 +1,92 @@
+import datetime
+import json
+import typing
+from werkzeug.http import http_date
+
+FACULTY_FIELDS = ("name", "school", "department", "about", "emails", "profile_url", "has_funding", "projects")
+
+PROJECT_FIELDS = (
+    "project_number", "abstract", "relevant_terms", "start_date", "end_date", "agency_ic_admin", "activity_code"
+)
+
+FACULTY_FIELD_COLUMNS = {"emails": "email"} # search result fields named differently from their Faculty column
+
+
+class Projection(typing.NamedTuple):
+    """
+    Subset of the search result fields to serialize, and limits on the size of project lists and abstracts
+    """
+    fields: typing.Tuple[str, ...] = FACULTY_FIELDS
+    project_fields: typing.Tuple[str, ...] = PROJECT_FIELDS
+    max_projects: int | None = None
+    abstract_chars: int | None = None
+
+    def get_columns(self) -> typing.List[str]:
+        """
+        Get the Faculty columns needed to serialize the projected fields
+        :return: Faculty column names
+        """
+        return [FACULTY_FIELD_COLUMNS.get(field, field) for field in self.fields if field != "projects"]
+
+    def get_project_columns(self) -> typing.List[str]:
+        """
+        Get the Project columns needed to serialize the projected fields
+        :return: Project column names, empty if projects are not projected
+        """
+        return list(self.project_fields) if "projects" in self.fields else []
+
+
+def serialize_faculty(faculty: "Faculty", projection: Projection = None) -> typing.Dict:
+    """
+    Unpack Faculty into JSON
+    :param faculty: Faculty
+    :param projection: fields and limits to apply, every field of every project if None
+    :return: JSON
+    """
+    projection = projection or Projection()
+    serialized = {}
+    for field in projection.fields:
+        if field == "projects":
+            projects = faculty.projects[:projection.max_projects]
+            serialized[field] = [_serialize_project(project, projection) for project in projects]
+        elif field == "department":
+            serialized[field] = faculty.department.split(",")
+        elif field == "emails":
+            serialized[field] = faculty.email.split(",")
+        else:
+            serialized[field] = getattr(faculty, field)
+    return serialized
+
+
+def _serialize_project(project: "Project", projection: Projection) -> typing.Dict:
+    """Helper function to serialize the projected fields of a project, truncating its abstract."""
+    serialized = {field: getattr(project, field) for field in projection.project_fields}
+    if projection.abstract_chars is not None and serialized.get("abstract"):
+        serialized["abstract"] = serialized["abstract"][:projection.abstract_chars]
+    return serialized
+
+
+def make_faculty_document(faculty: "Faculty", projection: Projection = None) -> str:
+    """
+    Serialize Faculty into the JSON document sent in search results, formatted like Flask's jsonify
+    :param faculty: Faculty with its projects
+    :param projection: fields and limits to apply, every field of every project if None
+    :return: JSON document
+    """
+    return json.dumps(serialize_faculty(faculty, projection), default=_to_json, sort_keys=True, separators=(",", ":"))
+
+
+def make_results_body(documents: typing.List[str]) -> bytes:
+    """
+    Assemble a search response from precomputed faculty documents without parsing them
+    :param documents: JSON documents in ranked order
+    :return: JSON response body
+    """
+    return ('{"results":[' + ",".join(documents) + "]}").encode("utf-8")
+
+
+def _to_json(value: typing.Any) -> str:
+    """Helper function to serialize dates like Flask's JSON provider."""
+    if isinstance(value, datetime.date):
+        return http_date(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
@@ -1,11 +1,48 @@
+import asyncio
+import functools
 import typing
+from concurrent.futures import ThreadPoolExecutor
+from flask import current_app, has_app_context
+from backend.core.populate_config import ASYNC_SEARCH_CONFIG
 from backend.services.embedding.embedding_service import EmbeddingService
+from backend.services.embedding.preprocessor import Preprocessor
 from backend.services.database.database_driver import DatabaseDriver
+from backend.services.search.faculty_document import Projection, make_faculty_document
+from backend.utils.search_response_cache import SearchResponseCache
+from backend.utils.single_flight import SingleFlight
+
+class SearchDeadlineExceeded(TimeoutError):
+    """Raised when an async search does not finish within its deadline"""
+
 
 class SearchService:
-    def __init__(self, database_driver: DatabaseDriver, embedding_service: EmbeddingService):
+    def __init__(self,
+                 database_driver: DatabaseDriver,
+                 embedding_service: EmbeddingService,
+                 single_flight: SingleFlight = None,
+                 executor: ThreadPoolExecutor = None):
         self.database_driver = database_driver
         self.embedding_service = embedding_service
+        self.single_flight = single_flight or SingleFlight() # coalesces identical searches in progress
+        self.executor = executor or ThreadPoolExecutor( # runs the FAISS and database work of async searches
+            max_workers=ASYNC_SEARCH_CONFIG["EXECUTOR_WORKERS"], thread_name_prefix="search"
+        )
+        self.hedge_delay = ASYNC_SEARCH_CONFIG["HEDGE_DELAY"]
+
+    def preload(self):
+        """
+        Load the FAISS index and search metadata before the first search request
+        """
+        self.embedding_service.embedding_storage.preload()
+
+    def get_generation(self) -> int:
+        """
+        Get the index generation searches currently run against, picking up a newly published one
+        :return: generation ID
+        """
+        embedding_storage = self.embedding_service.embedding_storage
+        embedding_storage.refresh_if_stale()
+        return embedding_storage.get_snapshot().generation
 
     def search(self,
                query: str = None,
@@ -14,9 +51,11 @@ class SearchService:
                department: str = None,
                activity_code: str = None,
                agency_ic_admin: str = None,
-               has_funding: bool = None) -> typing.List["Faculty"]:
+               has_funding: bool = None,
+               projection: Projection = None) -> typing.List["Faculty"]:
         """
         Search for the most similar faculty based on a natural language query.
+        Concurrent searches with the same normalized query, k, filters, and projection share one computation.
         :param query: user natural language query
         :param k: number of faculty profiles to return
         :param school: school name
@@ -24,8 +63,93 @@ class SearchService:
         :param activity_code: activity code
         :param agency_ic_admin: agency ic admin name
         :param has_funding: has funding
+        :param projection: only load the columns of these result fields, all columns if None
         :return: list of Faculty
         """
+        filters = {
+            "school": school,
+            "department": department,
+            "activity_code": activity_code,
+            "agency_ic_admin": agency_ic_admin,
+            "has_funding": has_funding,
+        }
+        key = SearchResponseCache.make_key(Preprocessor.preprocess_query(query or ""), k, filters)
+        if projection is not None:
+            key = (key, projection)
+        return list(self.single_flight.do(key, self._search, query, k, projection=projection, **filters))
+
+    def search_documents(self,
+                         query: str = None,
+                         k: int = None,
+                         school: str = None,
+                         department: str = None,
+                         activity_code: str = None,
+                         agency_ic_admin: str = None,
+                         has_funding: bool = None) -> typing.List[str]:
+        """
+        Search like search(), returning the precomputed JSON document of each faculty instead of Faculty objects.
+        Concurrent searches with the same normalized query, k, and filters share one computation.
+        :param query: user natural language query
+        :param k: number of faculty profiles to return
+        :param school: school name
+        :param department: department name
+        :param activity_code: activity code
+        :param agency_ic_admin: agency ic admin name
+        :param has_funding: has funding
+        :return: list of faculty JSON documents
+        """
+        filters = {
+            "school": school,
+            "department": department,
+            "activity_code": activity_code,
+            "agency_ic_admin": agency_ic_admin,
+            "has_funding": has_funding,
+        }
+        key = SearchResponseCache.make_key(Preprocessor.preprocess_query(query or ""), k, filters)
+        return list(self.single_flight.do(("documents", key), self._search_documents, query, k, **filters))
+
+    def _search(self,
+                query: str = None,
+                k: int = None,
+                school: str = None,
+                department: str = None,
+                activity_code: str = None,
+                agency_ic_admin: str = None,
+                has_funding: bool = None,
+                projection: Projection = None) -> typing.List["Faculty"]:
+        """Helper function to embed, search, and hydrate a query, run once per group of identical searches."""
+        similar_embeddings_eids, generation = self._search_similar_embeddings(
+            query, k, school, department, activity_code, agency_ic_admin, has_funding
+        )
+        similar_faculty = self._get_faculty_records(similar_embeddings_eids, generation, projection)
+        return similar_faculty
+
+    def _search_documents(self,
+                          query: str = None,
+                          k: int = None,
+                          school: str = None,
+                          department: str = None,
+                          activity_code: str = None,
+                          agency_ic_admin: str = None,
+                          has_funding: bool = None) -> typing.List[str]:
+        """Helper function to embed, search, and load the documents of a query, run once per identical search."""
+        similar_embeddings_eids, generation = self._search_similar_embeddings(
+            query, k, school, department, activity_code, agency_ic_admin, has_funding
+        )
+        return self._get_faculty_documents(similar_embeddings_eids, generation)
+
+    def _search_similar_embeddings(self,
+                                   query: str = None,
+                                   k: int = None,
+                                   school: str = None,
+                                   department: str = None,
+                                   activity_code: str = None,
+                                   agency_ic_admin: str = None,
+                                   has_funding: bool = None) -> typing.Tuple[typing.List[int], int]:
+        """Helper function to search the current index generation, returning ranked embedding ids and its generation."""
+        embedding_storage = self.embedding_service.embedding_storage
+        embedding_storage.refresh_if_stale()
+        snapshot = embedding_storage.get_snapshot()
         similar_embeddings_eids = self.embedding_service.search_similar_embeddings(
             query=query,
             top_k=k,
@@ -33,16 +157,182 @@ class SearchService:
             department=department,
             activity_code=activity_code,
             agency_ic_admin=agency_ic_admin,
-            has_funding=has_funding
+            has_funding=has_funding,
+            snapshot=snapshot
         )
+        return similar_embeddings_eids, snapshot.generation
 
-        similar_faculty = [self._get_faculty_record(eid) for eid in similar_embeddings_eids]
-        return similar_faculty
+    async def search_async(self,
+                           query: str = None,
+                           k: int = None,
+                           school: str = None,
+                           department: str = None,
+                           activity_code: str = None,
+                           agency_ic_admin: str = None,
+                           has_funding: bool = None,
+                           deadline: float = None,
+                           projection: Projection = None) -> typing.List["Faculty"]:
+        """
+        Search like search() without blocking the event loop: the query embedding is awaited, with a hedged
+        request if it is slow, and the FAISS search and database lookup run in the executor.
+        :param query: user natural language query
+        :param k: number of faculty profiles to return
+        :param school: school name
+        :param department: department name
+        :param activity_code: activity code
+        :param agency_ic_admin: agency ic admin name
+        :param has_funding: has funding
+        :param deadline: seconds the search may take, ASYNC_SEARCH_CONFIG["DEADLINE"] if None
+        :param projection: only load the columns of these result fields, all columns if None
+        :return: list of Faculty
+        :raises SearchDeadlineExceeded: if the search takes longer than the deadline
+        """
+        if not query:
+            raise ValueError("Query must be a non-empty string")
+        deadline = deadline or ASYNC_SEARCH_CONFIG["DEADLINE"]
+        loop = asyncio.get_running_loop()
+        expires_at = loop.time() + deadline
+        try:
+            query_embedding = await asyncio.wait_for(
+                self.embedding_service.get_query_embedding_async(
+                    Preprocessor.preprocess_query(query), hedge_delay=self.hedge_delay
+                ),
+                timeout=deadline,
+            )
+            search = functools.partial(
+                self._search_embedding,
+                query_embedding,
+                k,
+                school=school,
+                department=department,
+                activity_code=activity_code,
+                agency_ic_admin=agency_ic_admin,
+                has_funding=has_funding,
+                projection=projection,
+            )
+            app = current_app._get_current_object() if has_app_context() else None
+            return await asyncio.wait_for(
+                loop.run_in_executor(self.executor, self._run_in_app_context, app, search),
+                timeout=max(expires_at - loop.time(), 0),
+            )
+        except asyncio.TimeoutError as e:
+            raise SearchDeadlineExceeded(f"Search did not finish within {deadline} seconds") from e
+
+    @staticmethod
+    def _run_in_app_context(app: typing.Optional["Flask"], fn: typing.Callable[[], typing.Any]) -> typing.Any:
+        """
+        Helper function to run executor work in a fresh app context with its own database session:
+        the work keeps running after its request times out and tears down the request's session.
+        """
+        if app is None:
+            return fn()
+        with app.app_context():
+            return fn()
+
+    def _search_embedding(self,
+                          query_embedding: typing.List[float],
+                          k: int = None,
+                          school: str = None,
+                          department: str = None,
+                          activity_code: str = None,
+                          agency_ic_admin: str = None,
+                          has_funding: bool = None,
+                          projection: Projection = None) -> typing.List["Faculty"]:
+        """Helper function to search and hydrate an embedded query."""
+        embedding_storage = self.embedding_service.embedding_storage
+        embedding_storage.refresh_if_stale()
+        snapshot = embedding_storage.get_snapshot()
+        similar_embeddings_eids = embedding_storage.search_similar_embeddings(
+            query_embedding=query_embedding,
+            top_k=k,
+            school=school,
+            department=department,
+            activity_code=activity_code,
+            agency_ic_admin=agency_ic_admin,
+            has_funding=has_funding,
+            snapshot=snapshot
+        )
+        return self._get_faculty_records(similar_embeddings_eids, snapshot.generation, projection)
+
+    def search_batch(self,
+                     queries: typing.List[str] = None,
+                     k: int = None,
+                     school: str = None,
+                     department: str = None,
+                     activity_code: str = None,
+                     agency_ic_admin: str = None,
+                     has_funding: bool = None) -> typing.List[typing.List["Faculty"]]:
+        """
+        Search for the most similar faculty of many natural language queries at once,
+        hydrating the faculty of every query with a single database query
+        :param queries: user natural language queries
+        :param k: number of faculty profiles to return per query
+        :param school: school name
+        :param department: department name
+        :param activity_code: activity code
+        :param agency_ic_admin: agency ic admin name
+        :param has_funding: has funding
+        :return: list of Faculty per query, in the same order as queries
+        """
+        embedding_storage = self.embedding_service.embedding_storage
+        embedding_storage.refresh_if_stale()
+        snapshot = embedding_storage.get_snapshot()
+        similar_embeddings_eids = self.embedding_service.search_similar_embeddings_batch(
+            queries=queries,
+            top_k=k,
+            school=school,
+            department=department,
+            activity_code=activity_code,
+            agency_ic_admin=agency_ic_admin,
+            has_funding=has_funding,
+            snapshot=snapshot
+        )
+
+        unique_eids = list(dict.fromkeys(eid for eids in similar_embeddings_eids for eid in eids))
+        faculty_by_eid = {
+            faculty.embedding_id: faculty
+            for faculty in self._get_faculty_records(unique_eids, snapshot.generation)
+        }
+        return [
+            [faculty_by_eid[eid] for eid in eids if eid in faculty_by_eid]
+            for eids in similar_embeddings_eids
+        ]
+
+    def _get_faculty_records(self,
+                             eids: typing.List[int],
+                             generation: int = None,
+                             projection: Projection = None) -> typing.List["Faculty"]:
+        """
+        Get faculty records by embedding ids with a single query
+        :param eids: embedding ids in ranked order
+        :param generation: generation of the searched index, so records match the index during a swap
+        :param projection: only load the columns of these result fields, all columns if None
+        :return: list of Faculty in ranked order
+        """
+        if projection is None:
+            return self.database_driver.get_faculty_by_embedding_ids(eids, generation)
+        return self.database_driver.get_faculty_by_embedding_ids(
+            eids, generation, columns=projection.get_columns(), project_columns=projection.get_project_columns()
+        )
 
-    def _get_faculty_record(self, eid: int) -> "Faculty":
+    def _get_faculty_documents(self, eids: typing.List[int], generation: int = None) -> typing.List[str]:
         """
-        Get faculty record by embedding id
-        :param eid: embedding id
-        :return: Faculty
+        Get the precomputed JSON documents of faculty by embedding ids with a single query,
+        serializing records populated before documents were stored
+        :param eids: embedding ids in ranked order
+        :param generation: generation of the searched index, so records match the index during a swap
+        :return: list of JSON documents in ranked order
         """
-        return self.database_driver.get_faculty_by_embedding_id(eid)
+        documents = self.database_driver.get_faculty_documents(eids, generation)
+        missing_eids = [eid for eid, document in documents if document is None]
+        if not missing_eids:
+            return [document for _, document in documents]
+        missing_documents = {
+            faculty.embedding_id: make_faculty_document(faculty)
+            for faculty in self._get_faculty_records(missing_eids, generation)
+        }
+        return [
+            document if document is not None else missing_documents[eid]
+            for eid, document in documents
+            if document is not None or eid in missing_documents
+        ]
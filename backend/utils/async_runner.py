@@ -0,0 +1,50 @@
+import asyncio
+import concurrent.futures
+import logging
+import os
+import threading
+import typing
+
+logger = logging.getLogger(__name__)
+
+class AsyncRunner:
+    """
+    Event loop in a daemon thread that runs coroutines submitted from any thread or event loop.
+    Long-lived async clients, whose connection pools belong to one event loop, are shared through it
+    by requests that each run on their own event loop.
+    """
+
+    def __init__(self, name: str = "async-runner"):
+        """
+        :param name: name of the event loop thread
+        """
+        self.name = name
+        self._loop = None
+        self._pid = None
+        self._lock = threading.Lock()
+
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        """Helper function to start the event loop thread on first use, and again in a forked worker."""
+        with self._lock:
+            if self._loop is None or self._pid != os.getpid():
+                self._loop = asyncio.new_event_loop()
+                self._pid = os.getpid()
+                threading.Thread(target=self._loop.run_forever, name=self.name, daemon=True).start()
+                logger.info(f"Started event loop thread {self.name}.")
+            return self._loop
+
+    def submit(self, coroutine: typing.Coroutine) -> concurrent.futures.Future:
+        """
+        Schedule a coroutine on the event loop thread
+        :param coroutine: coroutine to run
+        :return: future of its result, cancelling it cancels the coroutine
+        """
+        return asyncio.run_coroutine_threadsafe(coroutine, self._get_loop())
+
+    async def run(self, coroutine: typing.Coroutine) -> typing.Any:
+        """
+        Run a coroutine on the event loop thread and await its result from the calling event loop
+        :param coroutine: coroutine to run
+        :return: result of the coroutine
+        """
+        return await asyncio.wrap_future(self.submit(coroutine))
@@ -0,0 +1,73 @@
+import gzip
+import typing
+from flask import Response, request
+from backend.core.populate_config import RESPONSE_COMPRESSION_CONFIG
+
+try:
+    import brotli
+except ImportError: # brotli is optional, responses are gzipped without it
+    brotli = None
+
+def compress_response(response: Response, response_cache: "SearchResponseCache" = None) -> Response:
+    """
+    Compress a response body with brotli or gzip, whichever the client accepts and prefers.
+    Meant to be registered with after_request, after conditional requests were answered.
+    :param response: Flask response
+    :param response_cache: cache of compressed bodies by ETag, every response is compressed again if None
+    :return: the same response, compressed if worthwhile
+    """
+    if not RESPONSE_COMPRESSION_CONFIG["ENABLED"] or not _is_compressible(response):
+        return response
+    response.vary.add("Accept-Encoding")
+
+    encoding = request.accept_encodings.best_match(get_supported_encodings())
+    if encoding is None:
+        return response
+    etag, weak = response.get_etag()
+    data = None
+    if response_cache is not None and etag and not weak:
+        data = response_cache.get_variant(etag, encoding)
+    if data is None:
+        data = compress(response.get_data(), encoding)
+        if response_cache is not None and etag and not weak:
+            response_cache.put_variant(etag, encoding, data)
+    response.set_data(data)
+    response.headers["Content-Encoding"] = encoding
+
+    # the compressed body is another representation of the same resource, so like nginx keep the ETag but mark it weak
+    if etag and not weak:
+        response.set_etag(etag, weak=True)
+    return response
+
+
+def get_supported_encodings() -> typing.List[str]:
+    """
+    Get the content encodings the server can produce, in order of preference
+    :return: encodings
+    """
+    return ["br", "gzip"] if brotli is not None else ["gzip"]
+
+
+def compress(data: bytes, encoding: str) -> bytes:
+    """
+    Compress data with a content encoding
+    :param data: data to compress
+    :param encoding: "br" or "gzip"
+    :return: compressed data
+    """
+    if encoding == "br":
+        return brotli.compress(data, quality=RESPONSE_COMPRESSION_CONFIG["BROTLI_QUALITY"])
+    if encoding == "gzip":
+        return gzip.compress(data, compresslevel=RESPONSE_COMPRESSION_CONFIG["GZIP_LEVEL"])
+    raise ValueError(f"Unsupported content encoding: {encoding}")
+
+
+def _is_compressible(response: Response) -> bool:
+    """Helper function to check whether a response has a body worth compressing."""
+    return (
+        response.status_code == 200
+        and not response.direct_passthrough
+        and "Content-Encoding" not in response.headers
+        and response.mimetype in RESPONSE_COMPRESSION_CONFIG["MIMETYPES"]
+        and (response.content_length or 0) >= RESPONSE_COMPRESSION_CONFIG["MIN_SIZE"]
+    )
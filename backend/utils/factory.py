@@ -3,19 +3,53 @@ def get_openai_client():
     from openai import OpenAI
     return OpenAI(api_key=Config.OPENAI_API_KEY)
 
-def get_embedding_generator():
+def get_async_openai_client():
+    from backend.core.config import Config
+    from openai import AsyncOpenAI
+    return AsyncOpenAI(api_key=Config.OPENAI_API_KEY)
+
+def get_embedding_cache():
+    from backend.services.embedding.embedding_cache import EmbeddingCache
+    return EmbeddingCache()
+
+def get_query_cache():
+    from backend.core.populate_config import QUERY_CACHE_CONFIG
+    from backend.utils.lru_cache import LRUCache
+    return LRUCache(QUERY_CACHE_CONFIG["MAX_ENTRIES"], ttl=QUERY_CACHE_CONFIG["TTL"])
+
+def get_query_disk_cache():
+    from backend.core.populate_config import QUERY_CACHE_CONFIG, QUERY_CACHE_PATH
+    from backend.services.embedding.embedding_cache import EmbeddingCache
+    if not QUERY_CACHE_CONFIG["DISK_ENABLED"]:
+        return None
+    return EmbeddingCache(path=QUERY_CACHE_PATH, max_entries=QUERY_CACHE_CONFIG["DISK_MAX_ENTRIES"])
+
+def get_search_response_cache():
+    from backend.core.populate_config import SEARCH_RESPONSE_CACHE_CONFIG
+    from backend.utils.search_response_cache import SearchResponseCache
+    if not SEARCH_RESPONSE_CACHE_CONFIG["ENABLED"]:
+        return None
+    return SearchResponseCache()
+
+def get_embedding_generator(embedding_cache: "EmbeddingCache" = None, async_client: "AsyncOpenAI" = None):
     from backend.services.embedding.embedding_service import EmbeddingGenerator
-    return EmbeddingGenerator(get_openai_client())
+    return EmbeddingGenerator(get_openai_client(), embedding_cache=embedding_cache, async_client=async_client)
 
 def get_embedding_storage(app: "Flask"):
     from backend.services.embedding.embedding_storage import EmbeddingStorage
     return EmbeddingStorage(get_database_driver(app))
 
-def get_embedding_service(app: "Flask"):
+def get_embedding_service(app: "Flask",
+                          embedding_cache: "EmbeddingCache" = None,
+                          query_cache: "LRUCache" = None,
+                          query_disk_cache: "EmbeddingCache" = None,
+                          async_client: "AsyncOpenAI" = None):
     from backend.services.embedding.embedding_service import EmbeddingService
     return EmbeddingService(
-        embedding_generator=get_embedding_generator(),
+        embedding_generator=get_embedding_generator(embedding_cache, async_client=async_client),
         embedding_storage=get_embedding_storage(app),
+        query_cache=query_cache,
+        query_disk_cache=query_disk_cache,
     )
 
 def get_database_driver(app: "Flask"):
@@ -24,6 +58,11 @@ def get_database_driver(app: "Flask"):
 
 def get_search_service(app: "Flask"):
     from backend.services.search.search_service import SearchService
-    embedding_service = get_embedding_service(app)
+    embedding_service = get_embedding_service(
+        app,
+        query_cache=get_query_cache(),
+        query_disk_cache=get_query_disk_cache(),
+        async_client=get_async_openai_client(),
+    )
     database_driver = embedding_service.embedding_storage.database_driver
     return SearchService(database_driver, embedding_service)
\ No newline at end of file
@@ -0,0 +1,25 @@
+import hashlib
+
+def content_hash(*parts: str) -> str:
+    """
+    Calculate a stable hex digest over the provided parts.
+    :param parts: strings to hash, order sensitive
+    :return: SHA-256 hex digest
+    """
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update((part or "").encode("utf-8"))
+        digest.update(b"\x00")
+    return digest.hexdigest()
+
+def stable_id(*parts: str) -> int:
+    """
+    Derive a stable, non-negative 63-bit integer ID from the provided parts.
+    :param parts: strings identifying the record, order sensitive
+    :return: integer ID usable as a FAISS vector ID
+    """
+    digest = hashlib.blake2b(digest_size=8)
+    for part in parts:
+        digest.update((part or "").encode("utf-8"))
+        digest.update(b"\x00")
+    return int.from_bytes(digest.digest(), "big") & 0x7FFFFFFFFFFFFFFF
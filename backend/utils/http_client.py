@@ -1,27 +1,80 @@
+import random
 import requests
 import logging
+import threading
+import time
 import typing
-from requests.exceptions import RequestException, Timeout, HTTPError
+from contextlib import contextmanager
+from urllib.parse import urlparse
+from requests.adapters import HTTPAdapter
+from requests.exceptions import RequestException, Timeout, HTTPError, ConnectionError
 from backend.utils.institution_utils import InstitutionUtils
+from backend.utils.response_cache import ResponseCache
 
 logger = logging.getLogger(__name__)
 
 class HttpClient:
-    def __init__(self, timeout: int = 10, retries: int = 3):
+    CACHEABLE_METHODS = {"GET", "POST"}
+
+    def __init__(self,
+                 timeout: int = 10,
+                 retries: int = 3,
+                 max_concurrency_per_host: int = None,
+                 politeness_delay: float = 0.0,
+                 pool_connections: int = 10,
+                 pool_maxsize: int = 10,
+                 host_pool_maxsizes: typing.Dict[str, int] = None,
+                 backoff_factor: float = 0.5,
+                 max_backoff: float = 30.0,
+                 response_cache: ResponseCache = None):
         """
         Initializes the HTTP client facade.
         :param timeout (int): Timeout in seconds for requests.
         :param retries (int): Number of retries for transient errors.
+        :param max_concurrency_per_host (int): Maximum number of in-flight requests per host, unlimited if None.
+        :param politeness_delay (float): Minimum seconds between the start of two requests to the same host.
+        :param pool_connections (int): Number of per-host connection pools kept alive.
+        :param pool_maxsize (int): Maximum number of keep-alive connections per host.
+        :param host_pool_maxsizes (dict): Per-host overrides of pool_maxsize, keyed by host name.
+        :param backoff_factor (float): Base delay in seconds of the exponential backoff between retries.
+        :param max_backoff (float): Upper bound in seconds of a single backoff delay.
+        :param response_cache (ResponseCache): Optional on-disk cache of successful responses.
         """
         self.timeout = timeout
         self.retries = retries
+        self.max_concurrency_per_host = max_concurrency_per_host
+        self.politeness_delay = politeness_delay
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.response_cache = response_cache
+        self._host_semaphores = {}
+        self._host_next_request_times = {}
+        self._throttle_lock = threading.Lock()
+        self.session = self._create_session(pool_connections, pool_maxsize, host_pool_maxsizes or {})
+
+    @staticmethod
+    def _create_session(pool_connections: int,
+                        pool_maxsize: int,
+                        host_pool_maxsizes: typing.Dict[str, int]) -> requests.Session:
+        """Helper function to create a keep-alive session with pooled connections."""
+        session = requests.Session()
+        default_adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+        session.mount("http://", default_adapter)
+        session.mount("https://", default_adapter)
+        for host, host_pool_maxsize in host_pool_maxsizes.items():
+            host_adapter = HTTPAdapter(pool_connections=1, pool_maxsize=host_pool_maxsize)
+            session.mount(f"http://{host}", host_adapter)
+            session.mount(f"https://{host}", host_adapter)
+        return session
 
     def request(self, method: str, url: str, **kwargs: typing.Any) -> requests.Response | None:
         """
-        Makes an HTTP request with retries.
+        Makes an HTTP request over the pooled session, retrying transient errors with exponential backoff and jitter.
+        When a response cache is configured, fresh cached responses are returned without a request
+        and stale ones are revalidated with a conditional request.
         :param method: HTTP method (e.g., 'GET', 'POST', 'PUT', 'DELETE').
         :param url: API endpoint (relative or absolute URL).
-        :param kwargs: Additional arguments to pass to `requests.request`, such as `json`, `headers`, or `params`.
+        :param kwargs: Additional arguments to pass to `requests.Session.request`, such as `json`, `headers`, or `params`.
         :return requests.Response: The HTTP response object.
         :raise HTTPError: For non-2xx HTTP responses.
         :raise Timeout: If the request times out.
@@ -30,20 +83,116 @@ class HttpClient:
         if not InstitutionUtils.is_valid_url(url):
             raise ValueError(f"Invalid URL: {url}")
 
+        if self.response_cache is None or method.upper() not in self.CACHEABLE_METHODS:
+            return self._send(method, url, **kwargs)
+
+        cache_key = self.response_cache.make_key(method, url, kwargs)
+        cached_entry = self.response_cache.get(cache_key)
+        if cached_entry and self.response_cache.is_fresh(cached_entry):
+            logger.info(f"Serving {method} {url} from response cache")
+            self.response_cache.record_hit()
+            return self.response_cache.to_response(cached_entry)
+
+        if cached_entry:
+            kwargs["headers"] = {**(kwargs.get("headers") or {}), **self.response_cache.get_conditional_headers(cached_entry)}
+
+        response = self._send(method, url, **kwargs)
+        if cached_entry and response.status_code == 304:
+            logger.info(f"Revalidated cached response for {method} {url}")
+            self.response_cache.refresh(cache_key)
+            self.response_cache.record_hit(revalidated=True)
+            return self.response_cache.to_response(cached_entry)
+
+        self.response_cache.record_miss()
+        self.response_cache.put(cache_key, response)
+        return response
+
+    def _send(self, method: str, url: str, **kwargs: typing.Any) -> requests.Response | None:
+        """Helper function to send a request with retries."""
         for attempt in range(self.retries):
             try:
                 logger.info(f"Making {method} request to {url} (attempt {attempt + 1}/{self.retries})")
-                response = requests.request(method, url, timeout=self.timeout, **kwargs)
+                with self._throttle(url):
+                    response = self.session.request(method, url, timeout=self.timeout, **kwargs)
                 response.raise_for_status()
                 return response
-            except (Timeout, HTTPError) as e:
+            except (Timeout, HTTPError, ConnectionError) as e:
                 logger.warning(f"Attempt {attempt + 1} of {self.retries} failed for {url}: {e}")
                 if attempt == self.retries - 1:
                     raise
+                time.sleep(self._get_backoff_delay(attempt))
             except RequestException as e:
                 logger.error(f"Request error for {url}: {e}")
                 raise
 
+    def _get_backoff_delay(self, attempt: int) -> float:
+        """
+        Exponential backoff with full jitter
+        :param attempt: zero-based number of the failed attempt
+        :return: seconds to wait before the next attempt
+        """
+        return random.uniform(0, min(self.max_backoff, self.backoff_factor * 2 ** attempt))
+
+    def get_connection_stats(self) -> typing.Dict[str, typing.Dict[str, int]]:
+        """
+        Report connection reuse of the pooled session
+        :return: dictionary mapping host to its request, new connection, and reused connection counts
+        """
+        stats = {}
+        adapters = {id(adapter): adapter for adapter in self.session.adapters.values()}.values()
+        for adapter in adapters:
+            pools = adapter.poolmanager.pools
+            for pool_key in pools.keys():
+                pool = pools[pool_key]
+                host_stats = stats.setdefault(pool.host, {"requests": 0, "connections": 0, "reused": 0})
+                host_stats["requests"] += pool.num_requests
+                host_stats["connections"] += pool.num_connections
+                host_stats["reused"] += max(pool.num_requests - pool.num_connections, 0)
+        return stats
+
+    def close(self):
+        """
+        Close the pooled session and its keep-alive connections
+        """
+        self.session.close()
+
+    @contextmanager
+    def _throttle(self, url: str):
+        """
+        Hold a per-host concurrency slot and wait out the politeness delay for the duration of a request
+        :param url: request URL
+        """
+        host = urlparse(url).netloc
+        semaphore = self._get_host_semaphore(host)
+        if semaphore:
+            semaphore.acquire()
+        try:
+            self._wait_for_host_turn(host)
+            yield
+        finally:
+            if semaphore:
+                semaphore.release()
+
+    def _get_host_semaphore(self, host: str) -> threading.BoundedSemaphore | None:
+        """Helper function to get or create the concurrency limiter of a host."""
+        if not self.max_concurrency_per_host:
+            return None
+        with self._throttle_lock:
+            if host not in self._host_semaphores:
+                self._host_semaphores[host] = threading.BoundedSemaphore(self.max_concurrency_per_host)
+            return self._host_semaphores[host]
+
+    def _wait_for_host_turn(self, host: str):
+        """Helper function to space out request starts to a host by the politeness delay."""
+        if not self.politeness_delay:
+            return
+        with self._throttle_lock:
+            now = time.monotonic()
+            request_time = max(now, self._host_next_request_times.get(host, now))
+            self._host_next_request_times[host] = request_time + self.politeness_delay
+        if request_time > now:
+            time.sleep(request_time - now)
+
     def get(self, url: str, **kwargs: typing.Any) -> requests.Response:
         """
         Convenience method for GET requests.
@@ -0,0 +1,77 @@
+import threading
+import time
+import typing
+from collections import OrderedDict
+
+class LRUCache:
+    """
+    Thread-safe in-memory cache with least recently used eviction beyond max_entries
+    and expiry of entries older than ttl seconds.
+    """
+
+    def __init__(self, max_entries: int, ttl: float = None):
+        """
+        :param max_entries: maximum number of entries kept in memory
+        :param ttl: seconds an entry stays valid, entries never expire if None
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: typing.Hashable) -> typing.Any:
+        """
+        Look up a cached value and mark it as most recently used
+        :param key: cache key
+        :return: cached value or None if missing or expired
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self._is_expired(entry):
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: typing.Hashable, value: typing.Any):
+        """
+        Store a value and evict the least recently used entries beyond max_entries
+        :param key: cache key
+        :param value: value to cache
+        """
+        with self._lock:
+            self._entries[key] = (value, time.monotonic())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """
+        Drop every entry
+        """
+        with self._lock:
+            self._entries.clear()
+
+    def _is_expired(self, entry: typing.Tuple[typing.Any, float]) -> bool:
+        """Helper function to check whether an entry is older than the TTL."""
+        return self.ttl is not None and time.monotonic() - entry[1] >= self.ttl
+
+    def stats(self) -> typing.Dict[str, typing.Any]:
+        """
+        Report cache counters
+        :return: hits, misses, hit rate, and number of entries
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "entries": len(self._entries),
+            }
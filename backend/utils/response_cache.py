@@ -0,0 +1,245 @@
+import json
+import logging
+import sqlite3
+import threading
+import time
+import typing
+from urllib.parse import urlencode, urlparse
+import requests
+from requests.structures import CaseInsensitiveDict
+from backend.core.populate_config import HTTP_CACHE_CONFIG, HTTP_CACHE_PATH
+from backend.utils.hash_utils import content_hash
+
+logger = logging.getLogger(__name__)
+
+class ResponseCache:
+    """
+    Disk-backed HTTP response cache keyed on method, URL, and a hash of the request body.
+    Entries are fresh for a per-host TTL, then revalidated with their ETag / Last-Modified validators.
+    Least recently used entries are evicted once the stored bodies grow past max_bytes.
+    """
+    STRIPPED_HEADERS = {"content-encoding", "content-length", "transfer-encoding", "connection"}
+
+    def __init__(self,
+                 path: str = HTTP_CACHE_PATH,
+                 max_bytes: int = HTTP_CACHE_CONFIG["MAX_BYTES"],
+                 default_ttl: float = HTTP_CACHE_CONFIG["DEFAULT_TTL"],
+                 host_ttls: typing.Dict[str, float] = None):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self.host_ttls = HTTP_CACHE_CONFIG["HOST_TTLS"] if host_ttls is None else host_ttls
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, "
+            "url TEXT NOT NULL, "
+            "status_code INTEGER NOT NULL, "
+            "headers TEXT NOT NULL, "
+            "content BLOB NOT NULL, "
+            "etag TEXT, "
+            "last_modified TEXT, "
+            "stored_at REAL NOT NULL, "
+            "last_accessed REAL NOT NULL, "
+            "size INTEGER NOT NULL)"
+        )
+        self._connection.execute("CREATE INDEX IF NOT EXISTS responses_last_accessed ON responses (last_accessed)")
+        self._connection.commit()
+        logger.info(f"Initialized ResponseCache at {path} with max_bytes={max_bytes}")
+
+    @staticmethod
+    def make_key(method: str, url: str, request_kwargs: typing.Dict[str, typing.Any]) -> str:
+        """
+        Build the cache key for a request
+        :param method: HTTP method
+        :param url: request URL
+        :param request_kwargs: keyword arguments of the request, whose params, json, and data are part of the key
+        :return: cache key
+        """
+        params = request_kwargs.get("params")
+        body = request_kwargs.get("json")
+        body = json.dumps(body, sort_keys=True) if body is not None else request_kwargs.get("data")
+        if isinstance(body, bytes):
+            body = body.decode("utf-8", errors="replace")
+        if isinstance(params, dict):
+            params = urlencode(sorted(params.items()), doseq=True)
+        return content_hash(
+            method.upper(),
+            url,
+            str(params) if params else "",
+            content_hash(str(body)) if body is not None else "",
+        )
+
+    def get(self, key: str) -> typing.Dict[str, typing.Any] | None:
+        """
+        Look up a cached response
+        :param key: cache key
+        :return: cached entry or None
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT url, status_code, headers, content, etag, last_modified, stored_at "
+                "FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._connection.execute("UPDATE responses SET last_accessed = ? WHERE key = ?", (time.time(), key))
+            self._connection.commit()
+
+        url, status_code, headers, content, etag, last_modified, stored_at = row
+        return {
+            "url": url,
+            "status_code": status_code,
+            "headers": json.loads(headers),
+            "content": content,
+            "etag": etag,
+            "last_modified": last_modified,
+            "stored_at": stored_at,
+        }
+
+    def is_fresh(self, entry: typing.Dict[str, typing.Any]) -> bool:
+        """
+        Check whether a cached entry is within the TTL of its host
+        :param entry: cached entry
+        :return: True if the entry can be served without revalidation
+        """
+        host = urlparse(entry["url"]).hostname
+        ttl = self.host_ttls.get(host, self.default_ttl)
+        return time.time() - entry["stored_at"] < ttl
+
+    @staticmethod
+    def get_conditional_headers(entry: typing.Dict[str, typing.Any]) -> typing.Dict[str, str]:
+        """
+        Build revalidation headers for a cached entry
+        :param entry: cached entry
+        :return: If-None-Match / If-Modified-Since headers, empty if the entry has no validators
+        """
+        headers = {}
+        if entry["etag"]:
+            headers["If-None-Match"] = entry["etag"]
+        if entry["last_modified"]:
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def record_hit(self, revalidated: bool = False):
+        """
+        Count a response served from the cache
+        :param revalidated: True if the entry was confirmed by a 304 Not Modified response
+        """
+        with self._lock:
+            self.hits += 1
+            if revalidated:
+                self.revalidations += 1
+
+    def record_miss(self):
+        """
+        Count a response that had to be downloaded in full
+        """
+        with self._lock:
+            self.misses += 1
+
+    def refresh(self, key: str):
+        """
+        Restart the TTL of an entry confirmed by a 304 Not Modified response
+        :param key: cache key
+        """
+        now = time.time()
+        with self._lock:
+            self._connection.execute(
+                "UPDATE responses SET stored_at = ?, last_accessed = ? WHERE key = ?", (now, now, key)
+            )
+            self._connection.commit()
+
+    def put(self, key: str, response: requests.Response):
+        """
+        Store a response and evict the least recently used entries beyond max_bytes
+        :param key: cache key
+        :param response: successful HTTP response
+        """
+        now = time.time()
+        headers = {
+            name: value for name, value in response.headers.items()
+            if name.lower() not in self.STRIPPED_HEADERS
+        }
+        content = response.content
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(key, url, status_code, headers, content, etag, last_modified, stored_at, last_accessed, size) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    response.url,
+                    response.status_code,
+                    json.dumps(headers),
+                    content,
+                    response.headers.get("ETag"),
+                    response.headers.get("Last-Modified"),
+                    now,
+                    now,
+                    len(content),
+                )
+            )
+            self._evict()
+            self._connection.commit()
+
+    def _evict(self):
+        """Helper function to drop least recently used entries until the stored bodies fit in max_bytes."""
+        (total_bytes,) = self._connection.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()
+        if total_bytes <= self.max_bytes:
+            return
+        evicted_count = 0
+        for key, size in self._connection.execute(
+            "SELECT key, size FROM responses ORDER BY last_accessed ASC"
+        ).fetchall():
+            if total_bytes <= self.max_bytes:
+                break
+            self._connection.execute("DELETE FROM responses WHERE key = ?", (key,))
+            total_bytes -= size
+            evicted_count += 1
+        logger.info(f"Evicted {evicted_count} entries from response cache.")
+
+    @staticmethod
+    def to_response(entry: typing.Dict[str, typing.Any]) -> requests.Response:
+        """
+        Rebuild a requests.Response from a cached entry
+        :param entry: cached entry
+        :return: response object
+        """
+        response = requests.Response()
+        response.status_code = entry["status_code"]
+        response.headers = CaseInsensitiveDict(entry["headers"])
+        response._content = entry["content"]
+        response.url = entry["url"]
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        return response
+
+    def stats(self) -> typing.Dict[str, typing.Any]:
+        """
+        Report cache counters
+        :return: hits, revalidations, misses, hit rate, number of entries, and stored bytes
+        """
+        with self._lock:
+            entries, total_bytes = self._connection.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "revalidations": self.revalidations,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "entries": entries,
+                "bytes": total_bytes,
+            }
+
+    def close(self):
+        """
+        Close the underlying database connection
+        """
+        with self._lock:
+            self._connection.close()
@@ -0,0 +1,117 @@
+import logging
+import threading
+import typing
+from backend.core.populate_config import SEARCH_RESPONSE_CACHE_CONFIG
+from backend.utils.hash_utils import content_hash
+from backend.utils.lru_cache import LRUCache
+
+logger = logging.getLogger(__name__)
+
+class CachedResponse(typing.NamedTuple):
+    body: bytes
+    etag: str
+
+
+class SearchResponseCache:
+    """
+    In-memory cache of serialized search responses keyed on the normalized query, limit, and filters.
+    Entries belong to one index generation and are dropped as soon as a newer generation is searched.
+    """
+
+    def __init__(self,
+                 max_entries: int = SEARCH_RESPONSE_CACHE_CONFIG["MAX_ENTRIES"],
+                 ttl: float = SEARCH_RESPONSE_CACHE_CONFIG["TTL"]):
+        """
+        :param max_entries: maximum number of responses kept in memory
+        :param ttl: seconds a response stays valid within its generation
+        """
+        self.generation = None
+        self._cache = LRUCache(max_entries, ttl=ttl)
+        self._variants = LRUCache(max_entries, ttl=ttl) # compressed bodies keyed on ETag and content encoding
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(query: str, limit: int, filters: typing.Dict[str, typing.Any]) -> typing.Tuple:
+        """
+        Build the cache key of a search, ignoring the order and duplicates of repeated filter values
+        :param query: normalized search query
+        :param limit: number of results
+        :param filters: filter values by name, lists for repeatable filters
+        :return: hashable key
+        """
+        normalized_filters = tuple(
+            (name, tuple(sorted(set(value))) if isinstance(value, list) else value)
+            for name, value in sorted(filters.items())
+        )
+        return query, limit, normalized_filters
+
+    def get(self, generation: int, key: typing.Tuple) -> CachedResponse | None:
+        """
+        Look up the response of a search against an index generation
+        :param generation: index generation searches currently run against
+        :param key: key from make_key()
+        :return: cached response or None
+        """
+        self._set_generation(generation)
+        return self._cache.get(key)
+
+    def put(self, generation: int, key: typing.Tuple, body: bytes) -> CachedResponse:
+        """
+        Cache a serialized search response, unless a newer generation was searched in the meantime
+        :param generation: index generation the response was computed for
+        :param key: key from make_key()
+        :param body: serialized response
+        :return: cached response with its ETag
+        """
+        response = CachedResponse(body, self.make_etag(generation, body))
+        with self._lock:
+            if generation == self.generation:
+                self._cache.put(key, response)
+        return response
+
+    def get_variant(self, etag: str, encoding: str) -> bytes | None:
+        """
+        Look up a compressed body of a cached response
+        :param etag: ETag of the cached response
+        :param encoding: content encoding, e.g. "gzip"
+        :return: compressed body or None
+        """
+        return self._variants.get((etag, encoding))
+
+    def put_variant(self, etag: str, encoding: str, body: bytes):
+        """
+        Cache a compressed body of a cached response, so cache hits do not compress it again
+        :param etag: ETag of the cached response
+        :param encoding: content encoding, e.g. "gzip"
+        :param body: compressed body
+        """
+        self._variants.put((etag, encoding), body)
+
+    @staticmethod
+    def make_etag(generation: int, body: bytes) -> str:
+        """
+        Derive the ETag of a response from its generation and content
+        :param generation: index generation
+        :param body: serialized response
+        :return: unquoted ETag
+        """
+        return f"g{generation}-{content_hash(body.decode('utf-8'))[:32]}"
+
+    def _set_generation(self, generation: int):
+        """Helper function to drop every entry when searches move to a different index generation."""
+        with self._lock:
+            if generation == self.generation:
+                return
+            if self.generation is not None:
+                logger.info(f"Index generation changed from {self.generation} to {generation}; "
+                            f"clearing search response cache.")
+                self._cache.clear()
+                self._variants.clear()
+            self.generation = generation
+
+    def stats(self) -> typing.Dict[str, typing.Any]:
+        """
+        Report cache counters
+        :return: hits, misses, hit rate, number of entries, and cached generation
+        """
+        return {**self._cache.stats(), "generation": self.generation}
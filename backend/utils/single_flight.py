@@ -0,0 +1,69 @@
+import threading
+import typing
+
+class _Call:
+    """In-progress call whose result or exception is shared with the callers waiting on it"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    Thread-safe de-duplication of concurrent calls: while a call for a key is in progress,
+    callers with the same key wait for it and share its result or exception instead of repeating it.
+    """
+
+    def __init__(self):
+        self.calls = 0
+        self.shared_calls = 0
+        self._in_flight = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: typing.Hashable, function: typing.Callable, *args, **kwargs) -> typing.Any:
+        """
+        Call function, or wait for the call in progress with the same key
+        :param key: identity of the call
+        :param function: function to call
+        :return: result of the call
+        """
+        with self._lock:
+            call = self._in_flight.get(key)
+            is_leader = call is None
+            if is_leader:
+                call = _Call()
+                self._in_flight[key] = call
+                self.calls += 1
+            else:
+                self.shared_calls += 1
+
+        if not is_leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = function(*args, **kwargs)
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+            call.done.set()
+
+    def stats(self) -> typing.Dict[str, typing.Any]:
+        """
+        Report call counters
+        :return: calls made, calls that shared another call's result, and calls in progress
+        """
+        with self._lock:
+            return {
+                "calls": self.calls,
+                "shared_calls": self.shared_calls,
+                "in_flight": len(self._in_flight),
+            }
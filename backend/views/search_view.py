@@ -1,78 +1,319 @@
 import typing
 import logging
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, current_app, request, jsonify
+from backend.core.populate_config import (
+    SEARCH_RESPONSE_CACHE_CONFIG, SEARCH_BATCH_CONFIG, SEARCH_PROJECTION_CONFIG, ASYNC_SEARCH_CONFIG
+)
+from backend.services.embedding.preprocessor import Preprocessor
+from backend.services.search.faculty_document import (
+    FACULTY_FIELDS, PROJECT_FIELDS, Projection, make_faculty_document, make_results_body, serialize_faculty
+)
+from backend.utils.compression import compress_response
+from backend.services.search.search_service import SearchDeadlineExceeded
 
 logger = logging.getLogger(__name__)
 
-def create_search_blueprint(search_service: "SearchService"):
+def create_search_blueprint(search_service: "SearchService", response_cache: "SearchResponseCache" = None):
     search_bp = Blueprint('search', __name__)
+    search_bp.after_request(compress_response)
 
     @search_bp.route("/search", methods=["GET"])
     def search_route():
         """
         API endpoint for faculty search
         """
-        return search(search_service)
+        return search(search_service, response_cache)
+
+    @search_bp.route("/search/async", methods=["GET"])
+    async def search_async_route():
+        """
+        API endpoint for faculty search with a deadline
+        """
+        return await search_async(search_service, response_cache)
+
+    @search_bp.route("/search/batch", methods=["POST"])
+    def search_batch_route():
+        """
+        API endpoint for faculty search with many queries
+        """
+        return search_batch(search_service)
 
     return search_bp
 
 
-def search(search_service: "SearchService"):
+def search(search_service: "SearchService", response_cache: "SearchResponseCache" = None):
     """
     Entry point for faculty search
     :param search_service: SearchService instance
+    :param response_cache: cache of serialized responses, every search runs the full pipeline if None
+    """
+    query, limit, filters = get_search_args()
+    try:
+        projection = get_projection_args()
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    if response_cache is None:
+        return current_app.response_class(
+            get_results_body(search_service, query, limit, filters, projection), mimetype="application/json"
+        )
+
+    generation = search_service.get_generation()
+    key = make_search_key(response_cache, query, limit, filters, projection)
+    cached_response = response_cache.get(generation, key)
+    if cached_response is None:
+        body = get_results_body(search_service, query, limit, filters, projection)
+        cached_response = response_cache.put(generation, key, body)
+    return make_cached_response(cached_response, response_cache)
+
+
+def get_results_body(search_service: "SearchService",
+                     query: str,
+                     limit: int,
+                     filters: typing.Dict[str, typing.Any],
+                     projection: Projection = None) -> bytes:
+    """
+    Run a search and serialize its results, from the precomputed faculty documents unless fields are projected
+    :param search_service: SearchService instance
+    :param query: search query
+    :param limit: number of results
+    :param filters: filter values by name
+    :param projection: fields and limits to apply, the full documents if None
+    :return: JSON response body
+    """
+    if projection is None:
+        return make_results_body(search_service.search_documents(query=query, k=limit, **filters))
+    results = search_service.search(query=query, k=limit, projection=projection, **filters)
+    return make_results_body([make_faculty_document(faculty, projection) for faculty in results])
+
+
+def make_search_key(response_cache: "SearchResponseCache",
+                    query: str,
+                    limit: int,
+                    filters: typing.Dict[str, typing.Any],
+                    projection: Projection = None) -> typing.Tuple:
+    """
+    Build the response cache key of a search, shared by the sync and async endpoints
+    :param response_cache: cache of serialized responses
+    :param query: search query
+    :param limit: number of results
+    :param filters: filter values by name
+    :param projection: fields and limits to apply
+    :return: hashable key
+    """
+    return response_cache.make_key(
+        Preprocessor.preprocess_query(query or ""), limit, {**filters, "projection": projection}
+    )
+
+
+async def search_async(search_service: "SearchService", response_cache: "SearchResponseCache" = None):
+    """
+    Entry point for faculty search that awaits the embeddings API and fails with 504 after a deadline,
+    given in seconds by the optional deadline query string parameter
+    :param search_service: SearchService instance
+    :param response_cache: cache of serialized responses, every search runs the full pipeline if None
+    """
+    query, limit, filters = get_search_args()
+    try:
+        projection = get_projection_args()
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    deadline = min(
+        request.args.get("deadline", ASYNC_SEARCH_CONFIG["DEADLINE"], type=float),
+        ASYNC_SEARCH_CONFIG["MAX_DEADLINE"],
+    )
+
+    if response_cache is not None:
+        generation = search_service.get_generation()
+        key = make_search_key(response_cache, query, limit, filters, projection)
+        cached_response = response_cache.get(generation, key)
+        if cached_response is not None:
+            return make_cached_response(cached_response, response_cache)
+
+    try:
+        results = await search_service.search_async(
+            query=query, k=limit, deadline=deadline, projection=projection, **filters
+        )
+    except SearchDeadlineExceeded as e:
+        logger.warning(f"Search for '{query}' exceeded its deadline: {e}")
+        return jsonify({"error": str(e)}), 504
+
+    body = make_results_body([make_faculty_document(faculty, projection) for faculty in results])
+    if response_cache is None:
+        return current_app.response_class(body, mimetype="application/json")
+    return make_cached_response(response_cache.put(generation, key, body), response_cache)
+
+
+def get_search_args() -> typing.Tuple[str, int, typing.Dict[str, typing.Any]]:
+    """
+    Read the query, limit, and filters of a search from the query string
+    :return: query, limit, and filter values by name
     """
     query = request.args.get("query")
     limit = int(request.args.get("limit"))
-    school = request.args.get("school", None)
-    department = request.args.get("department", None)
-    activity_code = request.args.get("activity_code", None)
-    agency_ic_admin = request.args.get("agency_ic_admin", None)
+    school = get_list_arg("school")
+    department = get_list_arg("department")
+    activity_code = get_list_arg("activity_code")
+    agency_ic_admin = get_list_arg("agency_ic_admin")
     has_funding = request.args.get("has_funding", None) is not None
 
     logging.info(f"Search query: {query}\nLimit: {limit}\nSchool: {school}\nDepartment: {department}\nActivity Code: \
 {activity_code}\nAgency IC Admin: {agency_ic_admin}\n Has Funding: {has_funding}")
 
-    results = search_service.search(
-        query=query,
+    filters = {
+        "school": school,
+        "department": department,
+        "activity_code": activity_code,
+        "agency_ic_admin": agency_ic_admin,
+        "has_funding": has_funding,
+    }
+    return query, limit, filters
+
+
+def get_projection_args() -> Projection | None:
+    """
+    Read the result fields and size limits of a search from the query string, e.g.
+    ?fields=name,school,projects.project_number&max_projects=5&abstract_chars=200
+    Project fields are selected with a "projects." prefix, "projects" alone selects all of them.
+    :return: projection or None if no projection parameter was given
+    :raises ValueError: if a field is unknown or a limit is not a non-negative integer
+    """
+    fields = [
+        field.strip() for value in request.args.getlist("fields") for field in value.split(",") if field.strip()
+    ]
+    max_projects = get_int_arg("max_projects")
+    abstract_chars = get_int_arg("abstract_chars")
+    if not fields and max_projects is None and abstract_chars is None:
+        return None
+
+    if max_projects is not None:
+        max_projects = min(max_projects, SEARCH_PROJECTION_CONFIG["MAX_PROJECTS"])
+    if not fields:
+        return Projection(max_projects=max_projects, abstract_chars=abstract_chars)
+
+    faculty_fields = []
+    project_fields = []
+    for field in fields:
+        if field == "projects":
+            project_fields.extend(PROJECT_FIELDS)
+        elif field.startswith("projects.") and field.removeprefix("projects.") in PROJECT_FIELDS:
+            project_fields.append(field.removeprefix("projects."))
+        elif field in FACULTY_FIELDS:
+            faculty_fields.append(field)
+        else:
+            raise ValueError(f"Unknown field: {field}")
+    if project_fields:
+        faculty_fields.append("projects")
+    return Projection(
+        fields=tuple(dict.fromkeys(faculty_fields)),
+        project_fields=tuple(dict.fromkeys(project_fields)),
+        max_projects=max_projects,
+        abstract_chars=abstract_chars,
+    )
+
+
+def get_int_arg(name: str) -> int | None:
+    """
+    Read a non-negative integer from the query string
+    :param name: query string parameter name
+    :return: value or None if it is not given
+    :raises ValueError: if the value is not a non-negative integer
+    """
+    value = request.args.get(name)
+    if value is None or value == "":
+        return None
+    if not value.isdigit():
+        raise ValueError(f"{name} must be a non-negative integer")
+    return int(value)
+
+
+def search_batch(search_service: "SearchService"):
+    """
+    Entry point for faculty search with many queries sharing one limit and set of filters
+    Expects a JSON body like {"queries": ["..."], "limit": 10, "school": ["SOM"], "has_funding": true}
+    :param search_service: SearchService instance
+    """
+    payload = request.get_json(silent=True) or {}
+    queries = payload.get("queries")
+    if not isinstance(queries, list) or not queries or not all(isinstance(query, str) and query for query in queries):
+        return jsonify({"error": "queries must be a non-empty list of non-empty strings"}), 400
+    if len(queries) > SEARCH_BATCH_CONFIG["MAX_QUERIES"]:
+        return jsonify({"error": f"at most {SEARCH_BATCH_CONFIG['MAX_QUERIES']} queries per batch"}), 400
+    try:
+        limit = int(payload.get("limit"))
+    except (TypeError, ValueError):
+        return jsonify({"error": "limit must be a positive integer"}), 400
+    if limit <= 0:
+        return jsonify({"error": "limit must be a positive integer"}), 400
+    has_funding = payload.get("has_funding")
+    if has_funding is not None and not isinstance(has_funding, bool):
+        return jsonify({"error": "has_funding must be a boolean"}), 400
+
+    logging.info(f"Batch search of {len(queries)} queries with limit {limit}.")
+
+    results = search_service.search_batch(
+        queries=queries,
         k=limit,
-        school=school,
-        department=department,
-        activity_code=activity_code,
-        agency_ic_admin=agency_ic_admin,
+        school=get_json_list(payload, "school"),
+        department=get_json_list(payload, "department"),
+        activity_code=get_json_list(payload, "activity_code"),
+        agency_ic_admin=get_json_list(payload, "agency_ic_admin"),
         has_funding=has_funding,
     )
 
     response = {
-        "results": [serialize_faculty(r) for r in results]
+        "results": [
+            {"query": query, **serialize_results(query_results)}
+            for query, query_results in zip(queries, results)
+        ]
     }
     return jsonify(response), 200
 
 
-def serialize_faculty(faculty: "Faculty") -> typing.Dict:
+def get_json_list(payload: typing.Dict, name: str) -> typing.List[str] | None:
+    """
+    Read a filter from a JSON body that may be given as a single value or a list of values
+    :param payload: JSON body
+    :param name: filter name
+    :return: non-empty values or None if there are none
+    """
+    value = payload.get(name)
+    values = value if isinstance(value, list) else [value]
+    values = [str(value) for value in values if value]
+    return values or None
+
+
+def make_cached_response(cached_response: "CachedResponse", response_cache: "SearchResponseCache"):
+    """
+    Build a response from a cached body with ETag and Cache-Control headers,
+    answering 304 Not Modified if the client already has it, and reusing compressed bodies from the cache
+    :param cached_response: cached response
+    :param response_cache: cache the response came from
+    :return: Flask response
+    """
+    response = current_app.response_class(cached_response.body, mimetype="application/json")
+    response.set_etag(cached_response.etag)
+    response.cache_control.public = True
+    response.cache_control.max_age = SEARCH_RESPONSE_CACHE_CONFIG["MAX_AGE"]
+    return compress_response(response.make_conditional(request), response_cache)
+
+
+def serialize_results(results: typing.List["Faculty"]) -> typing.Dict:
     """
-    Unpack Faculty into JSON
-    :param faculty: Faculty
+    Unpack search results into JSON
+    :param results: list of Faculty
     :return: JSON
     """
     return {
-        "name": faculty.name,
-        "school": faculty.school,
-        "department": faculty.department.split(","),
-        "about": faculty.about,
-        "emails": faculty.email.split(","),
-        "profile_url": faculty.profile_url,
-        "has_funding": faculty.has_funding,
-        "projects": [
-            {
-                "project_number": project.project_number,
-                "abstract": project.abstract,
-                "relevant_terms": project.relevant_terms,
-                "start_date": project.start_date,
-                "end_date": project.end_date,
-                "agency_ic_admin": project.agency_ic_admin,
-                "activity_code": project.activity_code,
-            }
-            for project in faculty.projects
-        ]
+        "results": [serialize_faculty(r) for r in results]
     }
+
+
+def get_list_arg(name: str) -> typing.List[str] | None:
+    """
+    Read a filter that may be repeated in the query string, e.g. ?school=SOM&school=SEAS
+    :param name: query string parameter name
+    :return: non-empty values or None if there are none
+    """
+    values = [value for value in request.args.getlist(name) if value]
+    return values or None
@@ -41,7 +41,7 @@ class TestDataAggregator(unittest.TestCase):
                 "activity_code": "TEST"
             }
         ])
-        self.embedding_service.generate_and_store_embedding.return_value = 1
+        self.embedding_service.generate_and_store_embeddings.return_value = [1]
         faculty_list = self.aggregator.aggregate_school_faculty_data("SEAS")
 
         self.assertEqual(len(faculty_list), 1)
@@ -106,6 +106,26 @@ class TestDataAggregator(unittest.TestCase):
         updated_faculty = self.aggregator._update_faculty_department(faculty, "Chemical Engineering")
         self.assertEqual(updated_faculty.department, "Biomedical Engineering,Chemical Engineering")
 
+    def test_compute_content_hash_detects_project_changes(self):
+        def make_faculty(abstract: str) -> Faculty:
+            return Faculty(
+                name="John Doe",
+                school="SEAS",
+                department="Biomedical Engineering",
+                email="email@email.com",
+                projects=[Project(project_number="TEST1", abstract=abstract, start_date=date(2020, 1, 1))],
+                has_funding=False,
+            )
+
+        self.assertEqual(
+            self.aggregator.compute_content_hash(make_faculty("TEST2")),
+            self.aggregator.compute_content_hash(make_faculty("TEST2"))
+        )
+        self.assertNotEqual(
+            self.aggregator.compute_content_hash(make_faculty("TEST2")),
+            self.aggregator.compute_content_hash(make_faculty("TEST3"))
+        )
+
     def test_has_funding_true(self):
         projects = [
             Project(
@@ -1,9 +1,11 @@
 import unittest
 from unittest.mock import MagicMock, patch
-from flask import Flask
+from flask import Flask, current_app
+from sqlalchemy import BigInteger, inspect
 from backend.core.extensions import db
-from backend.models.models import Faculty
+from backend.models.models import Faculty, Project
 from backend.services.database.database_driver import DatabaseDriver
+from backend.utils.hash_utils import stable_id
 
 class TestDatabaseDriver(unittest.TestCase):
     DB_DRIVER_MODULE = "backend.services.database.database_driver.DatabaseDriver"
@@ -40,4 +42,109 @@ class TestDatabaseDriver(unittest.TestCase):
         mock_ids = [1, 2, 3]
         with patch(self.DB_DRIVER_MODULE + "._get_embedding_ids_by_search_parameters", return_value=mock_ids):
             result = self.db_driver.get_embedding_ids_by_search_parameters(school="SEAS")
-            self.assertEqual(result, mock_ids)
\ No newline at end of file
+            self.assertEqual(result, mock_ids)
+
+    def test_stores_63_bit_embedding_ids(self):
+        db.create_all()
+        embedding_id = stable_id("John Doe", "SEAS", "johndoe@virginia.edu")
+        self.db_driver.add_faculty(self._make_faculty(embedding_id=embedding_id, content_hash="a", project_number="P1"))
+
+        self.assertIsInstance(Faculty.__table__.c.embedding_id.type, BigInteger)
+        self.assertEqual(self.db_driver.get_faculty_content_hashes(), {embedding_id: "a"})
+
+    def test_get_faculty_by_embedding_ids_preserves_rank_order(self):
+        db.create_all()
+        for embedding_id in (1, 2, 3):
+            self.db_driver.add_faculty(self._make_faculty(embedding_id=embedding_id, content_hash="a", project_number=f"P{embedding_id}"))
+
+        with patch(self.DB_DRIVER_MODULE + "._get_faculty_by_embedding_id") as mock_single_lookup:
+            results = self.db_driver.get_faculty_by_embedding_ids([3, -1, 1])
+
+        mock_single_lookup.assert_not_called()
+        self.assertEqual([faculty.embedding_id for faculty in results], [3, 1])
+        self.assertEqual([project.project_number for project in results[0].projects], ["P3"])
+
+    def test_get_faculty_by_embedding_ids_loads_only_projected_columns(self):
+        db.create_all()
+        self.db_driver.add_faculty(self._make_faculty(embedding_id=1, content_hash="a", project_number="P1"))
+        db.session.expunge_all()
+
+        faculty, = self.db_driver.get_faculty_by_embedding_ids([1], columns=["name"], project_columns=["project_number"])
+
+        self.assertIn("email", inspect(faculty).unloaded)
+        self.assertNotIn("name", inspect(faculty).unloaded)
+        self.assertEqual([project.project_number for project in faculty.projects], ["P1"])
+        self.assertIn("abstract", inspect(faculty.projects[0]).unloaded)
+
+        db.session.expunge_all()
+        faculty, = self.db_driver.get_faculty_by_embedding_ids([1], columns=["name"], project_columns=[])
+        self.assertIn("projects", inspect(faculty).unloaded)
+
+    def test_get_faculty_documents_preserves_rank_order(self):
+        db.create_all()
+        for embedding_id in (1, 2):
+            faculty = self._make_faculty(embedding_id=embedding_id, content_hash="a", project_number=f"P{embedding_id}")
+            faculty.document = f'{{"embedding_id":{embedding_id}}}'
+            self.db_driver.add_faculty(faculty)
+        self.db_driver.add_faculty(self._make_faculty(embedding_id=3, content_hash="a", project_number="P3"))
+
+        results = self.db_driver.get_faculty_documents([3, -1, 2, 1])
+
+        self.assertEqual(results, [(3, None), (2, '{"embedding_id":2}'), (1, '{"embedding_id":1}')])
+
+    def test_generations_are_read_and_deleted_separately(self):
+        db.create_all()
+        self.db_driver.add_faculty_list([
+            self._make_faculty(embedding_id=1, content_hash="old", project_number="P1", generation=1),
+            self._make_faculty(embedding_id=1, content_hash="new", project_number="P2", generation=2),
+            self._make_faculty(embedding_id=2, content_hash="b", project_number="P3", generation=3),
+        ])
+
+        self.assertEqual(self.db_driver.get_max_generation(), 3)
+        self.assertEqual(self.db_driver.get_faculty_content_hashes(generation=2), {1: "new"})
+        self.assertEqual(
+            [faculty.content_hash for faculty in self.db_driver.get_faculty_by_embedding_ids([1, 2], generation=1)],
+            ["old"]
+        )
+
+        self.db_driver.delete_generations_before(2)
+        self.db_driver.delete_generation(3)
+
+        self.assertEqual([faculty.generation for faculty in Faculty.query.all()], [2])
+        self.assertEqual([project.project_number for project in Project.query.all()], ["P2"])
+
+    def test_reuses_current_app_context_and_binds_current_app_proxy(self):
+        db.create_all()
+        db_driver = DatabaseDriver(current_app)
+
+        with patch.object(self.app, "app_context", wraps=self.app.app_context) as mock_app_context:
+            self.assertEqual(db_driver.get_faculty_content_hashes(), {})
+            mock_app_context.assert_not_called()
+
+        self.assertIs(db_driver.app, self.app)
+
+    def test_pushes_app_context_outside_of_one(self):
+        self.app_context.pop()
+        try:
+            with patch.object(self.app, "app_context", wraps=self.app.app_context) as mock_app_context:
+                with self.app.app_context():
+                    db.create_all()
+                mock_app_context.reset_mock()
+
+                self.assertEqual(self.db_driver.get_faculty_content_hashes(), {})
+                mock_app_context.assert_called_once()
+        finally:
+            self.app_context.push()
+
+    @staticmethod
+    def _make_faculty(embedding_id: int, content_hash: str, project_number: str, generation: int = 0) -> Faculty:
+        return Faculty(
+            name="John Doe",
+            school="SEAS",
+            department="Computer Science",
+            email="johndoe@virginia.edu",
+            embedding_id=embedding_id,
+            content_hash=content_hash,
+            generation=generation,
+            projects=[Project(project_number=project_number)],
+        )
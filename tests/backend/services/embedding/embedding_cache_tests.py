@@ -0,0 +1,41 @@
+import os
+import tempfile
+import unittest
+from backend.services.embedding.embedding_cache import EmbeddingCache
+
+class TestEmbeddingCache(unittest.TestCase):
+    MODEL = "test-model"
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache = EmbeddingCache(path=os.path.join(self.temp_dir.name, "cache.db"), max_entries=2)
+
+    def tearDown(self):
+        self.cache.close()
+        self.temp_dir.cleanup()
+
+    def test_get_many_returns_hits_and_misses_in_order(self):
+        self.cache.put_many(self.MODEL, ["a"], [[0.5, 1.5]])
+
+        result = self.cache.get_many(self.MODEL, ["b", "a"])
+
+        self.assertEqual(result, [None, [0.5, 1.5]])
+        self.assertEqual(self.cache.stats()["hits"], 1)
+        self.assertEqual(self.cache.stats()["misses"], 1)
+
+    def test_key_includes_model(self):
+        self.cache.put_many(self.MODEL, ["a"], [[0.5, 1.5]])
+
+        self.assertEqual(self.cache.get_many("other-model", ["a"]), [None])
+
+    def test_put_many_evicts_least_recently_used(self):
+        self.cache.put_many(self.MODEL, ["a"], [[1.0]])
+        self.cache.put_many(self.MODEL, ["b"], [[2.0]])
+        self.cache.get_many(self.MODEL, ["a"])
+        self.cache.put_many(self.MODEL, ["c"], [[3.0]])
+
+        self.assertEqual(self.cache.get_many(self.MODEL, ["a", "b", "c"]), [[1.0], None, [3.0]])
+        self.assertEqual(self.cache.stats()["entries"], 2)
+
+if __name__ == "__main__":
+    unittest.main()
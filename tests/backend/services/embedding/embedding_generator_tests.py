@@ -1,5 +1,6 @@
+import asyncio
 import unittest
-from unittest.mock import MagicMock, patch, call
+from unittest.mock import AsyncMock, MagicMock, patch, call
 from backend.services.embedding.embedding_generator import EmbeddingGenerator
 from backend.core.populate_config import OPENAI_CONFIG
 from backend.utils.token_utils import count_tokens, chunk_text
@@ -24,15 +25,15 @@ class TestEmbeddingGenerator(unittest.TestCase):
 
     @patch(f"{MODULE_PATH}.chunk_text")
     @patch(f"{MODULE_PATH}.count_tokens")
-    @patch(f"{MODULE_PATH}.EmbeddingGenerator._call_embedding_api")
-    def test_generate_embedding_exceeds_token_limits(self, mock_call_api, mock_count_tokens, mock_chunk_text):
+    @patch(f"{MODULE_PATH}.EmbeddingGenerator._call_embedding_batch_api")
+    def test_generate_embedding_exceeds_token_limits(self, mock_call_batch_api, mock_count_tokens, mock_chunk_text):
         mock_count_tokens.return_value = OPENAI_CONFIG["MAX_TOKENS"] + 10
         mock_chunk_text.return_value = ["chunk1", "chunk2"]
-        mock_call_api.side_effect = [[0.1, 0.2, 0.3], [0.4, 0.5, 0.6]]
+        mock_call_batch_api.return_value = [[0.1, 0.2, 0.3], [0.4, 0.5, 0.6]]
 
         result = self.generator.generate_embedding("long test text")
 
-        mock_call_api.assert_has_calls([call("chunk1"), call("chunk2")])
+        mock_call_batch_api.assert_called_once_with(["chunk1", "chunk2"])
         for i in range(len(result)):
             self.assertAlmostEqual(
                 result[i],
@@ -40,6 +41,52 @@ class TestEmbeddingGenerator(unittest.TestCase):
                 places=2
             )
 
+    @patch(f"{MODULE_PATH}.chunk_text")
+    @patch(f"{MODULE_PATH}.count_tokens")
+    @patch(f"{MODULE_PATH}.EmbeddingGenerator._call_embedding_batch_api")
+    def test_generate_embeddings_preserves_order(self, mock_call_batch_api, mock_count_tokens, mock_chunk_text):
+        token_counts = {"short1": 10, "long": OPENAI_CONFIG["MAX_TOKENS"] + 10, "chunk1": 10, "chunk2": 10, "short2": 10}
+        mock_count_tokens.side_effect = lambda text: token_counts[text]
+        mock_chunk_text.return_value = ["chunk1", "chunk2"]
+        mock_call_batch_api.side_effect = lambda texts: [
+            {"short1": [1.0, 1.0], "chunk1": [2.0, 4.0], "chunk2": [4.0, 6.0], "short2": [5.0, 5.0]}[text]
+            for text in texts
+        ]
+
+        result = self.generator.generate_embeddings(["short1", "long", "short2"])
+
+        mock_call_batch_api.assert_called_once_with(["short1", "chunk1", "chunk2", "short2"])
+        self.assertEqual(result, [[1.0, 1.0], [3.0, 5.0], [5.0, 5.0]])
+
+    @patch.dict(OPENAI_CONFIG, {"MAX_BATCH_SIZE": 2, "MAX_BATCH_TOKENS": 25})
+    def test_make_batches_respects_limits(self):
+        batches = self.generator._make_batches(["a", "b", "c", "d"], [10, 10, 10, 20])
+
+        self.assertEqual(batches, [["a", "b"], ["c"], ["d"]])
+
+    def test_call_embedding_batch_api_orders_by_index(self):
+        self.mock_openai_client.embeddings.create.return_value = MagicMock(data=[
+            MagicMock(index=1, embedding=[0.4, 0.5]),
+            MagicMock(index=0, embedding=[0.1, 0.2]),
+        ])
+
+        result = self.generator._call_embedding_batch_api(["first", "second"])
+
+        self.assertEqual(result, [[0.1, 0.2], [0.4, 0.5]])
+
+    @patch(f"{MODULE_PATH}.EmbeddingGenerator._generate_uncached_embeddings")
+    def test_generate_embeddings_only_sends_cache_misses(self, mock_generate_uncached):
+        mock_cache = MagicMock()
+        mock_cache.get_many.return_value = [[0.1, 0.2], None, [0.5, 0.6]]
+        mock_generate_uncached.return_value = [[0.3, 0.4]]
+        generator = EmbeddingGenerator(self.mock_openai_client, embedding_cache=mock_cache)
+
+        result = generator.generate_embeddings(["cached1", "new", "cached2"])
+
+        mock_generate_uncached.assert_called_once_with(["new"])
+        mock_cache.put_many.assert_called_once_with(OPENAI_CONFIG["EMBEDDING_MODEL"], ["new"], [[0.3, 0.4]])
+        self.assertEqual(result, [[0.1, 0.2], [0.3, 0.4], [0.5, 0.6]])
+
     def test_aggregate_embeddings(self):
         embeddings = [
             [1, 2, 3],
@@ -72,6 +119,18 @@ class TestEmbeddingGenerator(unittest.TestCase):
 
         self.assertEqual(str(context.exception), "API ERROR")
 
+    @patch(f"{MODULE_PATH}.count_tokens", return_value=2)
+    def test_generate_embedding_async_uses_async_client(self, mock_count_tokens):
+        async_client = MagicMock()
+        async_client.embeddings.create = AsyncMock(return_value=MagicMock(data=[MagicMock(index=0, embedding=[0.4])]))
+        generator = EmbeddingGenerator(self.mock_openai_client, async_client=async_client)
+
+        result = asyncio.run(generator.generate_embedding_async("test text"))
+
+        self.assertEqual(result, [0.4])
+        async_client.embeddings.create.assert_awaited_once_with(input=["test text"], model=OPENAI_CONFIG["EMBEDDING_MODEL"])
+        self.mock_openai_client.embeddings.create.assert_not_called()
+
 if __name__ == "__main__":
     unittest.main()
 
@@ -0,0 +1,86 @@
+import asyncio
+import os
+import tempfile
+import unittest
+from unittest.mock import AsyncMock, MagicMock
+from backend.services.embedding.embedding_cache import EmbeddingCache
+from backend.services.embedding.embedding_generator import EmbeddingGenerator
+from backend.services.embedding.embedding_service import EmbeddingService
+from backend.services.embedding.embedding_storage import EmbeddingStorage
+from backend.utils.lru_cache import LRUCache
+
+class TestEmbeddingService(unittest.TestCase):
+    def setUp(self):
+        self.embedding_generator = MagicMock(spec=EmbeddingGenerator)
+        self.embedding_generator.generate_embedding.return_value = [0.1, 0.2]
+        self.embedding_storage = MagicMock(spec=EmbeddingStorage)
+        self.embedding_storage.search_similar_embeddings.return_value = [1]
+
+    def test_repeated_query_skips_embedding_api(self):
+        service = EmbeddingService(self.embedding_generator, self.embedding_storage, query_cache=LRUCache(max_entries=8))
+
+        service.search_similar_embeddings(query="Machine Learning", top_k=5)
+        service.search_similar_embeddings(query="machine learning", top_k=5)
+
+        self.embedding_generator.generate_embedding.assert_called_once()
+        self.assertEqual(service.get_query_cache_stats()["memory"]["hits"], 1)
+
+    def test_disk_cache_is_shared_across_services(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            disk_cache = EmbeddingCache(path=os.path.join(temp_dir, "query_cache.db"), max_entries=8)
+            first_service = EmbeddingService(self.embedding_generator, self.embedding_storage,
+                                             query_cache=LRUCache(max_entries=8), query_disk_cache=disk_cache)
+            second_service = EmbeddingService(self.embedding_generator, self.embedding_storage,
+                                              query_cache=LRUCache(max_entries=8), query_disk_cache=disk_cache)
+
+            first_service.search_similar_embeddings(query="cancer immunology", top_k=5)
+            second_service.search_similar_embeddings(query="cancer immunology", top_k=5)
+
+            self.embedding_generator.generate_embedding.assert_called_once()
+            self.assertEqual(disk_cache.stats()["hits"], 1)
+            disk_cache.close()
+
+    def test_batch_embeds_uncached_queries_in_one_call(self):
+        self.embedding_generator.generate_embeddings.return_value = [[0.3, 0.4], [0.5, 0.6]]
+        self.embedding_storage.search_similar_embeddings_batch.return_value = [[1], [2], [3], [1]]
+        service = EmbeddingService(self.embedding_generator, self.embedding_storage, query_cache=LRUCache(max_entries=8))
+        service.search_similar_embeddings(query="genomics", top_k=5)
+
+        results = service.search_similar_embeddings_batch(
+            queries=["Genomics", "cancer", "imaging", "cancer"], top_k=5
+        )
+
+        self.assertEqual(results, [[1], [2], [3], [1]])
+        self.embedding_generator.generate_embeddings.assert_called_once_with(["cancer", "imaging"])
+        query_embeddings = self.embedding_storage.search_similar_embeddings_batch.call_args.kwargs["query_embeddings"]
+        self.assertEqual(query_embeddings.shape, (4, 2))
+        self.assertEqual(query_embeddings[3].tolist(), query_embeddings[1].tolist())
+
+    def test_slow_async_embedding_is_hedged(self):
+        attempts = []
+
+        async def generate_embedding_async(text):
+            attempts.append(text)
+            if len(attempts) == 1:
+                await asyncio.sleep(10)
+            return [0.7, 0.8]
+
+        self.embedding_generator.generate_embedding_async = generate_embedding_async
+        service = EmbeddingService(self.embedding_generator, self.embedding_storage, query_cache=LRUCache(max_entries=8))
+
+        query_embedding = asyncio.run(service.get_query_embedding_async("genomics", hedge_delay=0.01))
+        cached_query_embedding = asyncio.run(service.get_query_embedding_async("genomics", hedge_delay=0.01))
+
+        self.assertEqual(query_embedding, [0.7, 0.8])
+        self.assertEqual(cached_query_embedding, [0.7, 0.8])
+        self.assertEqual(attempts, ["genomics", "genomics"])
+
+    def test_fast_async_embedding_is_not_hedged(self):
+        self.embedding_generator.generate_embedding_async = AsyncMock(return_value=[0.7, 0.8])
+        service = EmbeddingService(self.embedding_generator, self.embedding_storage)
+
+        self.assertEqual(asyncio.run(service.get_query_embedding_async("genomics", hedge_delay=5)), [0.7, 0.8])
+        self.embedding_generator.generate_embedding_async.assert_awaited_once_with("genomics")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,309 @@
+import json
+import os
+import tempfile
+import threading
+import unittest
+import faiss
+import numpy as np
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+from backend.core.populate_config import OPENAI_CONFIG
+from backend.services.embedding.embedding_storage import EmbeddingStorage
+
+class TestEmbeddingStorage(unittest.TestCase):
+    MODULE_PATH = "backend.services.embedding.embedding_storage"
+    DIMENSIONS = OPENAI_CONFIG["EMBEDDING_DIMENSIONS"]
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.index_path = os.path.join(self.temp_dir.name, "index.faiss")
+        self.index_path_patch = patch(f"{self.MODULE_PATH}.INDEX_PATH", self.index_path)
+        self.index_path_patch.start()
+        self.database_driver = MagicMock()
+        self.storage = EmbeddingStorage(self.database_driver)
+
+    def tearDown(self):
+        self.index_path_patch.stop()
+        self.temp_dir.cleanup()
+
+    def _random_embeddings(self, n: int) -> np.ndarray:
+        return np.random.default_rng(0).random((n, self.DIMENSIONS), dtype=np.float32)
+
+    def test_add_embeddings_defers_save_until_checkpoint(self):
+        ids = self.storage.add_embeddings([10, 20, 30], self._random_embeddings(3))
+
+        self.assertEqual(ids, [10, 20, 30])
+        self.assertFalse(os.path.exists(self.index_path))
+
+        self.storage.checkpoint()
+
+        self.assertEqual(faiss.read_index(self.index_path).ntotal, 3)
+        self.assertEqual(sorted(os.listdir(self.temp_dir.name)), ["index.faiss"])
+
+    def test_add_embeddings_saves_on_checkpoint_interval(self):
+        storage = EmbeddingStorage(self.database_driver, checkpoint_interval=2)
+
+        storage.add_embeddings([1], self._random_embeddings(1))
+        self.assertFalse(os.path.exists(self.index_path))
+
+        storage.add_embeddings([2], self._random_embeddings(1))
+        self.assertEqual(faiss.read_index(self.index_path).ntotal, 2)
+
+    def test_add_embeddings_rejects_wrong_dimensions(self):
+        with self.assertRaises(ValueError):
+            self.storage.add_embeddings([1, 2], np.zeros((2, 3), dtype=np.float32))
+
+    def test_upsert_embedding_replaces_vector_under_same_id(self):
+        embeddings = self._random_embeddings(2)
+        self.storage.add_embeddings([1, 2], embeddings)
+
+        self.storage.upsert_embedding(1, embeddings[1])
+
+        self.assertEqual(self.storage.index.ntotal, 2)
+        np.testing.assert_array_equal(self.storage.index.reconstruct(1), embeddings[1])
+
+    def test_remove_embedding(self):
+        self.storage.add_embeddings([1, 2], self._random_embeddings(2))
+
+        self.assertTrue(self.storage.remove_embedding(1))
+        self.assertFalse(self.storage.remove_embedding(1))
+        self.assertEqual(self.storage.get_embedding_ids().tolist(), [2])
+
+    def test_load_index_migrates_positional_index(self):
+        embeddings = self._random_embeddings(3)
+        legacy_index = faiss.IndexFlatL2(self.DIMENSIONS)
+        legacy_index.add(embeddings)
+        faiss.write_index(legacy_index, self.index_path)
+
+        self.storage._load_index()
+
+        self.assertIsInstance(self.storage.index, faiss.IndexIDMap2)
+        self.assertEqual(self.storage.get_embedding_ids().tolist(), [0, 1, 2])
+        np.testing.assert_array_equal(self.storage.index.reconstruct(2), embeddings[2])
+
+    def test_search_with_parameters_matches_full_index_ranking(self):
+        embeddings = self._random_embeddings(50)
+        self.storage.add_embeddings(list(range(100, 150)), embeddings)
+        self.database_driver.get_search_metadata.return_value = [
+            SimpleNamespace(embedding_id=eid, school="SOM" if eid % 2 == 0 else "SEAS", department="D",
+                            has_funding=False, activity_code=None, agency_ic_admin=None)
+            for eid in list(range(100, 150)) + [998]
+        ]
+        query_embedding = self._random_embeddings(51)[50].tolist()
+
+        full_results = self.storage.search_similar_embeddings(query_embedding, top_k=50)
+        filtered_results = self.storage.search_similar_embeddings(query_embedding, top_k=5, school="SOM")
+
+        expected = [eid for eid in full_results if eid % 2 == 0][:5]
+        self.assertEqual(filtered_results, expected)
+
+    def test_search_strips_unfilled_ranks(self):
+        self.storage.add_embeddings([1, 2], self._random_embeddings(2))
+
+        results = self.storage.search_similar_embeddings(self._random_embeddings(1)[0].tolist(), top_k=5)
+
+        self.assertCountEqual(results, [1, 2])
+
+    def test_metadata_index_is_rebuilt_when_index_changes(self):
+        self.database_driver.get_search_metadata.return_value = []
+        self.storage.add_embeddings([1], self._random_embeddings(1))
+
+        first_metadata_index = self.storage.get_metadata_index()
+        self.assertIs(self.storage.get_metadata_index(), first_metadata_index)
+        self.storage.remove_embedding(1)
+
+        self.assertIsNot(self.storage.get_metadata_index(), first_metadata_index)
+        self.assertEqual(self.database_driver.get_search_metadata.call_count, 2)
+
+    def test_build_index_trains_configured_type_and_writes_manifest(self):
+        embeddings = self._random_embeddings(100)
+        storage = EmbeddingStorage(self.database_driver, index_type="IVFFlat")
+        storage.add_embeddings(list(range(100)), embeddings)
+
+        storage.build_index()
+        storage.set_search_parameters(nprobe=4)
+        storage.publish()
+
+        with open(storage.get_manifest_path()) as manifest_file:
+            manifest = json.load(manifest_file)
+        self.assertEqual(manifest["index_type"], "IVFFlat")
+        self.assertEqual(manifest["ntotal"], 100)
+        self.assertEqual(faiss.downcast_index(storage.index.index).nprobe, 2)
+        self.assertEqual(storage.search_similar_embeddings(embeddings[7].tolist(), top_k=1), [7])
+
+    def test_remove_embeddings_rebuilds_hnsw_index(self):
+        embeddings = self._random_embeddings(20)
+        storage = EmbeddingStorage(self.database_driver, index_type="HNSW")
+        storage.add_embeddings(list(range(20)), embeddings)
+        storage.build_index()
+
+        self.assertEqual(storage.remove_embeddings([3, 4, 99]), 2)
+        self.assertEqual(storage.upsert_embeddings([5], embeddings[:1]), [5])
+
+        self.assertEqual(sorted(storage.get_embedding_ids().tolist()), [i for i in range(20) if i not in (3, 4)])
+        np.testing.assert_array_equal(storage.index.reconstruct(5), embeddings[0])
+
+    def test_saved_index_is_memory_mapped_and_copied_before_changes(self):
+        embeddings = self._random_embeddings(3)
+        self.storage.add_embeddings([1, 2], embeddings[:2])
+        self.storage.checkpoint()
+
+        reloaded_storage = EmbeddingStorage(self.database_driver)
+        reloaded_storage._load_index()
+        self.assertTrue(reloaded_storage._index_mapped)
+
+        reloaded_storage.add_embeddings([3], embeddings[2:])
+
+        self.assertFalse(reloaded_storage._index_mapped)
+        self.assertEqual(sorted(reloaded_storage.get_embedding_ids().tolist()), [1, 2, 3])
+
+    def test_index_is_read_into_memory_without_mmap_flag(self):
+        self.storage.add_embeddings([1, 2], self._random_embeddings(2))
+        self.storage.checkpoint()
+
+        old_faiss = SimpleNamespace(read_index=faiss.read_index, __version__="1.9.0")
+        with patch(f"{self.MODULE_PATH}.faiss", old_faiss), self.assertLogs(self.MODULE_PATH, "WARNING") as logs:
+            index, mapped = EmbeddingStorage(self.database_driver)._read_index(self.index_path)
+
+        self.assertIn("IO_FLAG_MMAP_IFC", logs.output[0])
+        self.assertFalse(mapped)
+        self.assertEqual(index.ntotal, 2)
+
+    def test_compressed_index_reranks_to_exact_results(self):
+        embeddings = self._random_embeddings(300)
+        query_embedding = embeddings[42] + 0.01
+        exact_storage = EmbeddingStorage(self.database_driver)
+        exact_storage.add_embeddings(list(range(300)), embeddings)
+        expected = exact_storage.search_similar_embeddings(query_embedding.tolist(), top_k=10)
+
+        for index_type in ("SQ8", "PQ", "Binary"):
+            storage = EmbeddingStorage(self.database_driver, index_type=index_type)
+            storage.add_embeddings(list(range(300)), embeddings)
+            storage.build_index()
+            storage.set_search_parameters(rerank_oversampling=30)
+
+            self.assertEqual(storage.search_similar_embeddings(query_embedding.tolist(), top_k=10), expected, index_type)
+
+    def test_compressed_index_memory_maps_exact_vectors(self):
+        storage = EmbeddingStorage(self.database_driver, index_type="SQ8")
+        storage.add_embeddings(list(range(300)), self._random_embeddings(300))
+        storage.build_index()
+        storage.publish()
+
+        reloaded_storage = EmbeddingStorage(self.database_driver, index_type="SQ8")
+        reloaded_storage._load_index()
+
+        self.assertTrue(reloaded_storage._exact_index_mapped)
+        exact_vectors = faiss.downcast_index(faiss.downcast_index(reloaded_storage.exact_index).index)
+        self.assertEqual(exact_vectors.ntotal, 300)
+        self.assertFalse(exact_vectors.codes.is_owned) # the vectors are a view of the mapped file, not a heap copy
+        if os.path.exists("/proc/self/maps"):
+            with open("/proc/self/maps") as maps:
+                self.assertIn(reloaded_storage.get_exact_index_path(reloaded_storage.generation), maps.read())
+
+    def test_compressed_index_reloads_exact_vectors_from_disk(self):
+        embeddings = self._random_embeddings(300)
+        self.database_driver.get_search_metadata.return_value = [
+            SimpleNamespace(embedding_id=eid, school="SOM" if eid < 10 else "SEAS", department="D",
+                            has_funding=False, activity_code=None, agency_ic_admin=None)
+            for eid in range(300)
+        ]
+        storage = EmbeddingStorage(self.database_driver, index_type="PQ")
+        storage.add_embeddings(list(range(300)), embeddings)
+        storage.build_index()
+        storage.publish()
+
+        reloaded_storage = EmbeddingStorage(self.database_driver, index_type="PQ")
+        results = reloaded_storage.search_similar_embeddings(embeddings[3].tolist(), top_k=3, school="SOM")
+        reloaded_storage.upsert_embeddings([3], embeddings[4:5])
+
+        self.assertEqual(results[0], 3)
+        self.assertTrue(all(eid < 10 for eid in results))
+        np.testing.assert_array_equal(reloaded_storage.exact_index.reconstruct(3), embeddings[4])
+        with open(storage.get_manifest_path()) as manifest_file:
+            self.assertEqual(json.load(manifest_file)["exact_vectors"], "index.exact.faiss")
+
+    def test_published_generation_is_swapped_into_running_storage(self):
+        embeddings = self._random_embeddings(4)
+        self.database_driver.get_search_metadata.return_value = []
+        builder = EmbeddingStorage(self.database_driver)
+        builder.add_embeddings([1, 2], embeddings[:2])
+        builder.publish()
+        server = EmbeddingStorage(self.database_driver)
+        server.reload_check_interval = 0
+        old_snapshot = server.get_snapshot()
+
+        builder.start_generation(1)
+        builder.upsert_embeddings([3], embeddings[2:3])
+        builder.remove_embeddings([1])
+        builder.publish()
+        server.refresh_if_stale()
+        for thread in threading.enumerate():
+            if thread.name.startswith("faiss-reload"):
+                thread.join()
+
+        self.assertEqual(server.generation, 1)
+        self.assertEqual(sorted(server.get_embedding_ids().tolist()), [2, 3])
+        self.assertEqual(old_snapshot.generation, 0)
+        self.assertEqual(
+            server.search_similar_embeddings(embeddings[0].tolist(), top_k=3, snapshot=old_snapshot), [1, 2]
+        )
+        self.database_driver.get_search_metadata.assert_called_with(generation=1)
+        with open(server.get_manifest_path()) as manifest_file:
+            self.assertEqual(json.load(manifest_file)["index_file"], "index-g1.faiss")
+
+    def test_prune_generations_keeps_newer_files(self):
+        storage = EmbeddingStorage(self.database_driver, index_type="SQ8")
+        storage.add_embeddings(list(range(10)), self._random_embeddings(10))
+        storage.build_index()
+        for generation in (1, 2, 3):
+            storage.start_generation(generation)
+            storage.publish()
+
+        storage.prune_generations(2)
+
+        self.assertEqual(sorted(os.listdir(self.temp_dir.name)), [
+            "index-g2.exact.faiss", "index-g2.faiss", "index-g3.exact.faiss", "index-g3.faiss", "index.json"
+        ])
+
+    def test_batch_search_matches_single_searches(self):
+        embeddings = self._random_embeddings(60)
+        self.storage.add_embeddings(list(range(50)), embeddings[:50])
+        self.database_driver.get_search_metadata.return_value = [
+            SimpleNamespace(embedding_id=eid, school="SOM" if eid % 3 == 0 else "SEAS", department="D",
+                            has_funding=False, activity_code=None, agency_ic_admin=None)
+            for eid in range(50)
+        ]
+        queries = embeddings[50:]
+
+        for filters in ({}, {"school": "SOM"}):
+            results = self.storage.search_similar_embeddings_batch(queries, top_k=5, **filters)
+
+            expected = [self.storage.search_similar_embeddings(query.tolist(), top_k=5, **filters) for query in queries]
+            self.assertEqual(results, expected)
+
+    def test_concurrent_first_searches_load_index_once(self):
+        self.storage.add_embeddings([1, 2], self._random_embeddings(2))
+        self.storage.publish()
+        storage = EmbeddingStorage(self.database_driver)
+        read_generation = storage._read_generation
+        barrier = threading.Barrier(8)
+        query = self._random_embeddings(1)[0].tolist()
+        results = []
+
+        def search():
+            barrier.wait()
+            results.append(sorted(storage.search_similar_embeddings(query, top_k=2)))
+
+        with patch.object(storage, "_read_generation", wraps=read_generation) as mock_read_generation:
+            threads = [threading.Thread(target=search) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        mock_read_generation.assert_called_once_with(0)
+        self.assertEqual(results, [[1, 2]] * 8)
+
+if __name__ == "__main__":
+    unittest.main()
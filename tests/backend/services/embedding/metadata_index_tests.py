@@ -0,0 +1,47 @@
+import unittest
+from types import SimpleNamespace
+from backend.services.embedding.metadata_index import MetadataIndex
+
+class TestMetadataIndex(unittest.TestCase):
+    def setUp(self):
+        def row(embedding_id, school, department, has_funding, activity_code=None, agency_ic_admin=None):
+            return SimpleNamespace(embedding_id=embedding_id, school=school, department=department,
+                                   has_funding=has_funding, activity_code=activity_code, agency_ic_admin=agency_ic_admin)
+
+        self.metadata_index = MetadataIndex.build([
+            row(1, "SOM", "Medicine,Pediatrics", True, "R01", "NCI"),
+            row(1, "SOM", "Medicine,Pediatrics", True, "K08", "NIAID"),
+            row(2, "SOM", "Surgery", False),
+            row(3, "SEAS", "Computer Science", True, "R01", "NIGMS"),
+        ], version=7)
+
+    def test_single_values(self):
+        self.assertEqual(self.metadata_index.resolve(school="SOM").tolist(), [1, 2])
+        self.assertEqual(self.metadata_index.resolve(department="Pediatrics").tolist(), [1])
+        self.assertEqual(self.metadata_index.resolve(has_funding=True).tolist(), [1, 3])
+        self.assertEqual(self.metadata_index.resolve(school="Nursing").tolist(), [])
+        self.assertEqual(self.metadata_index.version, 7)
+
+    def test_values_of_one_field_are_ored(self):
+        self.assertEqual(self.metadata_index.resolve(department=["Surgery", "Computer Science"]).tolist(), [2, 3])
+
+    def test_fields_are_anded(self):
+        self.assertEqual(self.metadata_index.resolve(school="SOM", activity_code="R01").tolist(), [1])
+        self.assertEqual(self.metadata_index.resolve(activity_code=["R01", "K08"], has_funding=True,
+                                                     agency_ic_admin="NIGMS").tolist(), [3])
+
+    def test_department_names_containing_commas_are_not_split(self):
+        metadata_index = MetadataIndex.build([
+            SimpleNamespace(embedding_id=4, school="SOM",
+                            department="Microbiology, Immunology, Cancer Biology,Pharmacology", has_funding=False, activity_code=None, agency_ic_admin=None),
+            SimpleNamespace(embedding_id=5, school="SEAS", department="Electrical and Computer Engineering",
+                            has_funding=False, activity_code=None, agency_ic_admin=None),
+        ])
+
+        self.assertEqual(metadata_index.resolve(department="Microbiology, Immunology, Cancer Biology").tolist(), [4])
+        self.assertEqual(metadata_index.resolve(department="Pharmacology").tolist(), [4])
+        self.assertEqual(metadata_index.resolve(department="Immunology").tolist(), [])
+        self.assertEqual(metadata_index.resolve(department="Computer Engineering").tolist(), [])
+
+if __name__ == "__main__":
+    unittest.main()
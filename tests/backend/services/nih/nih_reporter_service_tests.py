@@ -0,0 +1,91 @@
+import unittest
+from unittest.mock import MagicMock, patch
+from backend.services.nih.nih_reporter_proxy import NIHReporterProxy
+from backend.services.nih.nih_reporter_service import NIHReporterService
+
+class TestNIHReporterService(unittest.TestCase):
+    MODULE_PATH = "backend.services.nih.nih_reporter_service"
+
+    def setUp(self):
+        self.proxy = MagicMock(spec=NIHReporterProxy)
+        self.service = NIHReporterService(self.proxy)
+
+    @staticmethod
+    def _project(project_number, pis):
+        return {
+            "project_num": project_number,
+            "abstract_text": "Abstract",
+            "terms": "<Term>",
+            "project_start_date": "2020-01-01T00:00:00Z",
+            "project_end_date": "2030-01-01T00:00:00Z",
+            "agency_ic_admin": {"abbreviation": "NCI"},
+            "activity_code": "R01",
+            "principal_investigators": [{"first_name": first, "last_name": last} for first, last in pis],
+        }
+
+    def test_build_organization_payload(self):
+        payload = NIHReporterService.build_organization_payload([2024], 500, 500)
+
+        self.assertNotIn("pi_names", payload["criteria"])
+        self.assertEqual(payload["criteria"]["fiscal_years"], [2024])
+        self.assertTrue(payload["criteria"]["org_names"])
+        self.assertEqual(payload["offset"], 500)
+        self.assertEqual(payload["limit"], 500)
+
+    def test_normalize_pi_name(self):
+        self.assertEqual(NIHReporterService.normalize_pi_name("JOSÉ", "O'Brien-Smith"), ("jose", "obriensmith"))
+
+    @patch(f"{MODULE_PATH}.NIH_BULK_CONFIG", {"PAGE_SIZE": 2, "MAX_OFFSET": 14999})
+    def test_load_organization_projects_paginates(self):
+        self.proxy.call_reporter_api.side_effect = [
+            {"meta": {"total": 3}, "results": [self._project("P1", [("JOHN", "DOE")]), self._project("P2", [("JANE", "ROE")])]},
+            {"meta": {"total": 3}, "results": [self._project("P3", [("JOHN", "DOE"), ("JANE", "ROE")])]},
+        ]
+
+        self.service.load_organization_projects([2024])
+
+        self.assertEqual(self.proxy.call_reporter_api.call_count, 2)
+        offsets = [call.args[0]["offset"] for call in self.proxy.call_reporter_api.call_args_list]
+        self.assertEqual(offsets, [0, 2])
+        self.assertEqual(len(self.service.pi_project_index[("john", "doe")]), 2)
+        self.assertEqual(len(self.service.pi_project_index[("jane", "roe")]), 2)
+
+    def test_load_organization_projects_skips_projects_repeated_across_fiscal_years(self):
+        active_project = {**self._project("P1", [("JOHN", "DOE")]), "appl_id": 101}
+        new_project = {**self._project("P2", [("JOHN", "DOE")]), "appl_id": 102}
+        self.proxy.call_reporter_api.side_effect = [
+            {"meta": {"total": 1}, "results": [active_project]},
+            {"meta": {"total": 2}, "results": [dict(active_project), new_project]},
+        ]
+
+        self.service.load_organization_projects([2023, 2024])
+
+        self.assertEqual(
+            [project["project_num"] for project in self.service.pi_project_index[("john", "doe")]], ["P1", "P2"]
+        )
+
+    def test_compile_project_metadata_uses_organization_index(self):
+        self.proxy.call_reporter_api.return_value = {
+            "meta": {"total": 1}, "results": [self._project("P1", [("JOHN", "DOE")])]
+        }
+        self.service.load_organization_projects([2024])
+        self.proxy.call_reporter_api.reset_mock()
+
+        projects_df = self.service.compile_project_metadata("John", "Doe", [2024])
+        missing_df = self.service.compile_project_metadata("Jane", "Roe", [2024])
+
+        self.proxy.call_reporter_api.assert_not_called()
+        self.assertEqual(list(projects_df["project_number"]), ["P1"])
+        self.assertTrue(missing_df.empty)
+
+    def test_compile_project_metadata_falls_back_to_api_for_other_fiscal_years(self):
+        self.service.load_organization_projects([])
+        self.proxy.call_reporter_api.return_value = {"results": [self._project("P1", [("JOHN", "DOE")])]}
+
+        projects_df = self.service.compile_project_metadata("John", "Doe", [2024])
+
+        self.proxy.call_reporter_api.assert_called_once()
+        self.assertEqual(list(projects_df["project_number"]), ["P1"])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,51 @@
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+from backend.services.scraper.base_scraper import BaseScraper
+from backend.services.scraper.scraper_service import ScraperService
+
+class TestScraperService(unittest.TestCase):
+    MODULE_PATH = "backend.services.scraper.scraper_service"
+
+    def setUp(self):
+        self.scraper = MagicMock(spec=BaseScraper)
+        self.scraper.SCHOOL_ID = "SEAS"
+        self.scraper_service = ScraperService([self.scraper], max_department_workers=2, max_profile_workers=4)
+
+    @patch(f"{MODULE_PATH}.InstitutionUtils")
+    def test_get_department_faculty_data_preserves_profile_order(self, mock_institution_utils):
+        endpoints = [f"/people/{i}" for i in range(8)]
+        mock_institution_utils.get_school_from_department.return_value = "SEAS"
+        mock_institution_utils.get_school_base_url.return_value = "https://example.edu"
+        mock_institution_utils.make_profile_url.side_effect = lambda base_url, endpoint: f"{base_url}{endpoint}"
+        self.scraper.get_profile_endpoints_from_people.return_value = endpoints
+
+        def slow_scrape_profile(profile_url):
+            time.sleep(0.01 * (8 - int(profile_url.split("/")[-1])))
+            return {
+                "name": profile_url.split("/")[-1],
+                "emails": ["a@example.edu", "b@example.edu"],
+                "about": "About",
+                "research_interests": [],
+            }
+
+        self.scraper.scrape_profile.side_effect = slow_scrape_profile
+
+        faculty_df = self.scraper_service.get_department_faculty_data("Computer Science")
+
+        self.assertEqual(faculty_df["Faculty_Name"].tolist(), [str(i) for i in range(8)])
+        self.assertEqual(faculty_df["Email_Address"].iloc[0], "a@example.edu,b@example.edu")
+        self.assertEqual(faculty_df["Profile_URL"].iloc[3], "https://example.edu/people/3")
+
+    @patch(f"{MODULE_PATH}.InstitutionUtils")
+    def test_get_school_faculty_data_keeps_department_order(self, mock_institution_utils):
+        departments = ["Dept A", "Dept B", "Dept C"]
+        mock_institution_utils.get_departments_from_school.return_value = departments
+
+        with patch.object(self.scraper_service, "get_department_faculty_data", side_effect=lambda dept: dept.upper()):
+            school_data = self.scraper_service.get_school_faculty_data("SEAS")
+
+        self.assertEqual(list(school_data.items()), [(dept, dept.upper()) for dept in departments])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,40 @@
+import unittest
+from unittest.mock import MagicMock
+from backend.services.scraper.seas_scraper import SEASScraper
+
+class TestSEASScraper(unittest.TestCase):
+    PROFILE_URL = "https://engineering.virginia.edu/faculty/jane-doe"
+    PROFILE_HTML = b"""
+    <html><body>
+        <a class="people_meta_detail_info_link" href="mailto:jd@virginia.edu">Email</a>
+        <h2>About</h2>
+        <p>Studies machine learning.</p>
+        <h2>Education</h2>
+        <p>PhD</p>
+        <h2>Research Interests</h2>
+        <div class="directory_grid_items"><div class="directory_grid_item">Robotics</div></div>
+    </body></html>
+    """
+
+    def setUp(self):
+        self.http_client = MagicMock()
+        self.http_client.get.return_value = MagicMock(content=self.PROFILE_HTML)
+        self.scraper = SEASScraper(self.http_client)
+
+    def test_scrape_profile_fetches_page_once(self):
+        profile = self.scraper.scrape_profile(self.PROFILE_URL)
+
+        self.http_client.get.assert_called_once_with(self.PROFILE_URL)
+        self.assertEqual(profile, {
+            "name": "Jane Doe",
+            "emails": ["jd@virginia.edu"],
+            "about": "Studies machine learning.",
+            "research_interests": ["Robotics"],
+        })
+
+    def test_scrape_profile_invalid_url(self):
+        with self.assertRaises(ValueError):
+            self.scraper.scrape_profile("not a url")
+
+if __name__ == "__main__":
+    unittest.main()
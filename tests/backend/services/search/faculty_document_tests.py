@@ -0,0 +1,46 @@
+import datetime
+import json
+import unittest
+from types import SimpleNamespace
+from flask import Flask, jsonify
+from backend.services.search.faculty_document import (
+    Projection, make_faculty_document, make_results_body, serialize_faculty
+)
+
+class TestFacultyDocument(unittest.TestCase):
+    def setUp(self):
+        self.faculty = SimpleNamespace(
+            name="John Doe", school="SEAS", department="Computer Science,Data Science", about="Über data",
+            email="johndoe@virginia.edu", profile_url=None, has_funding=True, projects=[SimpleNamespace(
+                project_number="R01", abstract="Genomics", relevant_terms="DNA", start_date=datetime.date(2024, 1, 2),
+                end_date=None, agency_ic_admin="NIGMS", activity_code="R01"
+            )]
+        )
+
+    def test_document_matches_jsonify(self):
+        app = Flask(__name__)
+        with app.app_context():
+            expected = jsonify(serialize_faculty(self.faculty)).get_json()
+
+        self.assertEqual(json.loads(make_faculty_document(self.faculty)), expected)
+
+    def test_projection_selects_fields_and_truncates_projects(self):
+        self.faculty.projects *= 3
+        projection = Projection(
+            fields=("name", "emails", "projects"), project_fields=("abstract",), max_projects=2, abstract_chars=4
+        )
+
+        serialized = serialize_faculty(self.faculty, projection)
+
+        self.assertEqual(serialized, {
+            "name": "John Doe", "emails": ["johndoe@virginia.edu"], "projects": [{"abstract": "Geno"}] * 2
+        })
+        self.assertEqual(projection.get_columns(), ["name", "email"])
+
+    def test_results_body_embeds_documents_in_order(self):
+        documents = [make_faculty_document(self.faculty), '{"name":"Jane Doe"}']
+
+        body = json.loads(make_results_body(documents))
+
+        self.assertEqual([result["name"] for result in body["results"]], ["John Doe", "Jane Doe"])
+        self.assertEqual(json.loads(make_results_body([])), {"results": []})
@@ -0,0 +1,131 @@
+import asyncio
+import threading
+import time
+import unittest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+from flask import Flask
+from flask.globals import _cv_app
+from backend.services.search.search_service import SearchDeadlineExceeded, SearchService
+
+class TestSearchService(unittest.TestCase):
+    def setUp(self):
+        self.database_driver = MagicMock()
+        self.embedding_service = MagicMock()
+        self.embedding_service.embedding_storage.get_snapshot.return_value = SimpleNamespace(generation=3)
+        self.search_service = SearchService(self.database_driver, self.embedding_service)
+
+    def test_identical_searches_in_progress_are_coalesced(self):
+        faculty = SimpleNamespace(embedding_id=1)
+        self.database_driver.get_faculty_by_embedding_ids.return_value = [faculty]
+        started = threading.Event()
+        release = threading.Event()
+
+        def search_similar_embeddings(**kwargs):
+            started.set()
+            release.wait()
+            return [1]
+
+        self.embedding_service.search_similar_embeddings.side_effect = search_similar_embeddings
+        results = []
+        first_search = threading.Thread(target=lambda: results.append(
+            self.search_service.search(query="Machine Learning", k=5, school=["SOM", "SEAS"])
+        ))
+        second_search = threading.Thread(target=lambda: results.append(
+            self.search_service.search(query="machine  learning", k=5, school=["SEAS", "SOM"])
+        ))
+        first_search.start()
+        started.wait()
+        second_search.start()
+        while self.search_service.single_flight.stats()["shared_calls"] < 1:
+            time.sleep(0.001)
+        release.set()
+        first_search.join()
+        second_search.join()
+
+        self.assertEqual(results, [[faculty], [faculty]])
+        self.embedding_service.search_similar_embeddings.assert_called_once()
+        self.database_driver.get_faculty_by_embedding_ids.assert_called_once_with([1], 3)
+
+    def test_different_filters_are_not_coalesced(self):
+        self.embedding_service.search_similar_embeddings.return_value = []
+        self.database_driver.get_faculty_by_embedding_ids.return_value = []
+
+        self.search_service.search(query="genomics", k=5, school=["SOM"])
+        self.search_service.search(query="genomics", k=5, school=["SEAS"])
+
+        self.assertEqual(self.embedding_service.search_similar_embeddings.call_count, 2)
+
+    def test_search_documents_serializes_records_without_stored_documents(self):
+        faculty = SimpleNamespace(
+            embedding_id=2, name="Jane Doe", school="SOM", department="Pharmacology", about=None,
+            email="janedoe@virginia.edu", profile_url=None, has_funding=False, projects=[]
+        )
+        self.embedding_service.search_similar_embeddings.return_value = [1, 2]
+        self.database_driver.get_faculty_documents.return_value = [(1, '{"name":"John Doe"}'), (2, None)]
+        self.database_driver.get_faculty_by_embedding_ids.return_value = [faculty]
+
+        documents = self.search_service.search_documents(query="genomics", k=5)
+
+        self.assertEqual(documents[0], '{"name":"John Doe"}')
+        self.assertIn('"name":"Jane Doe"', documents[1])
+        self.database_driver.get_faculty_documents.assert_called_once_with([1, 2], 3)
+        self.database_driver.get_faculty_by_embedding_ids.assert_called_once_with([2], 3)
+
+    def test_search_async_searches_embedding_in_executor(self):
+        faculty = SimpleNamespace(embedding_id=1)
+        self.embedding_service.get_query_embedding_async = AsyncMock(return_value=[0.1, 0.2])
+        self.embedding_service.embedding_storage.search_similar_embeddings.return_value = [1]
+        self.database_driver.get_faculty_by_embedding_ids.return_value = [faculty]
+
+        results = asyncio.run(self.search_service.search_async(query="Genomics", k=5, school=["SOM"]))
+
+        self.assertEqual(results, [faculty])
+        self.embedding_service.get_query_embedding_async.assert_awaited_once_with(
+            "genomics", hedge_delay=self.search_service.hedge_delay
+        )
+        self.assertEqual(
+            self.embedding_service.embedding_storage.search_similar_embeddings.call_args.kwargs["school"], ["SOM"]
+        )
+        self.database_driver.get_faculty_by_embedding_ids.assert_called_once_with([1], 3)
+
+    def test_search_async_fails_after_deadline(self):
+        async def get_query_embedding_async(standardized_query, hedge_delay=None):
+            await asyncio.sleep(10)
+
+        self.embedding_service.get_query_embedding_async = get_query_embedding_async
+
+        with self.assertRaises(SearchDeadlineExceeded):
+            asyncio.run(self.search_service.search_async(query="genomics", k=5, deadline=0.01))
+        self.database_driver.get_faculty_by_embedding_ids.assert_not_called()
+
+    def test_search_async_deadline_leaves_running_lookup_its_own_app_context(self):
+        app = Flask(__name__)
+        self.embedding_service.get_query_embedding_async = AsyncMock(return_value=[0.1, 0.2])
+        self.embedding_service.embedding_storage.search_similar_embeddings.return_value = [1]
+        lookup_started = threading.Event()
+        release_lookup = threading.Event()
+        lookup_contexts = []
+
+        def get_faculty_by_embedding_ids(eids, generation):
+            lookup_started.set()
+            release_lookup.wait()
+            lookup_contexts.append(_cv_app.get(None))
+            return []
+
+        self.database_driver.get_faculty_by_embedding_ids.side_effect = get_faculty_by_embedding_ids
+
+        with app.app_context() as request_context:
+            with self.assertRaises(SearchDeadlineExceeded):
+                asyncio.run(self.search_service.search_async(query="genomics", k=5, deadline=0.2))
+            self.assertTrue(lookup_started.is_set())
+        release_lookup.set()
+        self.search_service.executor.shutdown(wait=True)
+
+        self.assertEqual(len(lookup_contexts), 1)
+        self.assertIsNotNone(lookup_contexts[0])
+        self.assertIsNot(lookup_contexts[0], request_context)
+        self.assertIs(lookup_contexts[0].app, app)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,33 @@
+import asyncio
+import threading
+import unittest
+from backend.utils.async_runner import AsyncRunner
+
+class TestAsyncRunner(unittest.TestCase):
+
+    def test_run_executes_coroutine_on_runner_thread(self):
+        runner = AsyncRunner("test-runner")
+
+        async def get_thread_name():
+            return threading.current_thread().name
+
+        self.assertEqual(asyncio.run(runner.run(get_thread_name())), "test-runner")
+        self.assertEqual(asyncio.run(runner.run(get_thread_name())), "test-runner")
+
+    def test_cancelling_await_cancels_coroutine(self):
+        runner = AsyncRunner()
+        cancelled = threading.Event()
+
+        async def wait_forever():
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        with self.assertRaises(asyncio.TimeoutError):
+            asyncio.run(asyncio.wait_for(runner.run(wait_forever()), timeout=0.01))
+        self.assertTrue(cancelled.wait(1))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,50 @@
+import gzip
+import unittest
+from unittest.mock import patch
+from flask import Flask
+from backend.utils import compression
+from backend.utils.compression import compress_response
+
+class TestCompression(unittest.TestCase):
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.body = b'{"results":[' + b",".join([b'{"name":"John Doe"}'] * 100) + b"]}"
+
+    def _compress(self, body: bytes, accept_encoding: str = None, mimetype: str = "application/json"):
+        headers = {"Accept-Encoding": accept_encoding} if accept_encoding else {}
+        with self.app.test_request_context(headers=headers):
+            response = self.app.response_class(body, mimetype=mimetype)
+            response.set_etag("g1-abc")
+            return compress_response(response)
+
+    def test_gzips_large_json_response(self):
+        response = self._compress(self.body, "gzip, deflate")
+
+        self.assertEqual(response.headers["Content-Encoding"], "gzip")
+        self.assertEqual(gzip.decompress(response.get_data()), self.body)
+        self.assertEqual(response.get_etag(), ("g1-abc", True))
+        self.assertLess(response.content_length, len(self.body))
+
+    def test_leaves_small_or_unaccepted_responses_uncompressed(self):
+        for response in (
+            self._compress(b"{}", "gzip"),
+            self._compress(self.body),
+            self._compress(self.body, "gzip", mimetype="text/html"),
+        ):
+            self.assertNotIn("Content-Encoding", response.headers)
+            self.assertEqual(response.get_etag(), ("g1-abc", False))
+
+    def test_prefers_brotli_only_if_installed(self):
+        with patch.object(compression, "brotli", None):
+            self.assertEqual(self._compress(self.body, "br, gzip").headers["Content-Encoding"], "gzip")
+            self.assertNotIn("Content-Encoding", self._compress(self.body, "br").headers)
+
+    @unittest.skipIf(compression.brotli is None, "brotli is not installed")
+    def test_brotli_compresses_response(self):
+        response = self._compress(self.body, "br, gzip")
+
+        self.assertEqual(response.headers["Content-Encoding"], "br")
+        self.assertEqual(compression.brotli.decompress(response.get_data()), self.body)
+
+if __name__ == "__main__":
+    unittest.main()
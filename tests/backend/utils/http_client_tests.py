@@ -0,0 +1,116 @@
+import os
+import tempfile
+import unittest
+import requests
+from unittest.mock import MagicMock, patch
+from requests.exceptions import Timeout
+from backend.utils.http_client import HttpClient
+from backend.utils.response_cache import ResponseCache
+
+class TestHttpClient(unittest.TestCase):
+    MODULE_PATH = "backend.utils.http_client"
+    URL = "https://example.edu/people"
+
+    def setUp(self):
+        self.http_client = HttpClient(retries=3, backoff_factor=1.0, max_backoff=3.0)
+        self.http_client.session = MagicMock()
+
+    @patch(f"{MODULE_PATH}.time.sleep")
+    def test_request_backs_off_between_retries(self, mock_sleep):
+        response = MagicMock()
+        self.http_client.session.request.side_effect = [Timeout(), Timeout(), response]
+
+        result = self.http_client.get(self.URL)
+
+        self.assertIs(result, response)
+        self.assertEqual(self.http_client.session.request.call_count, 3)
+        self.assertEqual(mock_sleep.call_count, 2)
+        for sleep_call, max_delay in zip(mock_sleep.call_args_list, [1.0, 2.0]):
+            self.assertTrue(0 <= sleep_call.args[0] <= max_delay)
+
+    @patch(f"{MODULE_PATH}.time.sleep")
+    def test_request_raises_after_last_retry(self, mock_sleep):
+        self.http_client.session.request.side_effect = Timeout()
+
+        with self.assertRaises(Timeout):
+            self.http_client.get(self.URL)
+
+        self.assertEqual(mock_sleep.call_count, 2)
+
+    def test_backoff_delay_is_capped(self):
+        for attempt in range(10):
+            self.assertLessEqual(self.http_client._get_backoff_delay(attempt), 3.0)
+
+
+class TestHttpClientResponseCache(unittest.TestCase):
+    URL = "https://example.edu/people"
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.response_cache = ResponseCache(path=os.path.join(self.temp_dir.name, "http_cache.db"), default_ttl=60, host_ttls={})
+        self.http_client = HttpClient(response_cache=self.response_cache)
+        self.http_client.session = MagicMock()
+
+    def tearDown(self):
+        self.response_cache.close()
+        self.temp_dir.cleanup()
+
+    def _make_response(self, status_code: int, content: bytes = b"", headers: dict = None) -> requests.Response:
+        response = requests.Response()
+        response.status_code = status_code
+        response._content = content
+        response.headers.update(headers or {})
+        response.url = self.URL
+        return response
+
+    def test_fresh_response_served_from_cache(self):
+        self.http_client.session.request.return_value = self._make_response(200, b"page")
+
+        self.http_client.get(self.URL)
+        cached_response = self.http_client.get(self.URL)
+
+        self.assertEqual(cached_response.content, b"page")
+        self.assertEqual(self.http_client.session.request.call_count, 1)
+        self.assertEqual(self.response_cache.stats()["hits"], 1)
+
+    def test_stale_response_revalidated_with_etag(self):
+        self.http_client.session.request.side_effect = [
+            self._make_response(200, b"page", {"ETag": '"v1"'}),
+            self._make_response(304),
+        ]
+        self.http_client.get(self.URL)
+        self.response_cache.default_ttl = 0
+
+        revalidated_response = self.http_client.get(self.URL)
+
+        self.assertEqual(revalidated_response.content, b"page")
+        self.assertEqual(self.http_client.session.request.call_args.kwargs["headers"], {"If-None-Match": '"v1"'})
+        self.assertEqual(self.response_cache.stats()["revalidations"], 1)
+
+    def test_post_cache_key_includes_body(self):
+        self.http_client.session.request.side_effect = [
+            self._make_response(200, b"first"),
+            self._make_response(200, b"second"),
+        ]
+
+        first_response = self.http_client.post(self.URL, json={"offset": 0})
+        second_response = self.http_client.post(self.URL, json={"offset": 500})
+
+        self.assertEqual(first_response.content, b"first")
+        self.assertEqual(second_response.content, b"second")
+        self.assertEqual(self.http_client.post(self.URL, json={"offset": 0}).content, b"first")
+
+    def test_cache_evicts_least_recently_used_beyond_max_bytes(self):
+        self.response_cache.max_bytes = 8
+        self.http_client.session.request.side_effect = [
+            self._make_response(200, b"aaaa"),
+            self._make_response(200, b"bbbbbb"),
+        ]
+
+        self.http_client.get(self.URL, params={"page": 1})
+        self.http_client.get(self.URL, params={"page": 2})
+
+        self.assertEqual(self.response_cache.stats()["entries"], 1)
+
+if __name__ == "__main__":
+    unittest.main()
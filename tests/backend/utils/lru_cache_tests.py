@@ -0,0 +1,40 @@
+import unittest
+from unittest.mock import patch
+from backend.utils.lru_cache import LRUCache
+
+class TestLRUCache(unittest.TestCase):
+    MODULE_PATH = "backend.utils.lru_cache"
+
+    def test_get_returns_cached_value_and_counts_hits(self):
+        cache = LRUCache(max_entries=2)
+        cache.put("a", [1.0])
+
+        self.assertEqual(cache.get("a"), [1.0])
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.stats(), {"hits": 1, "misses": 1, "hit_rate": 0.5, "entries": 1})
+
+    def test_put_evicts_least_recently_used(self):
+        cache = LRUCache(max_entries=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+
+        self.assertEqual(cache.get("a"), 1)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("c"), 3)
+
+    @patch(f"{MODULE_PATH}.time.monotonic")
+    def test_get_expires_entries_older_than_ttl(self, mock_monotonic):
+        cache = LRUCache(max_entries=2, ttl=10)
+        mock_monotonic.return_value = 100.0
+        cache.put("a", 1)
+
+        mock_monotonic.return_value = 105.0
+        self.assertEqual(cache.get("a"), 1)
+        mock_monotonic.return_value = 110.0
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.stats()["entries"], 0)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,45 @@
+import unittest
+from backend.utils.search_response_cache import SearchResponseCache
+
+class TestSearchResponseCache(unittest.TestCase):
+
+    def test_make_key_ignores_filter_order_and_duplicates(self):
+        key = SearchResponseCache.make_key("genomics", 10, {"school": ["SOM", "SEAS", "SOM"], "has_funding": True})
+
+        self.assertEqual(key, SearchResponseCache.make_key("genomics", 10, {"has_funding": True, "school": ["SEAS", "SOM"]}))
+        self.assertNotEqual(key, SearchResponseCache.make_key("genomics", 5, {"has_funding": True, "school": ["SEAS", "SOM"]}))
+
+    def test_get_returns_response_of_same_generation(self):
+        cache = SearchResponseCache(max_entries=2, ttl=None)
+        self.assertIsNone(cache.get(1, ("a",)))
+
+        cached_response = cache.put(1, ("a",), b'{"results": []}')
+
+        self.assertEqual(cache.get(1, ("a",)), cached_response)
+        self.assertTrue(cached_response.etag.startswith("g1-"))
+
+    def test_new_generation_clears_entries(self):
+        cache = SearchResponseCache(max_entries=2, ttl=None)
+        cache.get(1, ("a",))
+        cache.put(1, ("a",), b"[]")
+
+        self.assertIsNone(cache.get(2, ("a",)))
+        cache.put(1, ("a",), b"[]")
+
+        self.assertIsNone(cache.get(2, ("a",)))
+        self.assertEqual(cache.stats()["entries"], 0)
+
+    def test_compressed_variants_are_cleared_with_their_generation(self):
+        cache = SearchResponseCache(max_entries=2, ttl=None)
+        cache.get(1, ("a",))
+        cached_response = cache.put(1, ("a",), b"[]")
+        cache.put_variant(cached_response.etag, "gzip", b"compressed")
+
+        self.assertEqual(cache.get_variant(cached_response.etag, "gzip"), b"compressed")
+        self.assertIsNone(cache.get_variant(cached_response.etag, "br"))
+
+        cache.get(2, ("a",))
+        self.assertIsNone(cache.get_variant(cached_response.etag, "gzip"))
+
+if __name__ == "__main__":
+    unittest.main()
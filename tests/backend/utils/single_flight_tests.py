@@ -0,0 +1,80 @@
+import threading
+import time
+import unittest
+from backend.utils.single_flight import SingleFlight
+
+class TestSingleFlight(unittest.TestCase):
+
+    def _run_concurrently(self, single_flight: SingleFlight, function, caller_count: int, outcomes: list):
+        threads = [
+            threading.Thread(target=lambda: outcomes.append(self._call(single_flight, function)))
+            for _ in range(caller_count)
+        ]
+        for thread in threads:
+            thread.start()
+        return threads
+
+    @staticmethod
+    def _call(single_flight: SingleFlight, function):
+        try:
+            return single_flight.do("key", function)
+        except ValueError as e:
+            return e
+
+    def test_concurrent_calls_share_one_result(self):
+        single_flight = SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+        call_count = []
+
+        def slow_function():
+            call_count.append(1)
+            started.set()
+            release.wait()
+            return ["result"]
+
+        outcomes = []
+        threads = self._run_concurrently(single_flight, slow_function, 1, outcomes)
+        started.wait()
+        more_threads = self._run_concurrently(single_flight, slow_function, 4, outcomes)
+        while single_flight.stats()["shared_calls"] < 4:
+            time.sleep(0.001)
+        release.set()
+        for thread in threads + more_threads:
+            thread.join()
+
+        self.assertEqual(len(call_count), 1)
+        self.assertEqual(outcomes, [["result"]] * 5)
+        self.assertEqual(single_flight.stats(), {"calls": 1, "shared_calls": 4, "in_flight": 0})
+
+    def test_exception_is_raised_to_every_waiting_caller(self):
+        single_flight = SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+
+        def failing_function():
+            started.set()
+            release.wait()
+            raise ValueError("failed")
+
+        outcomes = []
+        threads = self._run_concurrently(single_flight, failing_function, 1, outcomes)
+        started.wait()
+        more_threads = self._run_concurrently(single_flight, failing_function, 2, outcomes)
+        while single_flight.stats()["shared_calls"] < 2:
+            time.sleep(0.001)
+        release.set()
+        for thread in threads + more_threads:
+            thread.join()
+
+        self.assertEqual(len(outcomes), 3)
+        self.assertTrue(all(isinstance(outcome, ValueError) for outcome in outcomes))
+
+    def test_sequential_calls_are_not_shared(self):
+        single_flight = SingleFlight()
+
+        self.assertEqual(single_flight.do("key", lambda: 1), 1)
+        self.assertEqual(single_flight.do("key", lambda: 2), 2)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,179 @@
+import gzip
+import json
+import unittest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+from flask import Flask
+from backend.core.populate_config import ASYNC_SEARCH_CONFIG
+from backend.services.search.faculty_document import make_faculty_document
+from backend.services.search.search_service import SearchDeadlineExceeded
+from backend.utils import compression
+from backend.utils.search_response_cache import SearchResponseCache
+from backend.views.search_view import create_search_blueprint
+
+class TestSearchView(unittest.TestCase):
+
+    def setUp(self):
+        self.search_service = MagicMock()
+        self.search_service.get_generation.return_value = 1
+        self.search_service.search.return_value = [SimpleNamespace(
+            name="John Doe", school="SEAS", department="Computer Science", about=None,
+            email="johndoe@virginia.edu", profile_url=None, has_funding=False, projects=[]
+        )]
+        self.search_service.search_documents.return_value = [
+            make_faculty_document(faculty) for faculty in self.search_service.search.return_value
+        ]
+        app = Flask(__name__)
+        app.register_blueprint(create_search_blueprint(self.search_service, SearchResponseCache()), url_prefix="/api")
+        self.client = app.test_client()
+
+    def test_repeated_search_is_served_from_cache(self):
+        first_response = self.client.get("/api/search?query=Machine  Learning&limit=5&school=SOM&school=SEAS")
+        second_response = self.client.get("/api/search?query=machine learning&limit=5&school=SEAS&school=SOM")
+
+        self.assertEqual(self.search_service.search_documents.call_count, 1)
+        self.assertEqual(second_response.get_data(), first_response.get_data())
+        self.assertEqual(second_response.headers["ETag"], first_response.headers["ETag"])
+        self.assertIn("max-age", second_response.headers["Cache-Control"])
+        self.assertEqual(second_response.get_json()["results"][0]["name"], "John Doe")
+
+    def test_matching_etag_is_answered_with_not_modified(self):
+        etag = self.client.get("/api/search?query=genomics&limit=5").headers["ETag"]
+
+        response = self.client.get("/api/search?query=genomics&limit=5", headers={"If-None-Match": etag})
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.get_data(), b"")
+
+    def test_new_generation_runs_search_again(self):
+        self.client.get("/api/search?query=genomics&limit=5")
+        self.search_service.get_generation.return_value = 2
+
+        self.client.get("/api/search?query=genomics&limit=5")
+
+        self.assertEqual(self.search_service.search_documents.call_count, 2)
+
+    def test_search_without_cache_assembles_documents(self):
+        app = Flask(__name__)
+        app.register_blueprint(create_search_blueprint(self.search_service), url_prefix="/api")
+
+        response = app.test_client().get("/api/search?query=genomics&limit=5")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.mimetype, "application/json")
+        self.assertEqual(response.get_json()["results"][0]["emails"], ["johndoe@virginia.edu"])
+        self.search_service.search.assert_not_called()
+
+    def test_projected_search_loads_and_returns_only_requested_fields(self):
+        faculty = self.search_service.search.return_value[0]
+        faculty.projects = [SimpleNamespace(project_number=f"P{i}", abstract="Genomics of disease") for i in range(3)]
+
+        response = self.client.get(
+            "/api/search?query=genomics&limit=5&fields=name,projects.abstract&max_projects=2&abstract_chars=8"
+        )
+
+        self.assertEqual(response.get_json(), {"results": [{
+            "name": "John Doe", "projects": [{"abstract": "Genomics"}, {"abstract": "Genomics"}]
+        }]})
+        projection = self.search_service.search.call_args.kwargs["projection"]
+        self.assertEqual(projection.get_columns(), ["name"])
+        self.assertEqual(projection.get_project_columns(), ["abstract"])
+        self.search_service.search_documents.assert_not_called()
+
+        self.client.get("/api/search?query=genomics&limit=5")
+        self.search_service.search_documents.assert_called_once()
+
+    def test_projected_search_rejects_unknown_fields_and_invalid_limits(self):
+        self.assertEqual(self.client.get("/api/search?query=a&limit=5&fields=name,password").status_code, 400)
+        self.assertEqual(self.client.get("/api/search?query=a&limit=5&fields=project_number").status_code, 400)
+        self.assertEqual(self.client.get("/api/search?query=a&limit=5&max_projects=-1").status_code, 400)
+        self.search_service.search.assert_not_called()
+
+    def test_large_response_is_compressed_and_revalidated_with_weak_etag(self):
+        self.search_service.search_documents.return_value *= 20
+
+        response = self.client.get("/api/search?query=genomics&limit=20", headers={"Accept-Encoding": "gzip"})
+        not_modified = self.client.get(
+            "/api/search?query=genomics&limit=20",
+            headers={"Accept-Encoding": "gzip", "If-None-Match": response.headers["ETag"]},
+        )
+
+        self.assertEqual(response.headers["Content-Encoding"], "gzip")
+        self.assertIn("Accept-Encoding", response.headers["Vary"])
+        self.assertTrue(response.headers["ETag"].startswith("W/"))
+        self.assertEqual(len(json.loads(gzip.decompress(response.get_data()))["results"]), 20)
+        self.assertEqual(not_modified.status_code, 304)
+
+    def test_cached_response_is_compressed_once_per_encoding(self):
+        self.search_service.search_documents.return_value *= 20
+        url = "/api/search?query=genomics&limit=20"
+
+        with patch("backend.utils.compression.compress", wraps=compression.compress) as mock_compress:
+            first_response = self.client.get(url, headers={"Accept-Encoding": "gzip"})
+            second_response = self.client.get(url, headers={"Accept-Encoding": "gzip"})
+            identity_response = self.client.get(url, headers={"Accept-Encoding": "identity"})
+
+        self.assertEqual(mock_compress.call_count, 1)
+        self.assertEqual(second_response.get_data(), first_response.get_data())
+        self.assertEqual(second_response.headers["Content-Encoding"], "gzip")
+        self.assertNotIn("Content-Encoding", identity_response.headers)
+
+    def test_batch_search_returns_results_per_query(self):
+        self.search_service.search_batch.return_value = [self.search_service.search.return_value, []]
+
+        response = self.client.post("/api/search/batch", json={
+            "queries": ["genomics", "imaging"], "limit": 3, "school": "SOM", "department": ["A", "B"]
+        })
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([result["query"] for result in response.get_json()["results"]], ["genomics", "imaging"])
+        self.assertEqual(len(response.get_json()["results"][0]["results"]), 1)
+        self.search_service.search_batch.assert_called_once_with(
+            queries=["genomics", "imaging"], k=3, school=["SOM"], department=["A", "B"],
+            activity_code=None, agency_ic_admin=None, has_funding=None
+        )
+
+        self.client.post("/api/search/batch", json={"queries": ["genomics"], "limit": 3, "has_funding": True})
+        self.assertIs(self.search_service.search_batch.call_args.kwargs["has_funding"], True)
+
+    def test_batch_search_rejects_invalid_body(self):
+        self.assertEqual(self.client.post("/api/search/batch", json={"queries": [], "limit": 3}).status_code, 400)
+        self.assertEqual(self.client.post("/api/search/batch", json={"queries": ["a"]}).status_code, 400)
+        self.assertEqual(self.client.post("/api/search/batch", json={"queries": ["a"], "limit": 0}).status_code, 400)
+        self.assertEqual(self.client.post("/api/search/batch", json={"queries": ["a"], "limit": -3}).status_code, 400)
+        self.assertEqual(self.client.post(
+            "/api/search/batch", json={"queries": ["a"], "limit": 3, "has_funding": "false"}
+        ).status_code, 400)
+        self.search_service.search_batch.assert_not_called()
+
+    def test_async_search_is_cached_and_times_out_with_gateway_timeout(self):
+        self.search_service.search_async = AsyncMock(return_value=self.search_service.search.return_value)
+
+        response = self.client.get("/api/search/async?query=genomics&limit=5&deadline=120")
+        cached_response = self.client.get("/api/search/async?query=genomics&limit=5")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(cached_response.get_data(), response.get_data())
+        self.search_service.search_async.assert_awaited_once_with(
+            query="genomics", k=5, deadline=ASYNC_SEARCH_CONFIG["MAX_DEADLINE"], projection=None, school=None,
+            department=None, activity_code=None, agency_ic_admin=None, has_funding=False
+        )
+
+        self.search_service.search_async.side_effect = SearchDeadlineExceeded("too slow")
+        self.assertEqual(self.client.get("/api/search/async?query=imaging&limit=5").status_code, 504)
+
+    def test_async_search_applies_projection_and_caches_it_separately(self):
+        self.search_service.search_async = AsyncMock(return_value=self.search_service.search.return_value)
+
+        full_response = self.client.get("/api/search/async?query=genomics&limit=5")
+        projected_response = self.client.get("/api/search/async?query=genomics&limit=5&fields=name")
+        invalid_response = self.client.get("/api/search/async?query=genomics&limit=5&fields=password")
+
+        self.assertIn("emails", full_response.get_json()["results"][0])
+        self.assertEqual(projected_response.get_json(), {"results": [{"name": "John Doe"}]})
+        self.assertEqual(invalid_response.status_code, 400)
+        self.assertEqual(self.search_service.search_async.await_count, 2)
+        self.assertEqual(self.search_service.search_async.await_args.kwargs["projection"].fields, ("name",))
+
+if __name__ == "__main__":
+    unittest.main()